@@ -0,0 +1,11 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    name: str
+    func: Callable[[], Any]
+    # Runs before every iteration, outside the timed region.
+    setup: Callable[[], None] | None = None
@@ -0,0 +1,20 @@
+import host_inspector
+from host_inspector.utils.cacheutils import invalidate
+from host_inspector.utils.commandutils import clear_command_results
+
+from .cases import BenchCase
+
+
+def _cold() -> None:
+    """Drop probe and command caches so every iteration hits the live probes."""
+    invalidate()
+    clear_command_results()
+
+
+def real_cases() -> list[BenchCase]:
+    """Every public `get_*_info` against the live host, with caches cleared."""
+    return [
+        BenchCase(name, getattr(host_inspector, name), setup=_cold)
+        for name in sorted(host_inspector.__all__)
+        if name.startswith("get_")
+    ]
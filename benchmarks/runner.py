@@ -0,0 +1,214 @@
+"""Latency, allocation and subprocess benchmarks for the public collectors.
+
+Run from the repository root with the package installed (as ``just bench``
+does), or with ``PYTHONPATH=src`` on a plain checkout:
+
+uv run python -m benchmarks.runner --mode stub
+uv run python -m benchmarks.runner --mode real --check
+uv run python -m benchmarks.runner --mode stub --update
+
+The stub baseline only depends on the code, so it is the one to gate CI on.
+Real-mode allocations and forks depend on the host that recorded them (its
+mounts, sensors, installed tools), so re-record them on the machine that
+checks them.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from host_inspector.utils.commandutils import command_stats
+
+from .cases import BenchCase
+from .real import real_cases
+from .stubs import stub_cases
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+DEFAULT_ITERATIONS = {"stub": 2000, "real": 5}
+# Allocations and forks are deterministic, so --check gates on them with a
+# tight band. Latency depends on the machine and its load: it is only
+# reported, against a wide band, unless --check-timing asks to gate on it.
+DEFAULT_TOLERANCE = 0.10
+DEFAULT_TIMING_TOLERANCE = 1.0
+# Ignore deltas smaller than these; stub cases run in a few µs and KiB.
+MIN_DELTA_US = 2.0
+MIN_DELTA_KIB = 0.02
+
+
+def _percentile(samples: list[float], percent: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, round(percent / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def measure(case: BenchCase, iterations: int, warmup: int = 1) -> dict:
+    for _ in range(warmup):
+        if case.setup:
+            case.setup()
+        case.func()
+
+    forks_before = command_stats().forks
+    samples: list[float] = []
+    for _ in range(iterations):
+        if case.setup:
+            case.setup()
+        started = time.perf_counter_ns()
+        case.func()
+        samples.append((time.perf_counter_ns() - started) / 1000)
+    forks = command_stats().forks - forks_before
+
+    # Allocations are traced in a separate pass so tracing doesn't skew timing.
+    peaks: list[int] = []
+    tracemalloc.start()
+    try:
+        for _ in range(min(iterations, 50)):
+            if case.setup:
+                case.setup()
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            case.func()
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "iterations": iterations,
+        "p50_us": round(_percentile(samples, 50), 2),
+        "p90_us": round(_percentile(samples, 90), 2),
+        "p99_us": round(_percentile(samples, 99), 2),
+        "mean_us": round(statistics.fmean(samples), 2),
+        "alloc_peak_kib": round(statistics.fmean(peaks) / 1024, 2),
+        "subprocesses": round(forks / iterations, 2),
+    }
+
+
+def _exceeds(result: dict, base: dict, metric: str, tolerance: float) -> str | None:
+    limit = base[metric] * (1 + tolerance)
+    floor = MIN_DELTA_US if metric.endswith("_us") else MIN_DELTA_KIB
+    if result[metric] > limit and result[metric] - base[metric] > floor:
+        return f"{metric} {result[metric]} > {base[metric]} (+{tolerance:.0%})"
+    return None
+
+
+def compare(
+    results: dict,
+    baseline: dict,
+    tolerance: float,
+    timing_tolerance: float | None = None,
+) -> list[str]:
+    """Return a line per metric that regressed beyond its tolerance.
+
+    Allocations and subprocesses are always compared; latency only when a
+    ``timing_tolerance`` is given.
+    """
+    regressions = []
+    for name, result in results.items():
+        if (base := baseline.get(name)) is None:
+            continue
+        checks = [("alloc_peak_kib", tolerance)]
+        if timing_tolerance is not None:
+            checks += [("p50_us", timing_tolerance), ("p90_us", timing_tolerance)]
+        for metric, limit in checks:
+            if line := _exceeds(result, base, metric, limit):
+                regressions.append(f"{name}: {line}")
+        if result["subprocesses"] > base["subprocesses"]:
+            regressions.append(
+                f"{name}: subprocesses {result['subprocesses']} > {base['subprocesses']}"
+            )
+    return regressions
+
+
+def _format_table(results: dict, baseline: dict) -> str:
+    header = f"{'case':<30}{'p50 µs':>12}{'p90 µs':>12}{'p99 µs':>12}{'alloc KiB':>11}{'forks':>7}{'Δp50':>9}"
+    lines = [header, "-" * len(header)]
+    for name, result in results.items():
+        delta = ""
+        if (base := baseline.get(name)) and base["p50_us"]:
+            delta = f"{(result['p50_us'] / base['p50_us'] - 1):+.0%}"
+        lines.append(
+            f"{name:<30}{result['p50_us']:>12}{result['p90_us']:>12}"
+            f"{result['p99_us']:>12}{result['alloc_peak_kib']:>11}"
+            f"{result['subprocesses']:>7}{delta:>9}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mode", choices=["stub", "real"], default="stub")
+    parser.add_argument("--iterations", type=int)
+    parser.add_argument("--case", action="append", help="only run matching cases")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="allowed allocation growth",
+    )
+    parser.add_argument(
+        "--timing-tolerance",
+        type=float,
+        default=DEFAULT_TIMING_TOLERANCE,
+        help="allowed latency growth",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="exit 1 on allocation or subprocess regressions vs the baseline",
+    )
+    parser.add_argument(
+        "--check-timing",
+        action="store_true",
+        help="with --check, also exit 1 on latency regressions",
+    )
+    parser.add_argument(
+        "--update", action="store_true", help="write results into the baseline"
+    )
+    args = parser.parse_args(argv)
+
+    if args.mode == "real" and sys.platform != "linux":
+        parser.error("real mode is only supported on Linux")
+
+    cases = stub_cases() if args.mode == "stub" else real_cases()
+    if args.case:
+        cases = [case for case in cases if any(c in case.name for c in args.case)]
+    iterations = args.iterations or DEFAULT_ITERATIONS[args.mode]
+
+    results = {case.name: measure(case, iterations) for case in cases}
+
+    stored = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    baseline = stored.get(args.mode, {})
+    sys.stdout.write(_format_table(results, baseline) + "\n")
+
+    if args.update:
+        stored[args.mode] = {**baseline, **results}
+        stored.setdefault("meta", {})[args.mode] = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+        }
+        args.baseline.write_text(json.dumps(stored, indent=2, sort_keys=True) + "\n")
+        sys.stdout.write(f"Baseline written to {args.baseline}\n")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    slower = [
+        line
+        for line in compare(results, baseline, args.tolerance, args.timing_tolerance)
+        if line not in regressions
+    ]
+    for line in regressions:
+        sys.stdout.write(f"REGRESSION {line}\n")
+    for line in slower:
+        sys.stdout.write(f"{'REGRESSION' if args.check_timing else 'SLOWER'} {line}\n")
+    failed = bool(regressions or (slower and args.check_timing))
+    return 1 if failed and args.check else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,352 @@
+import itertools
+from datetime import datetime
+
+from host_inspector.cpu.application.dtos import TemperatureInfoDTO
+from host_inspector.cpu.application.service import CPUService
+from host_inspector.date_time.application.service import DateTimeService
+from host_inspector.device.application.dtos import DeviceInputDTO
+from host_inspector.device.application.service import DeviceService
+from host_inspector.disk.application.dtos import DiskSnapshotDTO
+from host_inspector.disk.application.service import DiskService
+from host_inspector.display.application.dtos import DisplayCollectionDTO
+from host_inspector.display.application.dtos import DisplayInfoDTO
+from host_inspector.display.application.service import DisplayService
+from host_inspector.firewall.application.dtos import FirewallRuleDTO
+from host_inspector.firewall.application.dtos import FirewallRulesDTO
+from host_inspector.firewall.application.dtos import FirewallStatusDTO
+from host_inspector.firewall.application.service import FirewallService
+from host_inspector.firewall.domain import parse_linux_firewall_output
+from host_inspector.firewall.domain import parse_windows_rule_block
+from host_inspector.frequency.application.dtos import PolicyLimitsDTO
+from host_inspector.frequency.application.dtos import PolicyStateDTO
+from host_inspector.frequency.application.service import FrequencyService
+from host_inspector.gpu.application.dtos import GPUInfoDTO
+from host_inspector.gpu.application.dtos import GPUPayloadDTO
+from host_inspector.gpu.application.service import GPUService
+from host_inspector.health.application.dtos import HealthInputDTO
+from host_inspector.health.application.service import HealthService
+from host_inspector.memory.application.dtos import MemorySnapshotDTO
+from host_inspector.memory.application.service import MemoryService
+from host_inspector.network.application.dtos import NetworkSnapshotDTO
+from host_inspector.network.application.service import NetworkService
+from host_inspector.os.application.dtos import OSDataDTO
+from host_inspector.os.application.service import OSService
+from host_inspector.platform.application.dtos import PlatformInfoDTO
+from host_inspector.platform.application.service import PlatformService
+from host_inspector.pressure.application.dtos import PressureLineDTO
+from host_inspector.pressure.application.dtos import PressureSnapshotDTO
+from host_inspector.pressure.application.dtos import ResourcePressureDTO
+from host_inspector.pressure.application.service import PressureService
+from host_inspector.uptime.application.service import UptimeService
+from host_inspector.utils.sysfsutils import parse_cpuinfo
+from host_inspector.utils.sysfsutils import parse_os_release
+
+from .cases import BenchCase
+
+GIB = 1024 * 1024 * 1024
+
+UFW_OUTPUT = """Status: active
+
+To                         Action      From
+--                         ------      ----
+22/tcp                     ALLOW IN    Anywhere
+80,443/tcp                 ALLOW IN    Anywhere
+8000:8010/tcp              ALLOW IN    192.168.1.0/24
+22/tcp (v6)                ALLOW IN    Anywhere (v6)
+"""
+
+NETSH_RULE = """Rule Name:                            Test Rule
+----------------------------------------------------------------------
+Enabled:                              Yes
+Direction:                            In
+Profiles:                             Domain
+Grouping:
+LocalIP:                              Any
+RemoteIP:                             Any
+Protocol:                             TCP
+LocalPort:                            443
+RemotePort:                           Any
+Edge traversal:                       No
+Action:                               Allow
+"""
+
+OS_RELEASE = """PRETTY_NAME="Debian GNU/Linux 12 (bookworm)"
+NAME="Debian GNU/Linux"
+VERSION_ID="12"
+VERSION="12 (bookworm)"
+VERSION_CODENAME=bookworm
+ID=debian
+"""
+
+CPUINFO = "\n\n".join(
+    f"processor\t: {n}\nBogoMIPS\t: 108.00\nCPU implementer\t: 0x41\nCPU part\t: 0xd08"
+    for n in range(4)
+) + (
+    "\n\nHardware\t: BCM2835\nRevision\t: c03114\nSerial\t\t: 100000002d3a5b1c\n"
+    "Model\t\t: Raspberry Pi 4 Model B Rev 1.4\n"
+)
+
+
+class StubCPUMetrics:
+    def physical_count(self) -> int:
+        return 8
+
+    def logical_count(self) -> int:
+        return 16
+
+    def max_frequency_mhz(self) -> float:
+        return 3200.0
+
+    def usage_percent(self) -> float:
+        return 12.5
+
+
+class StubCPUPlatform:
+    def processor_name(self) -> str:
+        return "Apple M4 Pro"
+
+    def temperature_info(self) -> TemperatureInfoDTO:
+        return TemperatureInfoDTO(data={"celsius": 51.0, "fahrenheit": 123.8})
+
+
+class StubMemoryProbe:
+    def snapshot(self) -> MemorySnapshotDTO:
+        return MemorySnapshotDTO(
+            total=16 * GIB, used=14 * GIB, available=2 * GIB, percent=87.5
+        )
+
+
+class StubDiskProbe:
+    def snapshot(self, path: str = "/") -> DiskSnapshotDTO:
+        del path
+        return DiskSnapshotDTO(total=16 * GIB, used=8 * GIB, free=8 * GIB, percent=50.0)
+
+
+class StubUptimeProbe:
+    def boot_time(self) -> datetime:
+        return datetime.fromisoformat("2026-03-13T08:15:00+00:00")
+
+    def now_timestamp(self) -> float:
+        return 2000.0
+
+    def boot_timestamp(self) -> float:
+        return 1000.0
+
+
+class StubDateTimeProbe:
+    def now(self) -> datetime:
+        return datetime.fromisoformat("2026-03-13T08:15:00+00:00")
+
+    def is_dst(self) -> bool:
+        return False
+
+
+class StubNetworkProbe:
+    def snapshot(self) -> NetworkSnapshotDTO:
+        return NetworkSnapshotDTO(
+            hostname="test-host",
+            ip_address="192.168.1.12",
+            node_value=0x001122334455,
+            interface="en0",
+            mac_address="AA-BB-CC-DD-EE-FF",
+            ipv6_address="fe80::1%en0",
+        )
+
+
+class StubOSCollector:
+    def collect(self) -> OSDataDTO:
+        return OSDataDTO(
+            platform="linux",
+            name="Debian GNU/Linux",
+            version="12",
+            edition="bookworm",
+            build="--",
+        )
+
+
+class StubGPUCollector:
+    def gpu_info(self) -> GPUPayloadDTO:
+        return GPUPayloadDTO(
+            adapters=[
+                GPUInfoDTO(
+                    model="Broadcom VideoCore VI",
+                    vram="76 MB",
+                    resolution="1920 x 1080",
+                    refresh_rate="60 Hz",
+                )
+            ],
+            as_list=False,
+        )
+
+
+class StubFirewallCollector:
+    def enabled_status(self) -> FirewallStatusDTO:
+        return FirewallStatusDTO(overall=True)
+
+    def rules(
+        self, ports=None, direction=None, enabled_only=False, exclude_any_ports=False
+    ) -> FirewallRulesDTO:
+        del direction
+        return FirewallRulesDTO(
+            items=[
+                FirewallRuleDTO(data=rule)
+                for rule in parse_linux_firewall_output(
+                    UFW_OUTPUT,
+                    ports_filter=ports,
+                    enabled_only=enabled_only,
+                    exclude_any_ports=exclude_any_ports,
+                )
+            ]
+        )
+
+
+class StubDisplayCollector:
+    def display_info(self) -> DisplayCollectionDTO:
+        return DisplayCollectionDTO(
+            items=[
+                DisplayInfoDTO(
+                    name="DELL U2720Q",
+                    display_id=1,
+                    resolution_actual="3840 x 2160",
+                    resolution="1920 x 1080",
+                    refresh_rate="60 Hz",
+                )
+            ]
+        )
+
+
+class StubPlatformCollector:
+    def platform_info(self) -> PlatformInfoDTO:
+        return PlatformInfoDTO(
+            system="Linux",
+            release="6.6.31",
+            machine="aarch64",
+            architecture="64bit",
+            manufacturer="Raspberry Pi Foundation",
+            model="Raspberry Pi 4 Model B Rev 1.4",
+            serial="100000002d3a5b1c",
+        )
+
+
+class StubFrequencyProbe:
+    def policies(self) -> list[str]:
+        return ["policy0", "policy4"]
+
+    def limits(self, policy: str) -> PolicyLimitsDTO:
+        first = int(policy.removeprefix("policy"))
+        return PolicyLimitsDTO(
+            cpus=tuple(range(first, first + 4)),
+            min_mhz=600.0,
+            max_mhz=3200.0,
+            driver="cppc_cpufreq",
+        )
+
+    def state(self, policy: str) -> PolicyStateDTO:
+        del policy
+        return PolicyStateDTO(
+            current_mhz=1800.0,
+            scaling_min_mhz=600.0,
+            scaling_max_mhz=3200.0,
+            governor="schedutil",
+        )
+
+    def core_mhz(self) -> dict[int, float]:
+        return {}
+
+
+class StubCoreLoad:
+    def latest_busy_percent(self) -> list[float] | None:
+        return [95.0, 10.0, 5.0, 0.0, 90.0, 12.0, 3.0, 1.0]
+
+    def busy_percent(self) -> list[float]:
+        return self.latest_busy_percent()
+
+    async def abusy_percent(self) -> list[float]:
+        return self.latest_busy_percent()
+
+
+class StubPressureProbe:
+    def __init__(self):
+        # Advancing clock and counters, so every call after the first
+        # computes stall rates.
+        self._ticks = itertools.count()
+
+    def snapshot(self) -> PressureSnapshotDTO:
+        tick = next(self._ticks)
+        line = PressureLineDTO(avg10=1.5, avg60=0.75, avg300=0.25, total=tick * 10_000)
+        return PressureSnapshotDTO(
+            load_average=(1.2, 0.9, 0.7),
+            logical_cpus=8,
+            timestamp=float(tick),
+            resources={
+                name: ResourcePressureDTO(some=line, full=line)
+                for name in ("cpu", "memory", "io")
+            },
+        )
+
+
+class StubDeviceProbe:
+    def snapshot(self) -> DeviceInputDTO:
+        return DeviceInputDTO(
+            os={"name": "Debian GNU/Linux"},
+            platform={"model": "Raspberry Pi 4"},
+            network={"hostname": "test-host"},
+            gpu={"model": "Broadcom VideoCore VI"},
+            display=[],
+        )
+
+
+class StubHealthProbe:
+    def snapshot(self) -> HealthInputDTO:
+        return HealthInputDTO(
+            cpu={"percent": 12.5},
+            mem={"percent": 87.5},
+            disk={"percent": 50.0},
+            uptime={"uptime": 1000},
+            local_datetime={"date": "2026-03-13"},
+        )
+
+
+def stub_cases() -> list[BenchCase]:
+    """Service and parser paths driven by in-memory stub ports (no I/O)."""
+    cpu = CPUService(metrics=StubCPUMetrics(), platform=StubCPUPlatform())
+    memory = MemoryService(probe=StubMemoryProbe())
+    disk = DiskService(probe=StubDiskProbe())
+    uptime = UptimeService(probe=StubUptimeProbe())
+    date_time = DateTimeService(probe=StubDateTimeProbe())
+    network = NetworkService(probe=StubNetworkProbe())
+    os_service = OSService(collector=StubOSCollector())
+    gpu = GPUService(collector=StubGPUCollector())
+    firewall = FirewallService(collector=StubFirewallCollector())
+    device = DeviceService(probe=StubDeviceProbe())
+    health = HealthService(probe=StubHealthProbe())
+    display = DisplayService(collector=StubDisplayCollector())
+    platform = PlatformService(collector=StubPlatformCollector())
+    frequency = FrequencyService(probe=StubFrequencyProbe(), load=StubCoreLoad())
+    pressure = PressureService(probe=StubPressureProbe())
+    return [
+        BenchCase("get_cpu_info", cpu.get_cpu_info),
+        BenchCase("get_mem_info", memory.get_mem_info),
+        BenchCase("get_disk_info", disk.get_disk_info),
+        BenchCase("get_uptime_info", uptime.get_uptime_info),
+        BenchCase("get_datetime_info", date_time.get_datetime_info),
+        BenchCase("get_network_info", network.get_network_info),
+        BenchCase("get_os_info", os_service.get_os_info),
+        BenchCase("get_gpu_info", gpu.get_gpu_info),
+        BenchCase("get_firewall_info", firewall.get_firewall_info),
+        BenchCase("get_device_info", device.get_device_info),
+        BenchCase("get_health_info", health.get_health_info),
+        BenchCase("get_display_info", display.get_display_info),
+        BenchCase("get_platform_info", platform.get_platform_info),
+        BenchCase("get_frequency_info", frequency.get_frequency_info),
+        BenchCase("get_pressure_info", pressure.get_pressure_info),
+        BenchCase(
+            "parse_linux_firewall_output",
+            lambda: parse_linux_firewall_output(UFW_OUTPUT),
+        ),
+        BenchCase(
+            "parse_windows_rule_block", lambda: parse_windows_rule_block(NETSH_RULE)
+        ),
+        BenchCase("parse_os_release", lambda: parse_os_release(OS_RELEASE)),
+        BenchCase("parse_cpuinfo", lambda: parse_cpuinfo(CPUINFO)),
+    ]
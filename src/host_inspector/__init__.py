@@ -1,35 +1,156 @@
+import importlib
 import logging
+from typing import TYPE_CHECKING
 
-from .cpu import get_cpu_info
-from .date_time import get_datetime_info
-from .device import get_device_info
-from .disk import get_disk_info
-from .display import get_display_info
-from .firewall import get_firewall_info
-from .gpu import get_gpu_info
-from .health import get_health_info
-from .memory import get_mem_info
-from .network import get_network_info
-from .os import get_os_info
-from .platform import get_platform_info
-from .uptime import get_uptime_info
+if TYPE_CHECKING:
+    from .cpu import aget_cpu_info
+    from .cpu import get_cpu_info
+    from .date_time import aget_datetime_info
+    from .date_time import get_datetime_info
+    from .device import aget_device_info
+    from .device import get_device_info
+    from .disk import aget_disk_info
+    from .disk import get_disk_info
+    from .display import aget_display_info
+    from .display import get_display_info
+    from .firewall import aget_firewall_info
+    from .firewall import get_firewall_info
+    from .frequency import aget_frequency_info
+    from .frequency import get_frequency_info
+    from .gpu import aget_gpu_info
+    from .gpu import get_gpu_info
+    from .health import aget_health_info
+    from .health import get_health_info
+    from .memory import aget_mem_info
+    from .memory import get_mem_info
+    from .network import aget_network_info
+    from .network import get_network_info
+    from .os import aget_os_info
+    from .os import get_os_info
+    from .platform import aget_platform_info
+    from .platform import get_platform_info
+    from .pressure import aget_pressure_info
+    from .pressure import get_pressure_info
+    from .projection import collect
+    from .uptime import aget_uptime_info
+    from .uptime import get_uptime_info
 
 # Basic logger setup; users of this package can configure logging as needed
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.ERROR)
 
+# Public name -> subsystem module. Subsystems (and psutil/humanize with them)
+# are only imported the first time one of their functions is looked up.
+_LAZY_EXPORTS = {
+    "aget_cpu_info": ".cpu",
+    "aget_datetime_info": ".date_time",
+    "aget_device_info": ".device",
+    "aget_disk_info": ".disk",
+    "aget_display_info": ".display",
+    "aget_firewall_info": ".firewall",
+    "aget_frequency_info": ".frequency",
+    "aget_gpu_info": ".gpu",
+    "aget_health_info": ".health",
+    "aget_mem_info": ".memory",
+    "aget_network_info": ".network",
+    "aget_os_info": ".os",
+    "aget_platform_info": ".platform",
+    "aget_pressure_info": ".pressure",
+    "aget_uptime_info": ".uptime",
+    "collect": ".projection",
+    "get_cpu_info": ".cpu",
+    "get_datetime_info": ".date_time",
+    "get_device_info": ".device",
+    "get_disk_info": ".disk",
+    "get_display_info": ".display",
+    "get_firewall_info": ".firewall",
+    "get_frequency_info": ".frequency",
+    "get_gpu_info": ".gpu",
+    "get_health_info": ".health",
+    "get_mem_info": ".memory",
+    "get_network_info": ".network",
+    "get_os_info": ".os",
+    "get_platform_info": ".platform",
+    "get_pressure_info": ".pressure",
+    "get_uptime_info": ".uptime",
+}
+
+# Subpackages and modules that ``host_inspector.<name>`` resolves on first
+# access, as the eager import used to make them available.
+_LAZY_SUBMODULES = frozenset(
+    {
+        "cpu",
+        "date_time",
+        "device",
+        "disk",
+        "display",
+        "firewall",
+        "frequency",
+        "gpu",
+        "health",
+        "machine",
+        "memory",
+        "network",
+        "os",
+        "platform",
+        "pressure",
+        "processes",
+        "projection",
+        "python",
+        "sampling",
+        "uptime",
+        "utils",
+    }
+)
+
 __all__ = [
+    "aget_cpu_info",
+    "aget_datetime_info",
+    "aget_device_info",
+    "aget_disk_info",
+    "aget_display_info",
+    "aget_firewall_info",
+    "aget_frequency_info",
+    "aget_gpu_info",
+    "aget_health_info",
+    "aget_mem_info",
+    "aget_network_info",
+    "aget_os_info",
+    "aget_platform_info",
+    "aget_pressure_info",
+    "aget_uptime_info",
+    "collect",
     "get_cpu_info",
     "get_datetime_info",
     "get_device_info",
     "get_disk_info",
     "get_display_info",
     "get_firewall_info",
+    "get_frequency_info",
     "get_gpu_info",
     "get_health_info",
     "get_mem_info",
     "get_network_info",
     "get_os_info",
     "get_platform_info",
+    "get_pressure_info",
     "get_uptime_info",
 ]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__) | _LAZY_SUBMODULES)
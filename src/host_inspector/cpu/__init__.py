@@ -1,8 +1,18 @@
+from collections.abc import Iterable
 from functools import cache
 
+from .application.dtos import CPUTopologyDTO
 from .infrastructure import build_cpu_service
+from .infrastructure import get_cpu_sampler
+from .infrastructure import read_topology
 
-__all__ = ["get_cpu_info"]
+__all__ = [
+    "aget_cpu_info",
+    "get_cpu_info",
+    "get_cpu_topology",
+    "start_cpu_sampler",
+    "stop_cpu_sampler",
+]
 
 
 @cache
@@ -10,6 +20,33 @@ def _get_cpu_service():
     return build_cpu_service()
 
 
-def get_cpu_info() -> dict:
-    """Return CPU info as a dict."""
-    return _get_cpu_service().get_cpu_info()
+def get_cpu_info(fields: Iterable[str] | None = None) -> dict:
+    """Return CPU info as a dict, optionally limited to ``fields``.
+
+    Pass ``fields=["per_core"]`` (alongside any others) for per-CPU
+    user/system/iowait/irq/steal/busy percentages.
+    """
+    return _get_cpu_service().get_cpu_info(fields)
+
+
+async def aget_cpu_info(fields: Iterable[str] | None = None) -> dict:
+    """Return CPU info as a dict without blocking the event loop."""
+    return await _get_cpu_service().aget_cpu_info(fields)
+
+
+def get_cpu_topology() -> CPUTopologyDTO:
+    """Return the immutable CPU/NUMA topology, read from sysfs once per process.
+
+    Use its helpers to pick CPUs, e.g. ``get_cpu_topology().one_per_core(node=0)``.
+    """
+    return read_topology()
+
+
+def start_cpu_sampler(interval: float | None = None) -> None:
+    """Keep CPU usage sampled in the background so `get_cpu_info` never blocks."""
+    get_cpu_sampler().start(interval=interval)
+
+
+def stop_cpu_sampler() -> None:
+    """Stop background CPU sampling and return to blocking samples."""
+    get_cpu_sampler().stop()
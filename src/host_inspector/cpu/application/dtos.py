@@ -1,6 +1,170 @@
+from array import array
 from dataclasses import dataclass
+from dataclasses import field
 
 
 @dataclass(frozen=True)
 class TemperatureInfoDTO:
     data: dict
+
+
+@dataclass(frozen=True)
+class CPUTimesPercentDTO:
+    """Aggregate CPU time split by category, all from one sample.
+
+    Categories a platform does not report read as 0. ``guest`` is already
+    included in ``user`` by the kernel and is reported for information.
+    """
+
+    busy: float
+    user: float = 0.0
+    system: float = 0.0
+    iowait: float = 0.0
+    irq: float = 0.0
+    softirq: float = 0.0
+    steal: float = 0.0
+    guest: float = 0.0
+    sampled_at: float = 0.0  # monotonic time the sample ended
+
+    def breakdown(self) -> dict[str, float]:
+        return {
+            "user": self.user,
+            "system": self.system,
+            "iowait": self.iowait,
+            "irq": self.irq,
+            "softirq": self.softirq,
+            "steal": self.steal,
+            "guest": self.guest,
+        }
+
+
+@dataclass(frozen=True)
+class PerCoreUsageDTO:
+    """Per-logical-CPU percentages, one array per time category.
+
+    Index ``i`` of every array describes CPU ``i``; columns keep a 64-core
+    breakdown in a handful of flat buffers instead of 64 dicts. ``total`` is
+    the aggregate breakdown over the same sample, when it was taken.
+    """
+
+    CATEGORIES = ("user", "system", "iowait", "irq", "steal", "busy")
+
+    user: array = field(default_factory=lambda: array("d"))
+    system: array = field(default_factory=lambda: array("d"))
+    iowait: array = field(default_factory=lambda: array("d"))
+    irq: array = field(default_factory=lambda: array("d"))
+    steal: array = field(default_factory=lambda: array("d"))
+    busy: array = field(default_factory=lambda: array("d"))
+    total: CPUTimesPercentDTO | None = None
+
+    def __len__(self) -> int:
+        return len(self.busy)
+
+    def to_dict(self) -> dict[str, list[float]]:
+        return {name: getattr(self, name).tolist() for name in self.CATEGORIES}
+
+
+@dataclass(frozen=True)
+class LogicalCPUDTO:
+    cpu: int
+    core: int
+    package: int
+    node: int | None = None
+    siblings: tuple[int, ...] = ()
+
+    @property
+    def core_key(self) -> tuple:
+        """Identify the physical core this CPU runs on.
+
+        ``core_id`` is only unique per cluster on some arm64 parts, so the set
+        of CPUs sharing the core (``core_cpus_list``) is used when known.
+        """
+        return (self.package, self.siblings or self.core)
+
+
+@dataclass(frozen=True)
+class CPUCacheDTO:
+    level: int
+    type: str
+    size_kb: int | None
+    cpus: tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class NumaNodeDTO:
+    node: int
+    cpus: tuple[int, ...]
+    memory_kb: int | None = None
+
+
+@dataclass(frozen=True)
+class CPUTopologyDTO:
+    """Immutable CPU/NUMA layout with helpers for picking CPUs to pin to."""
+
+    cpus: tuple[LogicalCPUDTO, ...]
+    caches: tuple[CPUCacheDTO, ...] = ()
+    nodes: tuple[NumaNodeDTO, ...] = ()
+
+    @property
+    def sockets(self) -> int:
+        return len({cpu.package for cpu in self.cpus})
+
+    @property
+    def cores(self) -> int:
+        return len({cpu.core_key for cpu in self.cpus})
+
+    @property
+    def cores_per_socket(self) -> int:
+        return self.cores // self.sockets if self.cpus else 0
+
+    @property
+    def threads_per_core(self) -> int:
+        return len(self.cpus) // self.cores if self.cpus else 0
+
+    def cpus_on_node(self, node: int) -> tuple[int, ...]:
+        return tuple(cpu.cpu for cpu in self.cpus if cpu.node == node)
+
+    def one_per_core(self, node: int | None = None) -> tuple[int, ...]:
+        """Return the lowest-numbered CPU of every physical core (on ``node``)."""
+        seen: set[tuple] = set()
+        picked = []
+        for cpu in self.cpus:
+            if node is not None and cpu.node != node:
+                continue
+            if (key := cpu.core_key) not in seen:
+                seen.add(key)
+                picked.append(cpu.cpu)
+        return tuple(picked)
+
+    def siblings(self, cpu: int) -> tuple[int, ...]:
+        """Return the SMT siblings of ``cpu``, including itself."""
+        return next((c.siblings for c in self.cpus if c.cpu == cpu), ())
+
+    def sharing_cache(self, cpu: int, level: int) -> tuple[int, ...]:
+        """Return the CPUs sharing ``cpu``'s unified/data cache at ``level``."""
+        for cache in self.caches:
+            if (
+                cache.level == level
+                and cache.type != "Instruction"
+                and cpu in cache.cpus
+            ):
+                return cache.cpus
+        return ()
+
+    def to_dict(self) -> dict:
+        return {
+            "sockets": self.sockets,
+            "cores": self.cores,
+            "cores_per_socket": self.cores_per_socket,
+            "threads_per_core": self.threads_per_core,
+            "nodes": {node.node: list(node.cpus) for node in self.nodes},
+            "caches": [
+                {
+                    "level": cache.level,
+                    "type": cache.type,
+                    "size_kb": cache.size_kb,
+                    "cpus": list(cache.cpus),
+                }
+                for cache in self.caches
+            ],
+        }
@@ -1,5 +1,7 @@
 from typing import Protocol
 
+from .dtos import CPUTimesPercentDTO
+from .dtos import PerCoreUsageDTO
 from .dtos import TemperatureInfoDTO
 
 
@@ -16,6 +18,12 @@ class CPUMetricsPort(Protocol):
     def usage_percent(self) -> float:
         """Return current CPU usage percent."""
 
+    def times_percent(self) -> CPUTimesPercentDTO:
+        """Return usage and its steal/iowait/irq/... breakdown from one sample."""
+
+    def per_core_usage(self) -> PerCoreUsageDTO:
+        """Return per-CPU user/system/iowait/irq/steal/busy percentages."""
+
 
 class CPUPlatformPort(Protocol):
     def processor_name(self) -> str:
@@ -23,3 +31,22 @@ class CPUPlatformPort(Protocol):
 
     def temperature_info(self) -> TemperatureInfoDTO:
         """Return temperature information."""
+
+
+class AsyncCPUMetricsPort(Protocol):
+    async def ausage_percent(self) -> float:
+        """Return current CPU usage percent without blocking the event loop."""
+
+    async def atimes_percent(self) -> CPUTimesPercentDTO:
+        """Return the CPU time breakdown without blocking the event loop."""
+
+    async def aper_core_usage(self) -> PerCoreUsageDTO:
+        """Return per-CPU usage percentages without blocking the event loop."""
+
+
+class AsyncCPUPlatformPort(Protocol):
+    async def aprocessor_name(self) -> str:
+        """Return normalized processor model name without blocking."""
+
+    async def atemperature_info(self) -> TemperatureInfoDTO:
+        """Return temperature information without blocking."""
@@ -1,13 +1,94 @@
+import threading
+from collections.abc import Iterable
 from dataclasses import dataclass
+from dataclasses import field
 
+from host_inspector.utils.projectutils import select_fields
+
+from .dtos import CPUTimesPercentDTO
+from .dtos import PerCoreUsageDTO
 from .ports import CPUMetricsPort
 from .ports import CPUPlatformPort
 
+CPU_FIELDS = (
+    "count",
+    "logical",
+    "percent",
+    "percent_str",
+    "processor",
+    "frequency",
+    "frequency_str",
+    "temperature",
+)
+# Opt-in: only returned when asked for by name.
+OPTIONAL_FIELDS = ("per_core", "times", "noisy_neighbour")
+USAGE_FIELDS = ("percent", "percent_str")
+FREQUENCY_FIELDS = ("frequency", "frequency_str")
+TIMES_FIELDS = ("times", "noisy_neighbour")
+
+# Steal at or above this percent for this many consecutive samples means a
+# neighbour on the hypervisor is taking our CPU time.
+STEAL_THRESHOLD_PERCENT = 10.0
+STEAL_CONSECUTIVE_SAMPLES = 3
+
+
+def _wants(fields: tuple[str, ...], *names: str) -> bool:
+    return any(name in fields for name in names)
+
+
+# field -> how to read it from the service and the values sampled for this
+# call. Built once, so a call only evaluates the fields it was asked for.
+_FIELD_VALUES = {
+    "count": lambda service, _: service.cpu_physical_count(),
+    "logical": lambda service, _: service.cpu_logical_count(),
+    "percent": lambda _, sampled: sampled["usage"],
+    "percent_str": lambda _, sampled: f"{sampled['usage']}%",
+    "processor": lambda _, sampled: sampled["processor"],
+    "frequency": lambda _, sampled: sampled["ghz"],
+    "frequency_str": lambda _, sampled: f"{sampled['ghz']} GHz",
+    "temperature": lambda _, sampled: sampled["temperature"],
+    "per_core": lambda _, sampled: sampled["per_core"],
+    "times": lambda _, sampled: sampled["times"].breakdown(),
+    "noisy_neighbour": lambda service, sampled: service.steal.observe(sampled["times"]),
+}
+
+
+def _add_per_core(sampled: dict, usage: PerCoreUsageDTO) -> None:
+    sampled["per_core"] = usage.to_dict()
+    if usage.total is not None:
+        # The aggregate of the same delta; no second sample is needed.
+        sampled["times"] = usage.total
+
+
+class StealTracker:
+    """Count consecutive samples with high steal; each sample is counted once."""
+
+    def __init__(
+        self,
+        threshold: float = STEAL_THRESHOLD_PERCENT,
+        consecutive: int = STEAL_CONSECUTIVE_SAMPLES,
+    ):
+        self.threshold = threshold
+        self.consecutive = consecutive
+        self._lock = threading.Lock()
+        self._streak = 0
+        self._last_sample: float | None = None
+
+    def observe(self, times: CPUTimesPercentDTO) -> bool:
+        with self._lock:
+            # A running background sampler hands out the same sample until
+            # its next tick; re-reading it must not extend the streak.
+            if times.sampled_at != self._last_sample:
+                self._last_sample = times.sampled_at
+                self._streak = self._streak + 1 if times.steal >= self.threshold else 0
+            return self._streak >= self.consecutive
+
 
 @dataclass(frozen=True)
 class CPUService:
     metrics: CPUMetricsPort
     platform: CPUPlatformPort
+    steal: StealTracker = field(default_factory=StealTracker, compare=False)
 
     @staticmethod
     def mhz_to_ghz(mhz: float) -> float:
@@ -38,17 +119,69 @@ class CPUService:
         """Return current temperature information."""
         return self.platform.temperature_info().data
 
-    def get_cpu_info(self) -> dict:
-        """Return CPU info as a dict."""
-        cpu_usage = self.cpu_percent()
-        cpu_ghz = self.cpu_freq()
-        return {
-            "count": self.cpu_physical_count(),
-            "logical": self.cpu_logical_count(),
-            "percent": cpu_usage,
-            "percent_str": f"{cpu_usage}%",
-            "processor": self.get_processor_name(),
-            "frequency": cpu_ghz,
-            "frequency_str": f"{cpu_ghz} GHz",
-            "temperature": self.get_temp_info(),
-        }
+    def get_per_core_usage(self) -> dict[str, list[float]]:
+        """Return per-CPU usage percentages keyed by time category."""
+        return self.metrics.per_core_usage().to_dict()
+
+    @staticmethod
+    def _select(fields: Iterable[str] | None) -> tuple[str, ...]:
+        if fields is None:
+            return CPU_FIELDS
+        return select_fields(fields, CPU_FIELDS + OPTIONAL_FIELDS, "CPU")
+
+    def _build_info(self, fields: tuple[str, ...], sampled: dict) -> dict:
+        """Assemble ``fields`` from values already read from the ports.
+
+        ``sampled`` holds the usage/processor/temperature/per-core/times
+        results, fetched once by the sync or async caller.
+        """
+        if "times" in sampled:
+            sampled["usage"] = sampled["times"].busy
+        if _wants(fields, *FREQUENCY_FIELDS):
+            sampled["ghz"] = self.cpu_freq()
+        # Presized, so filling it in never reallocates the table.
+        info = dict.fromkeys(fields)
+        for name in fields:
+            info[name] = _FIELD_VALUES[name](self, sampled)
+        return info
+
+    def get_cpu_info(self, fields: Iterable[str] | None = None) -> dict:
+        """Return CPU info as a dict.
+
+        ``fields`` limits the result to those keys; ports that only feed
+        other keys (e.g. the usage sample) are not called. ``per_core``,
+        ``times`` and ``noisy_neighbour`` are only included when requested by
+        name; ``times``, ``percent`` and ``per_core`` then come from the same
+        sample.
+        """
+        fields = self._select(fields)
+        sampled = {}
+        if "per_core" in fields:
+            _add_per_core(sampled, self.metrics.per_core_usage())
+        if "times" not in sampled:
+            if _wants(fields, *TIMES_FIELDS):
+                sampled["times"] = self.metrics.times_percent()
+            elif _wants(fields, *USAGE_FIELDS):
+                sampled["usage"] = self.cpu_percent()
+        if "processor" in fields:
+            sampled["processor"] = self.get_processor_name()
+        if "temperature" in fields:
+            sampled["temperature"] = self.get_temp_info()
+        return self._build_info(fields, sampled)
+
+    async def aget_cpu_info(self, fields: Iterable[str] | None = None) -> dict:
+        """Return CPU info as a dict; ports must implement the async CPU ports."""
+        fields = self._select(fields)
+        sampled = {}
+        if "per_core" in fields:
+            _add_per_core(sampled, await self.metrics.aper_core_usage())
+        if "times" not in sampled:
+            if _wants(fields, *TIMES_FIELDS):
+                sampled["times"] = await self.metrics.atimes_percent()
+            elif _wants(fields, *USAGE_FIELDS):
+                sampled["usage"] = await self.metrics.ausage_percent()
+        if "processor" in fields:
+            sampled["processor"] = await self.platform.aprocessor_name()
+        if "temperature" in fields:
+            sampled["temperature"] = (await self.platform.atemperature_info()).data
+        return self._build_info(fields, sampled)
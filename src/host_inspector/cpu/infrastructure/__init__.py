@@ -1,3 +1,5 @@
 from .factory import build_cpu_service
+from .sampler import get_cpu_sampler
+from .topology import read_topology
 
-__all__ = ["build_cpu_service"]
+__all__ = ["build_cpu_service", "get_cpu_sampler", "read_topology"]
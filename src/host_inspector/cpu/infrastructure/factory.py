@@ -2,8 +2,10 @@ import importlib
 import sys
 
 from host_inspector.cpu.application.service import CPUService
+from host_inspector.utils.instrumentutils import instrument
 
 from .metrics import PsutilCPUMetrics
+from .sampler import get_cpu_sampler
 
 
 def build_cpu_service() -> CPUService:
@@ -23,4 +25,7 @@ def build_cpu_service() -> CPUService:
 
     platform_module = importlib.import_module(module_name)
     platform_cls = getattr(platform_module, class_name)
-    return CPUService(metrics=PsutilCPUMetrics(), platform=platform_cls())
+    return CPUService(
+        metrics=instrument(PsutilCPUMetrics(sampler=get_cpu_sampler()), "cpu.metrics"),
+        platform=instrument(platform_cls(), "cpu.platform"),
+    )
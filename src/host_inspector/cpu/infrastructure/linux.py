@@ -1,75 +1,112 @@
 import re
-import subprocess
-from functools import cache
-
-import psutil
 
 from host_inspector.cpu.application.dtos import TemperatureInfoDTO
+from host_inspector.utils.cacheutils import ttl_cache
+from host_inspector.utils.commandutils import COMMAND_ERRORS
+from host_inspector.utils.commandutils import arun_command
+from host_inspector.utils.commandutils import run_command
+from host_inspector.utils.sysfsutils import read_cpuinfo
 
 from .common import clean_processor_name
+from .thermal import Sensor
+from .thermal import discover_sensors
+from .thermal import package_max
+from .thermal import read_sensors
+
+VCGENCMD_TEMP_COMMAND = ["/usr/bin/vcgencmd", "measure_temp"]
+
 
+def _parse_lscpu_model_name(output: str) -> str:
+    for line in output.strip().split("\n"):
+        if "Model name:" in line:
+            return clean_processor_name(re.sub(r"Model name:\s+", "", line, count=1))
+    return "--"
 
-@cache
+
+@ttl_cache("cpu")
 def _get_processor_name() -> str:
-    """Safely get processor name."""
+    """Safely get processor name from /proc/cpuinfo, then lscpu."""
+    if name := read_cpuinfo().model_name:
+        return clean_processor_name(name)
+
     try:
-        proc = subprocess.run(
-            ["lscpu"],  # noqa: S607
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        all_info = proc.stdout.strip()
-        for line in all_info.split("\n"):
-            if "Model name:" in line:
-                return clean_processor_name(
-                    re.sub(r"Model name:\s+", "", line, count=1)
-                )
-        return "--"
-    except subprocess.CalledProcessError:  # pragma: no cover
+        proc = run_command(["lscpu"])
+        return _parse_lscpu_model_name(proc.stdout)
+    except COMMAND_ERRORS:  # pragma: no cover
         return "--"
 
 
-def _get_temp_info() -> TemperatureInfoDTO:
-    """Get CPU temperature with psutil, then vcgencmd fallback."""
-    try:
-        temps = psutil.sensors_temperatures()
-        if temps.get("coretemp"):
-            temp = temps["coretemp"][0].current
-            temp_c = round(temp, 1)
-            temp_f = round(temp_c * 9 / 5 + 32, 1)
-            return TemperatureInfoDTO(
-                data={
-                    "celsius": temp_c,
-                    "fahrenheit": temp_f,
-                    "celsius_str": f"{temp_c} °C",
-                    "fahrenheit_str": f"{temp_f} °F",
-                }
-            )
-    except (KeyError, AttributeError):
-        pass
+@ttl_cache("cpu", name="get_processor_name")
+async def _aget_processor_name() -> str:
+    if name := read_cpuinfo().model_name:
+        return clean_processor_name(name)
 
     try:
-        result = subprocess.run(
-            ["/usr/bin/vcgencmd", "measure_temp"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        temp_c = round(float(result.stdout.split("=")[1].split("'")[0]), 1)
+        proc = await arun_command(["lscpu"])
+        return _parse_lscpu_model_name(proc.stdout)
+    except COMMAND_ERRORS:  # pragma: no cover
+        return "--"
+
+
+def _sensor_dict(sensor: Sensor, celsius: float) -> dict:
+    return {
+        "source": sensor.source,
+        "chip": sensor.chip,
+        "label": sensor.label,
+        "celsius": celsius,
+        "critical": sensor.critical,
+        "trips": [{"type": kind, "celsius": temp} for kind, temp in sensor.trips],
+    }
+
+
+def _temperature_dto(
+    temp: float | None, readings: list[tuple[Sensor, float]]
+) -> TemperatureInfoDTO:
+    data = {}
+    if temp is not None:
+        temp_c = round(temp, 1)
         temp_f = round(temp_c * 9 / 5 + 32, 1)
-        return TemperatureInfoDTO(
-            data={
-                "celsius": temp_c,
-                "fahrenheit": temp_f,
-                "celsius_str": f"{temp_c} °C",
-                "fahrenheit_str": f"{temp_f} °F",
-            }
-        )
-    except (FileNotFoundError, subprocess.CalledProcessError, IndexError, ValueError):
-        pass
+        data = {
+            "celsius": temp_c,
+            "fahrenheit": temp_f,
+            "celsius_str": f"{temp_c} °C",
+            "fahrenheit_str": f"{temp_f} °F",
+        }
+    if readings:
+        data["sensors"] = [_sensor_dict(*reading) for reading in readings]
+    return TemperatureInfoDTO(data=data)
+
+
+def _parse_vcgencmd_temp(output: str) -> float:
+    return float(output.split("=")[1].split("'", maxsplit=1)[0])
 
-    return TemperatureInfoDTO(data={})
+
+def _read_sysfs_temps() -> tuple[float | None, list[tuple[Sensor, float]]]:
+    readings = read_sensors(discover_sensors())
+    return package_max(readings), readings
+
+
+def _get_temp_info() -> TemperatureInfoDTO:
+    """Get CPU temperature from hwmon/thermal zones, then vcgencmd fallback."""
+    temp, readings = _read_sysfs_temps()
+    if temp is None:
+        try:
+            result = run_command(VCGENCMD_TEMP_COMMAND)
+            temp = _parse_vcgencmd_temp(result.stdout)
+        except (*COMMAND_ERRORS, IndexError, ValueError):
+            pass
+    return _temperature_dto(temp, readings)
+
+
+async def _aget_temp_info() -> TemperatureInfoDTO:
+    temp, readings = _read_sysfs_temps()
+    if temp is None:
+        try:
+            result = await arun_command(VCGENCMD_TEMP_COMMAND)
+            temp = _parse_vcgencmd_temp(result.stdout)
+        except (*COMMAND_ERRORS, IndexError, ValueError):
+            pass
+    return _temperature_dto(temp, readings)
 
 
 class LinuxCPUPlatform:
@@ -78,3 +115,9 @@ class LinuxCPUPlatform:
 
     def temperature_info(self) -> TemperatureInfoDTO:
         return _get_temp_info()
+
+    async def aprocessor_name(self) -> str:
+        return await _aget_processor_name()
+
+    async def atemperature_info(self) -> TemperatureInfoDTO:
+        return await _aget_temp_info()
@@ -1,24 +1,29 @@
-import shlex
-import subprocess
-from functools import cache
-
 from host_inspector.cpu.application.dtos import TemperatureInfoDTO
+from host_inspector.utils.cacheutils import ttl_cache
+from host_inspector.utils.commandutils import COMMAND_ERRORS
+from host_inspector.utils.commandutils import arun_command
+from host_inspector.utils.commandutils import run_command
 
 from .common import clean_processor_name
 
+PROCESSOR_NAME_COMMAND = ["sysctl", "-n", "machdep.cpu.brand_string"]
+
 
-@cache
+@ttl_cache("cpu")
 def _get_processor_name() -> str:
     try:
-        cmd = "sysctl -n machdep.cpu.brand_string"
-        proc = subprocess.run(  # noqa: S603
-            shlex.split(cmd),
-            check=True,
-            capture_output=True,
-            text=True,
-        )
+        proc = run_command(PROCESSOR_NAME_COMMAND)
+        return clean_processor_name(proc.stdout.strip())
+    except COMMAND_ERRORS:  # pragma: no cover
+        return "--"
+
+
+@ttl_cache("cpu", name="get_processor_name")
+async def _aget_processor_name() -> str:
+    try:
+        proc = await arun_command(PROCESSOR_NAME_COMMAND)
         return clean_processor_name(proc.stdout.strip())
-    except subprocess.CalledProcessError:  # pragma: no cover
+    except COMMAND_ERRORS:  # pragma: no cover
         return "--"
 
 
@@ -38,3 +43,9 @@ class MacCPUPlatform:
                 "fahrenheit_str": f"{temp_f if temp_f != 0 else '--'} °F",
             }
         )
+
+    async def aprocessor_name(self) -> str:
+        return await _aget_processor_name()
+
+    async def atemperature_info(self) -> TemperatureInfoDTO:
+        return self.temperature_info()
@@ -1,9 +1,31 @@
+import asyncio
+import time
+
 import psutil
 
+from host_inspector.cpu.application.dtos import CPUTimesPercentDTO
+from host_inspector.cpu.application.dtos import PerCoreUsageDTO
+from host_inspector.utils.cacheutils import ttl_cache
+
+from .sampler import CPUUsageSampler
+from .sampler import busy_percent
+from .sampler import per_core_usage
+from .sampler import times_from_percent
+from .sampler import times_percent
+
 SAMPLE_INTERVAL_SECONDS = 0.3
 
 
+@ttl_cache("cpu")
+def _max_frequency_mhz() -> float:
+    # Static hardware limit; psutil re-reads every cpufreq policy per call.
+    return psutil.cpu_freq().max
+
+
 class PsutilCPUMetrics:
+    def __init__(self, sampler: CPUUsageSampler | None = None):
+        self.sampler = sampler
+
     def physical_count(self) -> int:
         return psutil.cpu_count(logical=False)
 
@@ -11,11 +33,68 @@ class PsutilCPUMetrics:
         return psutil.cpu_count()
 
     def max_frequency_mhz(self) -> float:
-        return psutil.cpu_freq().max
+        return _max_frequency_mhz()
 
     def usage_percent(self) -> float:
+        # Prefer the background sampler when it is running so callers never
+        # block; fall back to a blocking sample until it has a first value.
+        if self.sampler is not None and (latest := self.sampler.latest()) is not None:
+            return latest
+
         # Sample over a short interval and derive usage from idle time to align
         # more closely with OS-reported "user + system" style CPU usage.
         idle = psutil.cpu_times_percent(interval=SAMPLE_INTERVAL_SECONDS).idle
         usage = 100.0 - idle
         return round(max(0.0, min(100.0, usage)), 1)
+
+    async def ausage_percent(self) -> float:
+        if self.sampler is not None and (latest := self.sampler.latest()) is not None:
+            return latest
+
+        # Same idle-based sample as usage_percent, awaiting instead of sleeping.
+        before = psutil.cpu_times()
+        await asyncio.sleep(SAMPLE_INTERVAL_SECONDS)
+        return busy_percent(before, psutil.cpu_times())
+
+    def times_percent(self) -> CPUTimesPercentDTO:
+        # Same single sample as usage_percent, keeping every category.
+        if (
+            self.sampler is not None
+            and (latest := self.sampler.latest_times()) is not None
+        ):
+            return latest
+        percent = psutil.cpu_times_percent(interval=SAMPLE_INTERVAL_SECONDS)
+        return times_from_percent(percent, time.monotonic())
+
+    async def atimes_percent(self) -> CPUTimesPercentDTO:
+        if (
+            self.sampler is not None
+            and (latest := self.sampler.latest_times()) is not None
+        ):
+            return latest
+        before = psutil.cpu_times()
+        await asyncio.sleep(SAMPLE_INTERVAL_SECONDS)
+        return times_percent(before, psutil.cpu_times(), time.monotonic())
+
+    def _sampled_per_core(self) -> PerCoreUsageDTO | None:
+        if self.sampler is None:
+            return None
+        return self.sampler.latest_per_core()
+
+    def per_core_usage(self) -> PerCoreUsageDTO:
+        # One percpu delta over the same window as usage_percent; its total
+        # doubles as the aggregate sample.
+        if (latest := self._sampled_per_core()) is not None:
+            return latest
+        before = psutil.cpu_times(percpu=True)
+        time.sleep(SAMPLE_INTERVAL_SECONDS)
+        after = psutil.cpu_times(percpu=True)
+        return per_core_usage(before, after, time.monotonic())
+
+    async def aper_core_usage(self) -> PerCoreUsageDTO:
+        if (latest := self._sampled_per_core()) is not None:
+            return latest
+        before = psutil.cpu_times(percpu=True)
+        await asyncio.sleep(SAMPLE_INTERVAL_SECONDS)
+        after = psutil.cpu_times(percpu=True)
+        return per_core_usage(before, after, time.monotonic())
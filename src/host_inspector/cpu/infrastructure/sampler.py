@@ -0,0 +1,193 @@
+import threading
+import time
+from functools import cache
+
+import psutil
+
+from host_inspector.cpu.application.dtos import CPUTimesPercentDTO
+from host_inspector.cpu.application.dtos import PerCoreUsageDTO
+
+DEFAULT_SAMPLER_INTERVAL_SECONDS = 1.0
+
+
+def _total_time(times) -> float:
+    """Return total CPU time, excluding guest time already counted in user/nice."""
+    guest = getattr(times, "guest", 0.0) + getattr(times, "guest_nice", 0.0)
+    return sum(times) - guest
+
+
+def busy_percent(before, after) -> float:
+    """Return CPU usage between two `cpu_times()` snapshots, derived from idle."""
+    total_delta = _total_time(after) - _total_time(before)
+    if total_delta <= 0:
+        return 0.0
+    idle = (after.idle - before.idle) / total_delta * 100.0
+    usage = 100.0 - idle
+    return round(max(0.0, min(100.0, usage)), 1)
+
+
+def _delta(before, after, *names: str) -> float:
+    return sum(getattr(after, name, 0.0) - getattr(before, name, 0.0) for name in names)
+
+
+def _clamp(percent: float) -> float:
+    return round(max(0.0, min(100.0, percent)), 1)
+
+
+def times_from_percent(percent, sampled_at: float) -> CPUTimesPercentDTO:
+    """Build the breakdown from a `cpu_times_percent()` result.
+
+    Windows reports interrupt/DPC time, mapped onto irq/softirq.
+    """
+
+    def value(*names: str) -> float:
+        return _clamp(sum(getattr(percent, name, 0.0) for name in names))
+
+    return CPUTimesPercentDTO(
+        busy=_clamp(100.0 - percent.idle),
+        user=value("user", "nice"),
+        system=value("system"),
+        iowait=value("iowait"),
+        irq=value("irq", "interrupt"),
+        softirq=value("softirq", "dpc"),
+        steal=value("steal"),
+        guest=value("guest", "guest_nice"),
+        sampled_at=sampled_at,
+    )
+
+
+def times_percent(before, after, sampled_at: float) -> CPUTimesPercentDTO:
+    """Return the time breakdown between two aggregate `cpu_times()` snapshots."""
+    total = _total_time(after) - _total_time(before)
+    if total <= 0:
+        return CPUTimesPercentDTO(busy=0.0, sampled_at=sampled_at)
+
+    def value(*names: str) -> float:
+        return _clamp(_delta(before, after, *names) / total * 100.0)
+
+    return CPUTimesPercentDTO(
+        busy=busy_percent(before, after),
+        user=value("user", "nice"),
+        system=value("system"),
+        iowait=value("iowait"),
+        irq=value("irq", "interrupt"),
+        softirq=value("softirq", "dpc"),
+        steal=value("steal"),
+        guest=value("guest", "guest_nice"),
+        sampled_at=sampled_at,
+    )
+
+
+def _sum_times(percpu):
+    """Add up a ``cpu_times(percpu=True)`` list into one aggregate entry."""
+    return type(percpu[0])._make(map(sum, zip(*percpu, strict=True)))
+
+
+def per_core_usage(before, after, sampled_at: float = 0.0) -> PerCoreUsageDTO:
+    """Return per-CPU time percentages between two ``cpu_times(percpu=True)`` lists.
+
+    Categories a platform does not report (iowait/irq/steal outside Linux)
+    read as 0; ``irq`` includes softirq time. ``total`` is the aggregate
+    breakdown over the same delta. When a CPU was hot-plugged between the
+    two reads the CPUs no longer line up, and the result is empty.
+    """
+    if not before or len(before) != len(after):
+        return PerCoreUsageDTO()
+    usage = PerCoreUsageDTO(
+        total=times_percent(_sum_times(before), _sum_times(after), sampled_at)
+    )
+    for old, new in zip(before, after, strict=True):
+        total = _total_time(new) - _total_time(old)
+        values = {
+            "user": _delta(old, new, "user", "nice"),
+            "system": _delta(old, new, "system"),
+            "iowait": _delta(old, new, "iowait"),
+            "irq": _delta(old, new, "irq", "softirq"),
+            "steal": _delta(old, new, "steal"),
+            "busy": total - _delta(old, new, "idle"),
+        }
+        for name, value in values.items():
+            getattr(usage, name).append(
+                _clamp(value / total * 100.0 if total > 0 else 0.0)
+            )
+    return usage
+
+
+class CPUUsageSampler:
+    """Keep the latest CPU usage up to date from a background daemon thread."""
+
+    def __init__(self, interval: float = DEFAULT_SAMPLER_INTERVAL_SECONDS):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._latest: float | None = None
+        self._latest_times: CPUTimesPercentDTO | None = None
+        self._latest_per_core: PerCoreUsageDTO | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def latest(self) -> float | None:
+        """Return the most recent usage percent, or None before the first delta."""
+        return self._latest
+
+    def latest_times(self) -> CPUTimesPercentDTO | None:
+        """Return the time breakdown of the most recent sample."""
+        return self._latest_times
+
+    def latest_per_core(self) -> PerCoreUsageDTO | None:
+        """Return the per-CPU breakdown of the most recent sample."""
+        return self._latest_per_core
+
+    def start(self, interval: float | None = None) -> None:
+        """Start sampling; calling start on a running sampler is a no-op."""
+        with self._lock:
+            if self.running:
+                return
+            if interval is not None:
+                self.interval = interval
+            # A fresh event per thread, so a thread that outlived its stop()
+            # join cannot be revived by this start().
+            self._stop = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(self._stop,),
+                name="host-inspector-cpu-sampler",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop sampling and forget the last value once the thread has exited."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            self._stop.set()
+        if thread is None:
+            return
+        thread.join(timeout)
+        if not thread.is_alive():
+            self._latest = None
+            self._latest_times = None
+            self._latest_per_core = None
+
+    def _run(self, stop: threading.Event) -> None:
+        # One percpu read per tick feeds both the per-CPU and the aggregate
+        # breakdown; a tick across a CPU hot-plug is skipped.
+        previous = psutil.cpu_times(percpu=True)
+        while not stop.wait(self.interval):
+            current = psutil.cpu_times(percpu=True)
+            usage = per_core_usage(previous, current, time.monotonic())
+            previous = current
+            if usage.total is None:
+                continue
+            self._latest_per_core = usage
+            self._latest_times = usage.total
+            self._latest = usage.total.busy
+
+
+@cache
+def get_cpu_sampler() -> CPUUsageSampler:
+    """Return the process-wide CPU usage sampler."""
+    return CPUUsageSampler()
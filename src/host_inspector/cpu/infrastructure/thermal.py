@@ -0,0 +1,116 @@
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+
+from host_inspector.utils.cacheutils import ttl_cache
+from host_inspector.utils.sysfsutils import read_text
+
+THERMAL_ROOT = Path("/sys/class/thermal")
+HWMON_ROOT = Path("/sys/class/hwmon")
+
+# hwmon chip names and thermal zone types that measure the CPU package/die.
+CPU_SENSOR_CHIPS = frozenset(
+    {
+        "coretemp",
+        "cpu-thermal",
+        "cpu_thermal",
+        "k10temp",
+        "soc_thermal",
+        "x86_pkg_temp",
+        "zenpower",
+    }
+)
+
+
+@dataclass(frozen=True)
+class Sensor:
+    source: str  # "hwmon" or "thermal"
+    chip: str
+    label: str
+    path: Path
+    critical: float | None = None
+    trips: tuple[tuple[str, float], ...] = field(default_factory=tuple)
+
+    @property
+    def is_cpu(self) -> bool:
+        return self.chip in CPU_SENSOR_CHIPS
+
+
+def _strip(path: Path) -> str | None:
+    if (text := read_text(path)) is None:
+        return None
+    return text.strip() or None
+
+
+def _millidegrees(path: Path) -> float | None:
+    try:
+        return round(int(_strip(path) or "") / 1000, 1)
+    except ValueError:
+        return None
+
+
+def _hwmon_sensors(root: Path) -> list[Sensor]:
+    sensors = []
+    for chip_dir in sorted(root.glob("hwmon*")):
+        chip = _strip(chip_dir / "name") or chip_dir.name
+        for temp_input in sorted(chip_dir.glob("temp*_input")):
+            prefix = temp_input.name.removesuffix("_input")
+            sensors.append(
+                Sensor(
+                    source="hwmon",
+                    chip=chip,
+                    label=_strip(chip_dir / f"{prefix}_label") or prefix,
+                    path=temp_input,
+                    critical=_millidegrees(chip_dir / f"{prefix}_crit"),
+                )
+            )
+    return sensors
+
+
+def _thermal_zone_sensors(root: Path) -> list[Sensor]:
+    sensors = []
+    for zone in sorted(root.glob("thermal_zone*")):
+        trips = []
+        for trip_type in sorted(zone.glob("trip_point_*_type")):
+            temp = zone / trip_type.name.replace("_type", "_temp")
+            kind, celsius = _strip(trip_type), _millidegrees(temp)
+            if kind is not None and celsius is not None:
+                trips.append((kind, celsius))
+        zone_type = _strip(zone / "type") or zone.name
+        sensors.append(
+            Sensor(
+                source="thermal",
+                chip=zone_type,
+                label=zone.name,
+                path=zone / "temp",
+                critical=next((c for kind, c in trips if kind == "critical"), None),
+                trips=tuple(trips),
+            )
+        )
+    return sensors
+
+
+@ttl_cache("cpu")
+def discover_sensors(
+    thermal_root: Path = THERMAL_ROOT, hwmon_root: Path = HWMON_ROOT
+) -> tuple[Sensor, ...]:
+    """Enumerate hwmon and thermal-zone temperature sensors once.
+
+    Labels, critical limits and trip points are static and read here; a
+    sample only re-reads each sensor's temperature file.
+    """
+    return (*_hwmon_sensors(hwmon_root), *_thermal_zone_sensors(thermal_root))
+
+
+def read_sensors(sensors: tuple[Sensor, ...]) -> list[tuple[Sensor, float]]:
+    """Return the current temperature (°C) of every sensor that can be read."""
+    return [
+        (sensor, celsius)
+        for sensor in sensors
+        if (celsius := _millidegrees(sensor.path)) is not None
+    ]
+
+
+def package_max(readings: list[tuple[Sensor, float]]) -> float | None:
+    """Return the hottest CPU package/die reading, or None without CPU sensors."""
+    return max((celsius for sensor, celsius in readings if sensor.is_cpu), default=None)
@@ -0,0 +1,140 @@
+import re
+from pathlib import Path
+
+import psutil
+
+from host_inspector.cpu.application.dtos import CPUCacheDTO
+from host_inspector.cpu.application.dtos import CPUTopologyDTO
+from host_inspector.cpu.application.dtos import LogicalCPUDTO
+from host_inspector.cpu.application.dtos import NumaNodeDTO
+from host_inspector.utils.cacheutils import ttl_cache
+from host_inspector.utils.sysfsutils import parse_cpu_list
+from host_inspector.utils.sysfsutils import read_text
+
+CPU_ROOT = Path("/sys/devices/system/cpu")
+NODE_ROOT = Path("/sys/devices/system/node")
+
+
+def _strip(path: Path) -> str | None:
+    if (text := read_text(path)) is None:
+        return None
+    return text.strip() or None
+
+
+def _int(path: Path, default: int | None = None) -> int | None:
+    try:
+        return int(_strip(path) or "")
+    except ValueError:
+        return default
+
+
+def _numbered(root: Path, prefix: str) -> list[tuple[int, Path]]:
+    pattern = re.compile(rf"{prefix}(\d+)")
+    entries = [
+        (int(match.group(1)), path)
+        for path in root.glob(f"{prefix}*")
+        if (match := pattern.fullmatch(path.name))
+    ]
+    return sorted(entries)
+
+
+def _size_kb(text: str | None) -> int | None:
+    if not text:
+        return None
+    number, unit = text[:-1], text[-1].upper()
+    try:
+        if unit == "K":
+            return int(number)
+        if unit == "M":
+            return int(number) * 1024
+        return int(text) // 1024
+    except ValueError:
+        return None
+
+
+def _read_nodes(node_root: Path) -> tuple[NumaNodeDTO, ...]:
+    nodes = []
+    for node, path in _numbered(node_root, "node"):
+        memory_kb = None
+        for line in (read_text(path / "meminfo") or "").splitlines():
+            if "MemTotal:" in line:
+                memory_kb = int(line.split()[-2])
+                break
+        nodes.append(
+            NumaNodeDTO(
+                node=node,
+                cpus=parse_cpu_list(_strip(path / "cpulist") or ""),
+                memory_kb=memory_kb,
+            )
+        )
+    return tuple(nodes)
+
+
+def _read_caches(cpu_dirs: list[tuple[int, Path]]) -> tuple[CPUCacheDTO, ...]:
+    # Every CPU lists the caches it can see; keep each shared cache once.
+    caches: dict[tuple, CPUCacheDTO] = {}
+    for _, path in cpu_dirs:
+        for _, index in _numbered(path / "cache", "index"):
+            level = _int(index / "level")
+            cpus = parse_cpu_list(_strip(index / "shared_cpu_list") or "")
+            if level is None or not cpus:
+                continue
+            cache_type = _strip(index / "type") or "Unified"
+            caches.setdefault(
+                (level, cache_type, cpus),
+                CPUCacheDTO(
+                    level=level,
+                    type=cache_type,
+                    size_kb=_size_kb(_strip(index / "size")),
+                    cpus=cpus,
+                ),
+            )
+    return tuple(sorted(caches.values(), key=lambda c: (c.level, c.type, c.cpus)))
+
+
+def read_sysfs_topology(cpu_root: Path, node_root: Path) -> CPUTopologyDTO | None:
+    """Build the topology from sysfs, or None where it is not exposed."""
+    cpu_dirs = [
+        (cpu, path)
+        for cpu, path in _numbered(cpu_root, "cpu")
+        if (path / "topology").is_dir()
+    ]
+    if not cpu_dirs:
+        return None
+
+    nodes = _read_nodes(node_root)
+    node_of = {cpu: node.node for node in nodes for cpu in node.cpus}
+    cpus = []
+    for cpu, path in cpu_dirs:
+        topology = path / "topology"
+        siblings = _strip(topology / "core_cpus_list") or _strip(
+            topology / "thread_siblings_list"
+        )
+        cpus.append(
+            LogicalCPUDTO(
+                cpu=cpu,
+                core=_int(topology / "core_id", cpu),
+                package=_int(topology / "physical_package_id", 0),
+                node=node_of.get(cpu),
+                siblings=parse_cpu_list(siblings) if siblings else (cpu,),
+            )
+        )
+    return CPUTopologyDTO(cpus=tuple(cpus), caches=_read_caches(cpu_dirs), nodes=nodes)
+
+
+def psutil_topology() -> CPUTopologyDTO:
+    """Fallback without sysfs: one socket, SMT siblings unknown."""
+    return CPUTopologyDTO(
+        cpus=tuple(
+            LogicalCPUDTO(cpu=cpu, core=cpu, package=0, siblings=(cpu,))
+            for cpu in range(psutil.cpu_count() or 1)
+        )
+    )
+
+
+@ttl_cache("cpu")
+def read_topology(
+    cpu_root: Path = CPU_ROOT, node_root: Path = NODE_ROOT
+) -> CPUTopologyDTO:
+    """Return the CPU/NUMA topology, read once per process."""
+    return read_sysfs_topology(cpu_root, node_root) or psutil_topology()
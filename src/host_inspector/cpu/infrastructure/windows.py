@@ -1,13 +1,13 @@
 import platform
 import winreg
-from functools import cache
 
 from host_inspector.cpu.application.dtos import TemperatureInfoDTO
+from host_inspector.utils.cacheutils import ttl_cache
 
 from .common import clean_processor_name
 
 
-@cache
+@ttl_cache("cpu")
 def _get_processor_name() -> str:
     """Safely get processor name."""
     try:
@@ -34,3 +34,10 @@ class WindowsCPUPlatform:
                 "fahrenheit_str": f"{temp_f if temp_f != 0 else '--'} °F",
             }
         )
+
+    async def aprocessor_name(self) -> str:
+        # Registry reads are local and fast; no subprocess to await.
+        return _get_processor_name()
+
+    async def atemperature_info(self) -> TemperatureInfoDTO:
+        return self.temperature_info()
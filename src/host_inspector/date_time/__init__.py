@@ -2,7 +2,7 @@ from functools import cache
 
 from .infrastructure import build_datetime_service
 
-__all__ = ["get_datetime_info"]
+__all__ = ["aget_datetime_info", "get_datetime_info"]
 
 
 @cache
@@ -13,3 +13,9 @@ def _get_datetime_service():
 def get_datetime_info() -> dict:
     """Get date/time information as a dict."""
     return _get_datetime_service().get_datetime_info()
+
+
+async def aget_datetime_info() -> dict:
+    """Get date/time information as a dict without blocking."""
+    # psutil/stdlib reads only; nothing here waits on a subprocess.
+    return get_datetime_info()
@@ -1,7 +1,8 @@
 from host_inspector.date_time.application.service import DateTimeService
+from host_inspector.utils.instrumentutils import instrument
 
 from .probe import SystemDateTimeProbe
 
 
 def build_datetime_service() -> DateTimeService:
-    return DateTimeService(probe=SystemDateTimeProbe())
+    return DateTimeService(probe=instrument(SystemDateTimeProbe(), "date_time.probe"))
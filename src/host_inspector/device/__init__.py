@@ -1,8 +1,9 @@
+from collections.abc import Iterable
 from functools import cache
 
 from .infrastructure import build_device_service
 
-__all__ = ["get_device_info"]
+__all__ = ["aget_device_info", "get_device_info"]
 
 
 @cache
@@ -10,6 +11,10 @@ def _get_device_service():
     return build_device_service()
 
 
-def get_device_info() -> dict:
-    """Return device information."""
-    return _get_device_service().get_device_info()
+def get_device_info(sections: Iterable[str] | None = None) -> dict:
+    """Return device information, probing only ``sections`` when given."""
+    return _get_device_service().get_device_info(sections)
+
+
+async def aget_device_info(sections: Iterable[str] | None = None) -> dict:
+    return await _get_device_service().aget_device_info(sections)
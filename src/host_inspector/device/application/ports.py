@@ -1,8 +1,14 @@
+from collections.abc import Iterable
 from typing import Protocol
 
 from .dtos import DeviceInputDTO
 
 
 class DeviceProbePort(Protocol):
-    def snapshot(self) -> DeviceInputDTO:
-        """Return device aggregate input."""
+    def snapshot(self, sections: Iterable[str] | None = None) -> DeviceInputDTO:
+        """Return device aggregate input, probing only ``sections`` when given."""
+
+
+class AsyncDeviceProbePort(Protocol):
+    async def asnapshot(self, sections: Iterable[str] | None = None) -> DeviceInputDTO:
+        """Return device aggregate input without blocking."""
@@ -1,18 +1,30 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
 
+from host_inspector.utils.projectutils import select_fields
+
+from .dtos import DeviceInputDTO
 from .ports import DeviceProbePort
 
+SECTIONS = ("os", "platform", "network", "gpu", "display")
+
 
 @dataclass(frozen=True)
 class DeviceService:
     probe: DeviceProbePort
 
-    def get_device_info(self) -> dict:
-        snapshot = self.probe.snapshot()
-        return {
-            "os": snapshot.os,
-            "platform": snapshot.platform,
-            "network": snapshot.network,
-            "gpu": snapshot.gpu,
-            "display": snapshot.display,
-        }
+    def get_device_info(self, sections: Iterable[str] | None = None) -> dict:
+        if sections is None:
+            return self._build_info(self.probe.snapshot(), SECTIONS)
+        sections = select_fields(sections, SECTIONS, "device")
+        return self._build_info(self.probe.snapshot(sections=sections), sections)
+
+    async def aget_device_info(self, sections: Iterable[str] | None = None) -> dict:
+        if sections is None:
+            return self._build_info(await self.probe.asnapshot(), SECTIONS)
+        sections = select_fields(sections, SECTIONS, "device")
+        return self._build_info(await self.probe.asnapshot(sections=sections), sections)
+
+    @staticmethod
+    def _build_info(snapshot: DeviceInputDTO, sections: tuple[str, ...]) -> dict:
+        return {section: getattr(snapshot, section) for section in sections}
@@ -1,7 +1,8 @@
 from host_inspector.device.application.service import DeviceService
+from host_inspector.utils.instrumentutils import instrument
 
 from .probe import DeviceProbe
 
 
 def build_device_service() -> DeviceService:
-    return DeviceService(probe=DeviceProbe())
+    return DeviceService(probe=instrument(DeviceProbe(), "device.probe"))
@@ -1,17 +1,70 @@
+from collections.abc import Iterable
+
 from host_inspector.device.application.dtos import DeviceInputDTO
+from host_inspector.display import aget_display_info
 from host_inspector.display import get_display_info
+from host_inspector.gpu import aget_gpu_info
 from host_inspector.gpu import get_gpu_info
+from host_inspector.network import aget_network_info
 from host_inspector.network import get_network_info
+from host_inspector.os import aget_os_info
 from host_inspector.os import get_os_info
+from host_inspector.platform import aget_platform_info
 from host_inspector.platform import get_platform_info
+from host_inspector.utils.collectutils import DEFAULT_DEADLINE_SECONDS
+from host_inspector.utils.collectutils import DEFAULT_PROBE_TIMEOUT_SECONDS
+from host_inspector.utils.collectutils import ProbeTask
+from host_inspector.utils.collectutils import acollect_parallel
+from host_inspector.utils.collectutils import collect_parallel
+from host_inspector.utils.collectutils import select_tasks
+from host_inspector.utils.collectutils import task_defaults
 
 
 class DeviceProbe:
-    def snapshot(self) -> DeviceInputDTO:
-        return DeviceInputDTO(
-            os=get_os_info(),
-            platform=get_platform_info(),
-            network=get_network_info(),
-            gpu=get_gpu_info(),
-            display=get_display_info(),
+    def __init__(
+        self,
+        *,
+        max_workers: int = 5,
+        timeout: float | None = DEFAULT_PROBE_TIMEOUT_SECONDS,
+        deadline: float | None = DEFAULT_DEADLINE_SECONDS,
+    ):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.deadline = deadline
+
+    def _tasks(self, os, platform, network, gpu, display) -> list[ProbeTask]:
+        return [
+            ProbeTask("os", os, default={}, timeout=self.timeout),
+            ProbeTask("platform", platform, default={}, timeout=self.timeout),
+            ProbeTask("network", network, default={}, timeout=self.timeout),
+            ProbeTask("gpu", gpu, default={}, timeout=self.timeout),
+            ProbeTask("display", display, default=[], timeout=self.timeout),
+        ]
+
+    def snapshot(self, sections: Iterable[str] | None = None) -> DeviceInputDTO:
+        tasks = self._tasks(
+            get_os_info,
+            get_platform_info,
+            get_network_info,
+            get_gpu_info,
+            get_display_info,
+        )
+        results = collect_parallel(
+            select_tasks(tasks, sections),
+            max_workers=self.max_workers,
+            deadline=self.deadline,
+        )
+        return DeviceInputDTO(**task_defaults(tasks) | results)
+
+    async def asnapshot(self, sections: Iterable[str] | None = None) -> DeviceInputDTO:
+        tasks = self._tasks(
+            aget_os_info,
+            aget_platform_info,
+            aget_network_info,
+            aget_gpu_info,
+            aget_display_info,
+        )
+        results = await acollect_parallel(
+            select_tasks(tasks, sections), deadline=self.deadline
         )
+        return DeviceInputDTO(**task_defaults(tasks) | results)
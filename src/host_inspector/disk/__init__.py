@@ -1,8 +1,27 @@
+import asyncio
+from collections.abc import Iterable
 from functools import cache
+from functools import partial
 
+from host_inspector.utils.collectutils import run_in_thread
+
+from .application.service import DEFAULT_IO_INTERVAL_SECONDS
+from .application.service import DEFAULT_MOUNT_TIMEOUT_SECONDS
+from .application.service import DEFAULT_SCAN_TOP
+from .infrastructure import build_disk_io_service
+from .infrastructure import build_disk_scan_service
 from .infrastructure import build_disk_service
 
-__all__ = ["get_disk_info"]
+__all__ = [
+    "aget_disk_info",
+    "aget_disk_inventory",
+    "aget_disk_io_info",
+    "ascan_disk_usage",
+    "get_disk_info",
+    "get_disk_inventory",
+    "get_disk_io_info",
+    "scan_disk_usage",
+]
 
 
 @cache
@@ -10,6 +29,84 @@ def _get_disk_service():
     return build_disk_service()
 
 
-def get_disk_info(path: str = "/") -> dict:
-    """Return disk usage info as dict."""
-    return _get_disk_service().get_disk_info(path=path)
+@cache
+def _get_disk_io_service():
+    return build_disk_io_service()
+
+
+@cache
+def _get_disk_scan_service():
+    return build_disk_scan_service()
+
+
+def get_disk_info(path: str = "/", fields: Iterable[str] | None = None) -> dict:
+    """Return disk usage info as dict, optionally limited to ``fields``.
+
+    Request ``forecast`` by name for the usage growth rate and time to full,
+    and ``inodes``, ``fstype`` or ``flags`` (``ro``, ``noatime``, ...) for
+    the rest of what ``statvfs`` reports.
+    """
+    return _get_disk_service().get_disk_info(path=path, fields=fields)
+
+
+async def aget_disk_info(path: str = "/", fields: Iterable[str] | None = None) -> dict:
+    """Return disk usage info as dict without blocking the event loop."""
+    # statvfs on a dead network mount can block indefinitely; a daemon thread
+    # keeps it off the loop without holding up interpreter exit.
+    return await asyncio.wrap_future(
+        run_in_thread(partial(get_disk_info, path=path, fields=fields))
+    )
+
+
+def get_disk_inventory(
+    mount_timeout: float | None = DEFAULT_MOUNT_TIMEOUT_SECONDS,
+    fields: Iterable[str] | None = None,
+) -> list[dict]:
+    """Return usage for every real mount; pseudo filesystems are skipped.
+
+    Mounts are probed in parallel, and one that does not answer within
+    ``mount_timeout`` seconds is marked ``"unresponsive"`` instead of blocking.
+    """
+    return _get_disk_service().get_disk_inventory(
+        mount_timeout=mount_timeout, fields=fields
+    )
+
+
+async def aget_disk_inventory(
+    mount_timeout: float | None = DEFAULT_MOUNT_TIMEOUT_SECONDS,
+    fields: Iterable[str] | None = None,
+) -> list[dict]:
+    """Return the mount inventory without blocking the event loop."""
+    return await _get_disk_service().aget_disk_inventory(
+        mount_timeout=mount_timeout, fields=fields
+    )
+
+
+def get_disk_io_info(interval: float = DEFAULT_IO_INTERVAL_SECONDS) -> dict:
+    """Return iostat-style rates per disk, with its partitions nested inside.
+
+    Rates cover the time since the previous call, and never less than
+    ``interval`` seconds: the first call, or one that follows too soon,
+    waits for the rest of it.
+    """
+    return _get_disk_io_service().get_disk_io_info(interval=interval)
+
+
+async def aget_disk_io_info(interval: float = DEFAULT_IO_INTERVAL_SECONDS) -> dict:
+    """Return per-disk I/O rates without blocking the event loop."""
+    return await _get_disk_io_service().aget_disk_io_info(interval=interval)
+
+
+def scan_disk_usage(path: str = "/", top: int = DEFAULT_SCAN_TOP) -> dict:
+    """Return the ``top`` largest directories and files under ``path``.
+
+    The walk stays on the filesystem of ``path``. Directories whose mtime
+    is unchanged since the previous scan are not re-read, so repeated
+    scans of a large tree are much faster than the first one.
+    """
+    return _get_disk_scan_service().scan_disk_usage(path=path, top=top)
+
+
+async def ascan_disk_usage(path: str = "/", top: int = DEFAULT_SCAN_TOP) -> dict:
+    """Scan disk usage in a worker thread without blocking the event loop."""
+    return await _get_disk_scan_service().ascan_disk_usage(path=path, top=top)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from dataclasses import field
 
 
 @dataclass(frozen=True)
@@ -7,3 +8,48 @@ class DiskSnapshotDTO:
     used: int
     free: int
     percent: float
+    # None where the platform does not report them (Windows).
+    inodes_total: int | None = None
+    inodes_free: int | None = None
+    flags: tuple[str, ...] | None = None
+
+
+@dataclass(frozen=True)
+class PartitionDTO:
+    device: str
+    mountpoint: str
+    fstype: str
+
+
+@dataclass(frozen=True)
+class BlockDeviceStatsDTO:
+    """Cumulative counters of one block device, as in /proc/diskstats."""
+
+    reads: int = 0
+    read_sectors: int = 0  # 512-byte units, whatever the device sector size
+    read_ms: int = 0
+    writes: int = 0
+    write_sectors: int = 0
+    write_ms: int = 0
+    in_flight: int = 0
+    io_ms: int = 0  # time with at least one request in flight
+    weighted_ms: int = 0  # sum of time each request spent in flight
+    parent: str | None = None  # the whole disk, for a partition
+
+
+@dataclass(frozen=True)
+class DiskStatsSnapshotDTO:
+    timestamp: float  # monotonic seconds, for rates between snapshots
+    devices: dict[str, BlockDeviceStatsDTO] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class DiskScanDTO:
+    root: str
+    total_bytes: int  # allocated on disk, like du
+    directories: int
+    files: int
+    largest_directories: tuple[tuple[str, int], ...] = ()  # (path, bytes)
+    largest_files: tuple[tuple[str, int], ...] = ()
+    errors: int = 0  # directories that could not be read
+    reused: int = 0  # directories served from the mtime cache
@@ -1,8 +1,30 @@
 from typing import Protocol
 
+from .dtos import DiskScanDTO
 from .dtos import DiskSnapshotDTO
+from .dtos import DiskStatsSnapshotDTO
+from .dtos import PartitionDTO
 
 
 class DiskProbePort(Protocol):
     def snapshot(self, path: str = "/") -> DiskSnapshotDTO:
         """Return a disk usage snapshot."""
+
+    def filesystem_type(self, path: str) -> str | None:
+        """Return the type of the filesystem holding ``path``, if known."""
+
+    def mountpoint(self, path: str) -> str:
+        """Return the mount point holding ``path`` (``path`` if none is found)."""
+
+    def partitions(self) -> list[PartitionDTO]:
+        """Return mounted partitions; listing them must not touch the mounts."""
+
+
+class DiskIOProbePort(Protocol):
+    def snapshot(self) -> DiskStatsSnapshotDTO:
+        """Return cumulative I/O counters for every block device."""
+
+
+class DirectoryScanPort(Protocol):
+    def scan(self, root: str, top: int = 20) -> DiskScanDTO:
+        """Return the size of the tree under ``root`` and its largest entries."""
@@ -1,5 +1,16 @@
+import asyncio
+import math
+import threading
+import time
+from collections.abc import Callable
+from collections.abc import Iterable
 from dataclasses import dataclass
+from dataclasses import field
+from functools import partial
 
+from host_inspector.disk.domain import SECTOR_BYTES
+from host_inspector.disk.domain import LinearTrend
+from host_inspector.disk.domain import await_ms
 from host_inspector.disk.domain import disk_avail
 from host_inspector.disk.domain import disk_avail_str
 from host_inspector.disk.domain import disk_percent
@@ -7,23 +18,443 @@ from host_inspector.disk.domain import disk_physical
 from host_inspector.disk.domain import disk_physical_str
 from host_inspector.disk.domain import disk_used
 from host_inspector.disk.domain import disk_used_str
+from host_inspector.disk.domain import hours_to_full
+from host_inspector.disk.domain import is_real_mount
+from host_inspector.disk.domain import per_second
+from host_inspector.disk.domain import queue_depth
+from host_inspector.disk.domain import utilization
+from host_inspector.utils.collectutils import ProbeTask
+from host_inspector.utils.collectutils import acollect_parallel
+from host_inspector.utils.collectutils import collect_parallel
+from host_inspector.utils.collectutils import run_in_thread
+from host_inspector.utils.projectutils import select_fields
 
+from .dtos import BlockDeviceStatsDTO
+from .dtos import DiskScanDTO
+from .dtos import DiskSnapshotDTO
+from .dtos import DiskStatsSnapshotDTO
+from .dtos import PartitionDTO
+from .ports import DirectoryScanPort
+from .ports import DiskIOProbePort
 from .ports import DiskProbePort
 
+DEFAULT_MOUNT_TIMEOUT_SECONDS = 2.0
+MAX_MOUNT_WORKERS = 16
+DEFAULT_IO_INTERVAL_SECONDS = 0.5
+DEFAULT_SCAN_TOP = 20
+
+DISK_FIELDS = (
+    "physical",
+    "physical_str",
+    "used",
+    "used_str",
+    "avail",
+    "avail_str",
+    "percent",
+    "percent_str",
+)
+# Opt-in: only returned when asked for by name.
+OPTIONAL_FIELDS = ("forecast", "inodes", "fstype", "flags")
+
+# The fill forecast fits free bytes over the last FORECAST_SAMPLES samples
+# taken at least FORECAST_MIN_INTERVAL_SECONDS apart (six hours at most).
+FORECAST_SAMPLES = 720
+FORECAST_MIN_INTERVAL_SECONDS = 30.0
+# Mounts with a history; the least recently observed one makes room.
+FORECAST_MAX_MOUNTS = 64
+MIN_FORECAST_SAMPLES = 3
+SECONDS_PER_HOUR = 3600.0
+
+
+def _usage(snapshot: DiskSnapshotDTO) -> dict:
+    return {
+        "physical": disk_physical(snapshot.total),
+        "physical_str": disk_physical_str(snapshot.total),
+        "used": disk_used(snapshot.used),
+        "used_str": disk_used_str(snapshot.used),
+        "avail": disk_avail(snapshot.free),
+        "avail_str": disk_avail_str(snapshot.free),
+        "percent": disk_percent(snapshot.percent),
+        "percent_str": f"{disk_percent(snapshot.percent)}%",
+    }
+
+
+def _inodes(snapshot: DiskSnapshotDTO) -> dict | None:
+    if snapshot.inodes_total is None or snapshot.inodes_free is None:
+        return None
+    used = snapshot.inodes_total - snapshot.inodes_free
+    return {
+        "total": snapshot.inodes_total,
+        "used": used,
+        "free": snapshot.inodes_free,
+        # Some filesystems (btrfs) allocate inodes dynamically and report 0.
+        "percent": (
+            round(used / snapshot.inodes_total * 100, 1)
+            if snapshot.inodes_total
+            else None
+        ),
+    }
+
+
+def _select(fields: Iterable[str] | None) -> tuple[str, ...]:
+    if fields is None:
+        return DISK_FIELDS
+    return select_fields(fields, DISK_FIELDS + OPTIONAL_FIELDS, "disk")
+
+
+def _mount(partition: PartitionDTO, status: str) -> dict:
+    return {
+        "device": partition.device,
+        "mountpoint": partition.mountpoint,
+        "fstype": partition.fstype,
+        "status": status,
+    }
+
+
+def _inventory(partitions: list[PartitionDTO], results: dict[str, dict]) -> list[dict]:
+    # Mounts still blocked from an earlier call have no task and no result.
+    return [
+        results.get(partition.mountpoint) or _mount(partition, "unresponsive")
+        for partition in partitions
+    ]
+
+
+def _athread(func: Callable[[], dict]) -> asyncio.Future:
+    # Not asyncio.to_thread: asyncio.run joins the default executor on exit,
+    # so a statvfs stuck on a dead mount would hang the interpreter there.
+    return asyncio.wrap_future(run_in_thread(func, name="host-inspector-mount"))
+
+
+class PendingMounts:
+    """Mounts whose usage call has not returned yet.
+
+    A call stuck on a dead network mount never returns, so the mount is
+    reported unresponsive without starting another thread that would block
+    on it too.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: set[str] = set()
+
+    def claim(self, mountpoint: str) -> bool:
+        with self._lock:
+            if mountpoint in self._pending:
+                return False
+            self._pending.add(mountpoint)
+            return True
+
+    def release(self, mountpoint: str) -> None:
+        with self._lock:
+            self._pending.discard(mountpoint)
+
+
+@dataclass
+class _FreeSeries:
+    origin: float  # monotonic seconds of the first sample
+    base: int  # free bytes at the first sample
+    trend: LinearTrend
+    last: float = -math.inf
+
+
+class FillForecaster:
+    """Track free bytes per mount and extrapolate when each one fills up.
+
+    Inventory snapshots and forecast requests are offered to :meth:`observe`,
+    keyed by mount point. Samples closer together than ``min_interval`` are
+    dropped, so a burst of calls does not crowd hours of history out of the
+    window, and at most ``max_mounts`` histories are kept.
+    """
+
+    def __init__(
+        self,
+        capacity: int = FORECAST_SAMPLES,
+        min_interval: float = FORECAST_MIN_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        max_mounts: int = FORECAST_MAX_MOUNTS,
+    ):
+        self.capacity = capacity
+        self.min_interval = min_interval
+        self.max_mounts = max_mounts
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._series: dict[str, _FreeSeries] = {}
+
+    def observe(self, mount: str, free: int) -> None:
+        now = self._clock()
+        with self._lock:
+            if (series := self._series.pop(mount, None)) is None:
+                if len(self._series) >= self.max_mounts:
+                    del self._series[next(iter(self._series))]
+                series = _FreeSeries(now, free, LinearTrend(self.capacity))
+            # Re-inserted, so the dict stays ordered by last observation.
+            self._series[mount] = series
+            if now - series.last < self.min_interval:
+                return
+            series.last = now
+            series.trend.add(
+                (now - series.origin) / SECONDS_PER_HOUR, free - series.base
+            )
+
+    def forecast(self, mount: str, free: int) -> dict:
+        """Return the usage growth rate and the hours left until ``free`` hits 0.
+
+        Both are None until the mount has ``MIN_FORECAST_SAMPLES`` samples.
+        """
+        with self._lock:
+            series = self._series.get(mount)
+            samples = len(series.trend) if series else 0
+            slope = series.trend.slope() if samples >= MIN_FORECAST_SAMPLES else None
+        # Free space shrinking is usage growing.
+        growth = None if slope is None else round(-slope, 1)
+        return {
+            "growth_bytes_per_hour": growth,
+            "hours_to_full": hours_to_full(free, growth),
+            "samples": samples,
+        }
+
 
 @dataclass(frozen=True)
 class DiskService:
     probe: DiskProbePort
+    pending: PendingMounts = field(default_factory=PendingMounts, compare=False)
+    forecaster: FillForecaster = field(default_factory=FillForecaster, compare=False)
 
-    def get_disk_info(self, path: str = "/") -> dict:
-        snapshot = self.probe.snapshot(path=path)
-        return {
-            "physical": disk_physical(snapshot.total),
-            "physical_str": disk_physical_str(snapshot.total),
-            "used": disk_used(snapshot.used),
-            "used_str": disk_used_str(snapshot.used),
-            "avail": disk_avail(snapshot.free),
-            "avail_str": disk_avail_str(snapshot.free),
-            "percent": disk_percent(snapshot.percent),
-            "percent_str": f"{disk_percent(snapshot.percent)}%",
+    def _info(
+        self,
+        key: str,
+        snapshot: DiskSnapshotDTO,
+        fields: tuple,
+        fstype: str | None = None,
+    ) -> dict:
+        values = _usage(snapshot) | {
+            "inodes": _inodes(snapshot),
+            "fstype": fstype,
+            "flags": list(snapshot.flags) if snapshot.flags is not None else None,
         }
+        if "forecast" in fields:
+            values["forecast"] = self.forecaster.forecast(key, snapshot.free)
+        return {name: values[name] for name in fields}
+
+    def get_disk_info(
+        self, path: str = "/", fields: Iterable[str] | None = None
+    ) -> dict:
+        """Return usage of the filesystem holding ``path``.
+
+        ``fields`` limits the result to those keys; ``forecast``, ``inodes``,
+        ``fstype`` and ``flags`` are opt-in.
+        """
+        fields = _select(fields)
+        snapshot = self.probe.snapshot(path=path)
+        # Finding the mount above ``path`` resolves it and walks the mount
+        # table, so it is only done when asked for.
+        fstype = self.probe.filesystem_type(path) if "fstype" in fields else None
+        mount = path
+        if "forecast" in fields:
+            # One history per filesystem, whichever path on it was asked about.
+            mount = self.probe.mountpoint(path)
+            self.forecaster.observe(mount, snapshot.free)
+        return self._info(mount, snapshot, fields, fstype)
+
+    def _partitions(self) -> list[PartitionDTO]:
+        partitions: dict[str, PartitionDTO] = {}
+        for partition in self.probe.partitions():
+            if is_real_mount(partition.fstype, partition.mountpoint):
+                partitions.setdefault(partition.mountpoint, partition)
+        return list(partitions.values())
+
+    def _mount_info(self, partition: PartitionDTO, fields: tuple) -> dict:
+        try:
+            snapshot = self.probe.snapshot(path=partition.mountpoint)
+        except OSError:
+            return _mount(partition, "error")
+        finally:
+            self.pending.release(partition.mountpoint)
+        self.forecaster.observe(partition.mountpoint, snapshot.free)
+        return _mount(partition, "ok") | self._info(
+            partition.mountpoint, snapshot, fields, partition.fstype
+        )
+
+    def _tasks(
+        self,
+        partitions: list[PartitionDTO],
+        timeout: float | None,
+        fields: tuple,
+        *,
+        run_async: bool,
+    ) -> list[ProbeTask]:
+        tasks = []
+        for partition in partitions:
+            if not self.pending.claim(partition.mountpoint):
+                continue
+            func = partial(self._mount_info, partition, fields)
+            if run_async:
+                func = partial(_athread, func)
+            tasks.append(
+                ProbeTask(
+                    partition.mountpoint,
+                    func,
+                    default=_mount(partition, "unresponsive"),
+                    timeout=timeout,
+                )
+            )
+        return tasks
+
+    def get_disk_inventory(
+        self,
+        mount_timeout: float | None = DEFAULT_MOUNT_TIMEOUT_SECONDS,
+        fields: Iterable[str] | None = None,
+    ) -> list[dict]:
+        """Return usage for every real mount, probing the mounts in parallel.
+
+        A mount whose usage call does not return within ``mount_timeout`` seconds
+        is reported with ``status="unresponsive"`` and no usage keys.
+        """
+        partitions = self._partitions()
+        tasks = self._tasks(partitions, mount_timeout, _select(fields), run_async=False)
+        results = collect_parallel(
+            tasks, max_workers=min(len(tasks), MAX_MOUNT_WORKERS), deadline=None
+        )
+        return _inventory(partitions, results)
+
+    async def aget_disk_inventory(
+        self,
+        mount_timeout: float | None = DEFAULT_MOUNT_TIMEOUT_SECONDS,
+        fields: Iterable[str] | None = None,
+    ) -> list[dict]:
+        partitions = self._partitions()
+        tasks = self._tasks(partitions, mount_timeout, _select(fields), run_async=True)
+        return _inventory(partitions, await acollect_parallel(tasks, deadline=None))
+
+
+class DiskStatsHistory:
+    """Remember the previous snapshot so counters can be turned into rates."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._previous: DiskStatsSnapshotDTO | None = None
+
+    def latest(self) -> DiskStatsSnapshotDTO | None:
+        return self._previous
+
+    def swap(self, snapshot: DiskStatsSnapshotDTO) -> DiskStatsSnapshotDTO | None:
+        with self._lock:
+            previous, self._previous = self._previous, snapshot
+            return previous
+
+
+def _io_info(
+    after: BlockDeviceStatsDTO, before: BlockDeviceStatsDTO, elapsed: float
+) -> dict:
+    reads, writes = after.reads - before.reads, after.writes - before.writes
+    read_ms, write_ms = after.read_ms - before.read_ms, after.write_ms - before.write_ms
+    return {
+        "read_iops": per_second(before.reads, after.reads, elapsed),
+        "write_iops": per_second(before.writes, after.writes, elapsed),
+        "read_bps": per_second(
+            before.read_sectors * SECTOR_BYTES,
+            after.read_sectors * SECTOR_BYTES,
+            elapsed,
+        ),
+        "write_bps": per_second(
+            before.write_sectors * SECTOR_BYTES,
+            after.write_sectors * SECTOR_BYTES,
+            elapsed,
+        ),
+        "read_await_ms": await_ms(read_ms, reads),
+        "write_await_ms": await_ms(write_ms, writes),
+        "await_ms": await_ms(read_ms + write_ms, reads + writes),
+        "queue_depth": queue_depth(after.weighted_ms - before.weighted_ms, elapsed),
+        "util_percent": utilization(after.io_ms - before.io_ms, elapsed),
+        "in_flight": after.in_flight,
+    }
+
+
+def _io_rates(snapshot: DiskStatsSnapshotDTO, previous: DiskStatsSnapshotDTO) -> dict:
+    elapsed = snapshot.timestamp - previous.timestamp
+    rates = {
+        name: (device, _io_info(device, before, elapsed))
+        for name, device in snapshot.devices.items()
+        if (before := previous.devices.get(name)) is not None
+    }
+    disks = {name: info for name, (device, info) in rates.items() if not device.parent}
+    for name, (device, info) in rates.items():
+        if device.parent in disks:
+            disks[device.parent].setdefault("partitions", {})[name] = info
+        elif device.parent:
+            disks[name] = info
+    return disks
+
+
+@dataclass(frozen=True)
+class DiskIOService:
+    probe: DiskIOProbePort
+    history: DiskStatsHistory = field(default_factory=DiskStatsHistory, compare=False)
+    clock: Callable[[], float] = field(default=time.monotonic, compare=False)
+
+    def _wait_time(self, interval: float) -> float:
+        """Return how long to sleep so the baseline is ``interval`` seconds old.
+
+        Without a baseline one is taken now. A call right after the previous
+        one (or another caller's) waits out the rest of the interval, since
+        a rate over a few milliseconds is mostly noise.
+        """
+        if (previous := self.history.latest()) is None:
+            self.history.swap(self.probe.snapshot())
+            return interval
+        return interval - (self.clock() - previous.timestamp)
+
+    def _rates(self) -> dict:
+        snapshot = self.probe.snapshot()
+        return _io_rates(snapshot, self.history.swap(snapshot))
+
+    def get_disk_io_info(self, interval: float = DEFAULT_IO_INTERVAL_SECONDS) -> dict:
+        """Return per-disk I/O rates since the previous call, with partitions nested.
+
+        Rates cover at least ``interval`` seconds: the first call takes a
+        baseline and waits, and a call that comes sooner sleeps for the rest.
+        """
+        if (wait := self._wait_time(interval)) > 0:
+            time.sleep(wait)
+        return self._rates()
+
+    async def aget_disk_io_info(
+        self, interval: float = DEFAULT_IO_INTERVAL_SECONDS
+    ) -> dict:
+        if (wait := self._wait_time(interval)) > 0:
+            await asyncio.sleep(wait)
+        return self._rates()
+
+
+def _sized(entries: tuple[tuple[str, int], ...]) -> list[dict]:
+    return [
+        {"path": path, "size": size, "size_str": disk_used_str(size)}
+        for path, size in entries
+    ]
+
+
+def _scan_info(scan: DiskScanDTO) -> dict:
+    return {
+        "path": scan.root,
+        "total": scan.total_bytes,
+        "total_str": disk_used_str(scan.total_bytes),
+        "directories": scan.directories,
+        "files": scan.files,
+        "largest_directories": _sized(scan.largest_directories),
+        "largest_files": _sized(scan.largest_files),
+        "errors": scan.errors,
+        "reused_directories": scan.reused,
+    }
+
+
+@dataclass(frozen=True)
+class DiskScanService:
+    scanner: DirectoryScanPort
+
+    def scan_disk_usage(self, path: str = "/", top: int = DEFAULT_SCAN_TOP) -> dict:
+        return _scan_info(self.scanner.scan(path, top=top))
+
+    async def ascan_disk_usage(
+        self, path: str = "/", top: int = DEFAULT_SCAN_TOP
+    ) -> dict:
+        return _scan_info(await asyncio.to_thread(self.scanner.scan, path, top=top))
@@ -1,3 +1,5 @@
+from .forecast import LinearTrend
+from .forecast import hours_to_full
 from .formatting import disk_avail
 from .formatting import disk_avail_str
 from .formatting import disk_percent
@@ -5,8 +7,17 @@ from .formatting import disk_physical
 from .formatting import disk_physical_str
 from .formatting import disk_used
 from .formatting import disk_used_str
+from .iostat import SECTOR_BYTES
+from .iostat import await_ms
+from .iostat import per_second
+from .iostat import queue_depth
+from .iostat import utilization
+from .mounts import is_real_mount
 
 __all__ = [
+    "SECTOR_BYTES",
+    "LinearTrend",
+    "await_ms",
     "disk_avail",
     "disk_avail_str",
     "disk_percent",
@@ -14,4 +25,9 @@ __all__ = [
     "disk_physical_str",
     "disk_used",
     "disk_used_str",
+    "hours_to_full",
+    "is_real_mount",
+    "per_second",
+    "queue_depth",
+    "utilization",
 ]
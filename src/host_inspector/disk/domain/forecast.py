@@ -0,0 +1,63 @@
+import math
+
+from host_inspector.utils.ringutils import RingBuffer
+
+MIN_TREND_POINTS = 2
+
+
+class LinearTrend:
+    """Least-squares line through the last ``capacity`` points, updated in O(1).
+
+    Running sums are adjusted as points enter and leave the window instead
+    of refitting the whole history. Callers should keep ``x`` and ``y`` near
+    zero (offsets from a first sample) to limit rounding, and the sums are
+    rebuilt from the window once per ``capacity`` evictions so that drift
+    cannot accumulate.
+    """
+
+    def __init__(self, capacity: int):
+        self._points = RingBuffer(capacity)
+        self._evictions = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        self._sx = self._sy = self._sxx = self._sxy = 0.0
+
+    def _add(self, x: float, y: float, sign: float) -> None:
+        self._sx += sign * x
+        self._sy += sign * y
+        self._sxx += sign * x * x
+        self._sxy += sign * x * y
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def add(self, x: float, y: float) -> None:
+        self._add(x, y, 1.0)
+        if (evicted := self._points.append(x, y)) is None:
+            return
+        self._add(*evicted, -1.0)
+        self._evictions += 1
+        if self._evictions >= self._points.capacity:
+            self._evictions = 0
+            self._reset()
+            for point in self._points.items():
+                self._add(*point, 1.0)
+
+    def slope(self) -> float | None:
+        """Return the fitted dy/dx, or None with fewer than two distinct x."""
+        n = len(self._points)
+        denominator = n * self._sxx - self._sx * self._sx
+        if n < MIN_TREND_POINTS or math.isclose(denominator, 0.0, abs_tol=1e-12):
+            return None
+        return (n * self._sxy - self._sx * self._sy) / denominator
+
+
+def hours_to_full(free_bytes: int, growth_bytes_per_hour: float | None) -> float | None:
+    """Return hours until ``free_bytes`` runs out at the given growth rate.
+
+    None when usage is flat or shrinking, since the volume never fills.
+    """
+    if growth_bytes_per_hour is None or growth_bytes_per_hour <= 0:
+        return None
+    return round(max(free_bytes, 0) / growth_bytes_per_hour, 2)
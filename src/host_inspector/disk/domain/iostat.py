@@ -0,0 +1,29 @@
+SECTOR_BYTES = 512
+
+
+def per_second(before: int, after: int, elapsed: float) -> float | None:
+    """Return the rate of a cumulative counter, or None if it went backwards."""
+    if elapsed <= 0 or after < before:
+        return None
+    return round((after - before) / elapsed, 2)
+
+
+def await_ms(delta_ms: int, delta_ios: int) -> float | None:
+    """Return the mean time per completed request, queueing included (iostat await)."""
+    if delta_ios <= 0:
+        return None if delta_ios < 0 else 0.0
+    return round(max(delta_ms, 0) / delta_ios, 2)
+
+
+def utilization(delta_io_ms: int, elapsed: float) -> float | None:
+    """Return the percent of ``elapsed`` the device was busy (iostat %util)."""
+    if elapsed <= 0 or delta_io_ms < 0:
+        return None
+    return round(min(delta_io_ms / (elapsed * 1000) * 100, 100.0), 2)
+
+
+def queue_depth(delta_weighted_ms: int, elapsed: float) -> float | None:
+    """Return the mean number of requests in flight (iostat aqu-sz)."""
+    if elapsed <= 0 or delta_weighted_ms < 0:
+        return None
+    return round(delta_weighted_ms / (elapsed * 1000), 2)
@@ -0,0 +1,37 @@
+# In-memory, kernel and image filesystems that never hold user data.
+PSEUDO_FILESYSTEMS = frozenset(
+    {
+        "autofs",
+        "binfmt_misc",
+        "bpf",
+        "cgroup",
+        "cgroup2",
+        "configfs",
+        "debugfs",
+        "devfs",
+        "devpts",
+        "devtmpfs",
+        "efivarfs",
+        "fusectl",
+        "hugetlbfs",
+        "mqueue",
+        "nsfs",
+        "overlay",
+        "proc",
+        "pstore",
+        "ramfs",
+        "securityfs",
+        "squashfs",
+        "sysfs",
+        "tmpfs",
+        "tracefs",
+    }
+)
+
+
+def is_real_mount(fstype: str, mountpoint: str) -> bool:
+    """Return whether a mount holds real data worth reporting.
+
+    The root filesystem always counts, even as the overlay of a container.
+    """
+    return mountpoint == "/" or fstype.lower() not in PSEUDO_FILESYSTEMS
@@ -1,3 +1,5 @@
+from .factory import build_disk_io_service
+from .factory import build_disk_scan_service
 from .factory import build_disk_service
 
-__all__ = ["build_disk_service"]
+__all__ = ["build_disk_io_service", "build_disk_scan_service", "build_disk_service"]
@@ -1,7 +1,31 @@
+import os
+import sys
+
+from host_inspector.disk.application.service import DiskIOService
+from host_inspector.disk.application.service import DiskScanService
 from host_inspector.disk.application.service import DiskService
+from host_inspector.utils.instrumentutils import instrument
 
+from .linux import DISKSTATS_PATH
+from .linux import ProcDiskstatsProbe
+from .probe import PsutilDiskIOProbe
 from .probe import PsutilDiskProbe
+from .scanner import DirectoryScanner
+from .statvfs import StatvfsDiskProbe
 
 
 def build_disk_service() -> DiskService:
-    return DiskService(probe=PsutilDiskProbe())
+    probe = StatvfsDiskProbe() if hasattr(os, "statvfs") else PsutilDiskProbe()
+    return DiskService(probe=instrument(probe, "disk.probe"))
+
+
+def build_disk_io_service() -> DiskIOService:
+    if sys.platform == "linux" and DISKSTATS_PATH.exists():
+        probe = ProcDiskstatsProbe()
+    else:
+        probe = PsutilDiskIOProbe()
+    return DiskIOService(probe=instrument(probe, "disk.io"))
+
+
+def build_disk_scan_service() -> DiskScanService:
+    return DiskScanService(scanner=instrument(DirectoryScanner(), "disk.scanner"))
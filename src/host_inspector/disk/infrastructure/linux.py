@@ -0,0 +1,76 @@
+import os
+import time
+from pathlib import Path
+
+from host_inspector.disk.application.dtos import BlockDeviceStatsDTO
+from host_inspector.disk.application.dtos import DiskStatsSnapshotDTO
+from host_inspector.utils.cacheutils import ttl_cache
+from host_inspector.utils.sysfsutils import read_text
+
+DISKSTATS_PATH = Path("/proc/diskstats")
+BLOCK_ROOT = Path("/sys/class/block")
+DISKSTATS_FIELDS = 14  # major, minor, name and the 11 counters since 2.6
+
+
+@ttl_cache("disk", ttl=60.0)
+def partition_parents(block_root: Path = BLOCK_ROOT) -> dict[str, str]:
+    """Map each partition to its disk, e.g. ``{"sda1": "sda", "nvme0n1p2": ...}``.
+
+    A partition's sysfs node sits inside its disk's node and has a
+    ``partition`` file. Cached briefly, since devices are rarely hot-plugged.
+    """
+    parents = {}
+    for entry in block_root.glob("*"):
+        if (entry / "partition").exists():
+            parents[entry.name] = Path(os.path.realpath(entry)).parent.name
+    return parents
+
+
+def parse_diskstats(
+    text: str, parents: dict[str, str] | None = None
+) -> dict[str, BlockDeviceStatsDTO]:
+    """Parse /proc/diskstats, skipping devices that never did any I/O."""
+    parents = parents or {}
+    devices = {}
+    for line in text.splitlines():
+        fields = line.split()
+        if len(fields) < DISKSTATS_FIELDS:
+            continue
+        try:
+            counters = [int(value) for value in fields[3:DISKSTATS_FIELDS]]
+        except ValueError:
+            continue
+        if not any(counters):
+            continue
+        name = fields[2]
+        reads, _, read_sectors, read_ms, writes, _, write_sectors, write_ms = counters[
+            :8
+        ]
+        in_flight, io_ms, weighted_ms = counters[8:]
+        devices[name] = BlockDeviceStatsDTO(
+            reads=reads,
+            read_sectors=read_sectors,
+            read_ms=read_ms,
+            writes=writes,
+            write_sectors=write_sectors,
+            write_ms=write_ms,
+            in_flight=in_flight,
+            io_ms=io_ms,
+            weighted_ms=weighted_ms,
+            parent=parents.get(name),
+        )
+    return devices
+
+
+class ProcDiskstatsProbe:
+    def __init__(self, path: Path = DISKSTATS_PATH, block_root: Path = BLOCK_ROOT):
+        self.path = path
+        self.block_root = block_root
+
+    def snapshot(self) -> DiskStatsSnapshotDTO:
+        timestamp = time.monotonic()
+        text = read_text(self.path) or ""
+        return DiskStatsSnapshotDTO(
+            timestamp=timestamp,
+            devices=parse_diskstats(text, partition_parents(self.block_root)),
+        )
@@ -1,6 +1,36 @@
+import time
+from pathlib import Path
+
 import psutil
 
+from host_inspector.disk.application.dtos import BlockDeviceStatsDTO
 from host_inspector.disk.application.dtos import DiskSnapshotDTO
+from host_inspector.disk.application.dtos import DiskStatsSnapshotDTO
+from host_inspector.disk.application.dtos import PartitionDTO
+from host_inspector.disk.domain import SECTOR_BYTES
+from host_inspector.utils.cacheutils import ttl_cache
+
+
+@ttl_cache("disk", ttl=60.0)
+def mount_types() -> dict[str, str]:
+    """Map every mount point to its filesystem type, from the mount table."""
+    return {part.mountpoint: part.fstype for part in psutil.disk_partitions(all=True)}
+
+
+def mount_point(path: str) -> str | None:
+    """Return the mount point of the filesystem holding ``path``."""
+    mounts = mount_types()
+    resolved = Path(path).resolve()
+    for candidate in (resolved, *resolved.parents):
+        if str(candidate) in mounts:
+            return str(candidate)
+    return None
+
+
+def filesystem_type(path: str) -> str | None:
+    """Return the type of the filesystem mounted at or above ``path``."""
+    mount = mount_point(path)
+    return mount_types()[mount] if mount is not None else None
 
 
 class PsutilDiskProbe:
@@ -12,3 +42,49 @@ class PsutilDiskProbe:
             free=disk.free,
             percent=disk.percent,
         )
+
+    def filesystem_type(self, path: str) -> str | None:
+        del path
+        return None
+
+    def mountpoint(self, path: str) -> str:
+        return mount_point(path) or path
+
+    def partitions(self) -> list[PartitionDTO]:
+        # Reads the mount table only (/proc/mounts, getfsstat); a hung
+        # network mount does not block this.
+        return [
+            PartitionDTO(
+                device=part.device,
+                mountpoint=part.mountpoint,
+                fstype=part.fstype,
+            )
+            for part in psutil.disk_partitions(all=False)
+        ]
+
+
+class PsutilDiskIOProbe:
+    """Per-disk counters from psutil where /proc/diskstats does not exist.
+
+    Queue depth is not reported, and platforms without ``busy_time`` report
+    zero utilization.
+    """
+
+    def snapshot(self) -> DiskStatsSnapshotDTO:
+        timestamp = time.monotonic()
+        counters = psutil.disk_io_counters(perdisk=True) or {}
+        return DiskStatsSnapshotDTO(
+            timestamp=timestamp,
+            devices={
+                name: BlockDeviceStatsDTO(
+                    reads=io.read_count,
+                    read_sectors=io.read_bytes // SECTOR_BYTES,
+                    read_ms=io.read_time,
+                    writes=io.write_count,
+                    write_sectors=io.write_bytes // SECTOR_BYTES,
+                    write_ms=io.write_time,
+                    io_ms=getattr(io, "busy_time", 0),
+                )
+                for name, io in counters.items()
+            },
+        )
@@ -0,0 +1,200 @@
+import heapq
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from dataclasses import dataclass
+from dataclasses import field
+from operator import itemgetter
+from pathlib import Path
+
+from host_inspector.disk.application.dtos import DiskScanDTO
+
+DEFAULT_SCAN_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class _Listing:
+    """What one ``scandir`` of a directory found, keyed by its mtime."""
+
+    mtime_ns: int
+    own_bytes: int  # the directory itself plus its singly-linked files
+    file_count: int
+    files: tuple[tuple[int, str], ...]  # this directory's largest files
+    linked: tuple[tuple[int, int], ...]  # (inode, bytes) of hard-linked files
+    subdirs: tuple[str, ...]
+
+
+@dataclass
+class _Walk:
+    top: int
+    own: dict[str, int] = field(default_factory=dict)
+    parents: dict[str, str] = field(default_factory=dict)
+    files: list[tuple[int, str]] = field(default_factory=list)
+    inodes: set[int] = field(default_factory=set)
+    file_count: int = 0
+    errors: int = 0
+    reused: int = 0
+
+    def add(self, path: str, listing: _Listing, cached: bool) -> None:
+        own = listing.own_bytes
+        for inode, size in listing.linked:
+            # Count a hard-linked file once, like du.
+            if inode not in self.inodes:
+                self.inodes.add(inode)
+                own += size
+        self.own[path] = own
+        self.file_count += listing.file_count
+        self.reused += cached
+        for item in listing.files:
+            _push(self.files, self.top, item)
+        for subdir in listing.subdirs:
+            self.parents[subdir] = path
+
+    def totals(self) -> dict[str, int]:
+        """Roll each directory's own bytes up into its ancestors, deepest first."""
+        totals = dict(self.own)
+        for path in sorted(totals, key=lambda p: p.count(os.sep), reverse=True):
+            if (parent := self.parents.get(path)) in totals:
+                totals[parent] += totals[path]
+        return totals
+
+
+def _allocated(stat: os.stat_result) -> int:
+    # Blocks actually used, like du; st_blocks is missing on Windows.
+    blocks = getattr(stat, "st_blocks", None)
+    return blocks * 512 if blocks is not None else stat.st_size
+
+
+def _push(heap: list, top: int, item: tuple[int, str]) -> None:
+    if len(heap) < top:
+        heapq.heappush(heap, item)
+    elif item > heap[0]:
+        heapq.heapreplace(heap, item)
+
+
+def _under(path: str, root: str) -> bool:
+    return path == root or path.startswith(root.rstrip(os.sep) + os.sep)
+
+
+class DirectoryScanner:
+    """Walk a tree with ``os.scandir`` on a thread pool, staying on one filesystem.
+
+    Each directory's listing is cached against its mtime. A rescan stats
+    every directory but reads (and stats the files of) only those whose
+    mtime changed. A directory's mtime moves when entries are created,
+    removed or renamed, not when an existing file grows, so in-place
+    growth is picked up once its directory changes or after ``forget()``.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_SCAN_WORKERS):
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._listings: dict[str, _Listing] = {}
+        self._top = 0
+
+    def forget(self) -> None:
+        with self._lock:
+            self._listings.clear()
+
+    def _list(self, path: str, dev: int, top: int) -> tuple[_Listing | None, bool]:
+        """Return the listing of ``path`` and whether it came from the cache.
+
+        The listing is None when ``path`` is another filesystem's mount point.
+        """
+        stat = Path(path).lstat()
+        if stat.st_dev != dev:
+            return None, False
+        with self._lock:
+            cached = self._listings.get(path)
+        if cached is not None and cached.mtime_ns == stat.st_mtime_ns:
+            return cached, True
+
+        files: list[tuple[int, str]] = []
+        linked, subdirs = [], []
+        own_bytes, file_count = _allocated(stat), 0
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        entry_stat = entry.stat(follow_symlinks=False)
+                        size = _allocated(entry_stat)
+                        if entry_stat.st_nlink > 1:
+                            linked.append((entry_stat.st_ino, size))
+                        else:
+                            own_bytes += size
+                        file_count += 1
+                        _push(files, top, (size, entry.path))
+                except OSError:
+                    continue
+        listing = _Listing(
+            mtime_ns=stat.st_mtime_ns,
+            own_bytes=own_bytes,
+            file_count=file_count,
+            files=tuple(files),
+            linked=tuple(linked),
+            subdirs=tuple(subdirs),
+        )
+        with self._lock:
+            self._listings[path] = listing
+        return listing, False
+
+    def _walk(self, root: str, dev: int, top: int) -> _Walk:
+        with self._lock:
+            if top > self._top:
+                # Cached listings only kept the old, smaller top-K of files.
+                self._listings.clear()
+                self._top = top
+            cache_top = self._top
+
+        walk = _Walk(top=top)
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="host-inspector-scan"
+        ) as pool:
+            pending: dict[Future, str] = {
+                pool.submit(self._list, root, dev, cache_top): root
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = pending.pop(future)
+                    try:
+                        listing, cached = future.result()
+                    except OSError:
+                        walk.errors += 1
+                        continue
+                    if listing is None:
+                        continue
+                    walk.add(path, listing, cached)
+                    for subdir in listing.subdirs:
+                        child = pool.submit(self._list, subdir, dev, cache_top)
+                        pending[child] = subdir
+
+        with self._lock:
+            # Drop listings of directories under root that no longer exist.
+            for path in [p for p in self._listings if _under(p, root)]:
+                if path not in walk.own:
+                    del self._listings[path]
+        return walk
+
+    def scan(self, root: str, top: int = 20) -> DiskScanDTO:
+        root = str(Path(root).resolve())
+        walk = self._walk(root, Path(root).stat().st_dev, top)
+        totals = walk.totals()
+        subdirs = ((path, size) for path, size in totals.items() if path != root)
+        return DiskScanDTO(
+            root=root,
+            total_bytes=totals.get(root, 0),
+            directories=len(walk.own),
+            files=walk.file_count,
+            largest_directories=tuple(heapq.nlargest(top, subdirs, key=itemgetter(1))),
+            largest_files=tuple(
+                (path, size) for size, path in sorted(walk.files, reverse=True)
+            ),
+            errors=walk.errors,
+            reused=walk.reused,
+        )
@@ -0,0 +1,54 @@
+import os
+
+from host_inspector.disk.application.dtos import DiskSnapshotDTO
+
+from .probe import PsutilDiskProbe
+from .probe import filesystem_type
+
+# statvfs f_flag bits worth reporting, by mount option name.
+MOUNT_FLAGS = tuple(
+    (name, bit)
+    for name, bit in (
+        ("ro", getattr(os, "ST_RDONLY", None)),
+        ("noatime", getattr(os, "ST_NOATIME", None)),
+        ("nodiratime", getattr(os, "ST_NODIRATIME", None)),
+        ("relatime", getattr(os, "ST_RELATIME", None)),
+        ("nosuid", getattr(os, "ST_NOSUID", None)),
+        ("nodev", getattr(os, "ST_NODEV", None)),
+        ("noexec", getattr(os, "ST_NOEXEC", None)),
+    )
+    if bit is not None
+)
+
+
+def mount_flags(f_flag: int) -> tuple[str, ...]:
+    return tuple(name for name, bit in MOUNT_FLAGS if f_flag & bit)
+
+
+class StatvfsDiskProbe(PsutilDiskProbe):
+    """Usage, inodes and mount flags from one ``os.statvfs`` call per path.
+
+    The filesystem type is looked up separately in the mount table, and only
+    when a caller asks for it.
+    """
+
+    def snapshot(self, path: str = "/") -> DiskSnapshotDTO:
+        st = os.statvfs(path)
+        total = st.f_blocks * st.f_frsize
+        used = (st.f_blocks - st.f_bfree) * st.f_frsize
+        # Like psutil and df: "free" is what unprivileged users can still
+        # write, and percent excludes the root-reserved blocks.
+        free = st.f_bavail * st.f_frsize
+        usable = used + free
+        return DiskSnapshotDTO(
+            total=total,
+            used=used,
+            free=free,
+            percent=round(used / usable * 100, 1) if usable else 0.0,
+            inodes_total=st.f_files,
+            inodes_free=st.f_ffree,
+            flags=mount_flags(st.f_flag),
+        )
+
+    def filesystem_type(self, path: str) -> str | None:
+        return filesystem_type(path)
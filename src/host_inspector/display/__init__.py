@@ -2,7 +2,7 @@ from functools import cache
 
 from .infrastructure import build_display_service
 
-__all__ = ["get_display_info"]
+__all__ = ["aget_display_info", "get_display_info"]
 
 
 @cache
@@ -12,3 +12,7 @@ def _get_display_service():
 
 def get_display_info() -> list[dict]:
     return _get_display_service().get_display_info()
+
+
+async def aget_display_info() -> list[dict]:
+    return await _get_display_service().aget_display_info()
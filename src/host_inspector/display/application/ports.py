@@ -6,3 +6,8 @@ from .dtos import DisplayCollectionDTO
 class DisplayCollectorPort(Protocol):
     def display_info(self) -> DisplayCollectionDTO:
         """Return display info for the current platform."""
+
+
+class AsyncDisplayCollectorPort(Protocol):
+    async def adisplay_info(self) -> DisplayCollectionDTO:
+        """Return display info without blocking."""
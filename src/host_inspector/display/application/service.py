@@ -9,3 +9,6 @@ class DisplayService:
 
     def get_display_info(self) -> list[dict]:
         return [item.to_dict() for item in self.collector.display_info().items]
+
+    async def aget_display_info(self) -> list[dict]:
+        return [item.to_dict() for item in (await self.collector.adisplay_info()).items]
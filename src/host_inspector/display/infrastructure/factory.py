@@ -2,6 +2,7 @@ import importlib
 import sys
 
 from host_inspector.display.application.service import DisplayService
+from host_inspector.utils.instrumentutils import instrument
 
 
 def build_display_service() -> DisplayService:
@@ -20,4 +21,4 @@ def build_display_service() -> DisplayService:
 
     collector_module = importlib.import_module(module_name)
     collector_cls = getattr(collector_module, class_name)
-    return DisplayService(collector=collector_cls())
+    return DisplayService(collector=instrument(collector_cls(), "display.collector"))
@@ -15,3 +15,6 @@ class LinuxDisplayCollector:
                 )
             ]
         )
+
+    async def adisplay_info(self) -> DisplayCollectionDTO:
+        return self.display_info()
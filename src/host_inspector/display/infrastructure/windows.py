@@ -106,3 +106,7 @@ class WindowsDisplayCollector:
             index += 1
 
         return DisplayCollectionDTO(items=output)
+
+    async def adisplay_info(self) -> DisplayCollectionDTO:
+        # EnumDisplay* are direct user32 calls; nothing to await.
+        return self.display_info()
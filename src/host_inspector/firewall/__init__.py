@@ -2,7 +2,12 @@ from functools import cache
 
 from .infrastructure import build_firewall_service
 
-__all__ = ["get_firewall_info", "is_firewall_enabled"]
+__all__ = [
+    "aget_firewall_info",
+    "ais_firewall_enabled",
+    "get_firewall_info",
+    "is_firewall_enabled",
+]
 
 
 @cache
@@ -26,3 +31,21 @@ def get_firewall_info(
 
 def is_firewall_enabled() -> bool:
     return _get_firewall_service().is_firewall_enabled()
+
+
+async def aget_firewall_info(
+    ports=None,
+    direction=None,
+    enabled_only: bool = False,
+    exclude_any_ports: bool = False,
+) -> dict:
+    return await _get_firewall_service().aget_firewall_info(
+        ports=ports,
+        direction=direction,
+        enabled_only=enabled_only,
+        exclude_any_ports=exclude_any_ports,
+    )
+
+
+async def ais_firewall_enabled() -> bool:
+    return await _get_firewall_service().ais_firewall_enabled()
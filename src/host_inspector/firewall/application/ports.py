@@ -16,3 +16,17 @@ class FirewallCollectorPort(Protocol):
         exclude_any_ports: bool = False,
     ) -> FirewallRulesDTO:
         """Return platform-specific firewall rules."""
+
+
+class AsyncFirewallCollectorPort(Protocol):
+    async def aenabled_status(self) -> FirewallStatusDTO:
+        """Return platform-specific enabled status without blocking."""
+
+    async def arules(
+        self,
+        ports=None,
+        direction=None,
+        enabled_only: bool = False,
+        exclude_any_ports: bool = False,
+    ) -> FirewallRulesDTO:
+        """Return platform-specific firewall rules without blocking."""
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+from .dtos import FirewallRulesDTO
 from .ports import FirewallCollectorPort
 
 
@@ -18,16 +19,37 @@ class FirewallService:
         exclude_any_ports: bool = False,
     ) -> dict:
         enabled = self.is_firewall_enabled()
+        rules = self.collector.rules(
+            ports=ports,
+            direction=direction,
+            enabled_only=enabled_only,
+            exclude_any_ports=exclude_any_ports,
+        )
+        return self._build_info(enabled, rules)
+
+    async def ais_firewall_enabled(self) -> bool:
+        return (await self.collector.aenabled_status()).overall
+
+    async def aget_firewall_info(
+        self,
+        ports=None,
+        direction=None,
+        enabled_only: bool = False,
+        exclude_any_ports: bool = False,
+    ) -> dict:
+        enabled = await self.ais_firewall_enabled()
+        rules = await self.collector.arules(
+            ports=ports,
+            direction=direction,
+            enabled_only=enabled_only,
+            exclude_any_ports=exclude_any_ports,
+        )
+        return self._build_info(enabled, rules)
+
+    @staticmethod
+    def _build_info(enabled: bool, rules: FirewallRulesDTO) -> dict:
         return {
             "enabled": enabled,
             "status": "ON" if enabled else "OFF",
-            "rules": [
-                rule.data
-                for rule in self.collector.rules(
-                    ports=ports,
-                    direction=direction,
-                    enabled_only=enabled_only,
-                    exclude_any_ports=exclude_any_ports,
-                ).items
-            ],
+            "rules": [rule.data for rule in rules.items],
         }
@@ -2,6 +2,7 @@ import importlib
 import sys
 
 from host_inspector.firewall.application.service import FirewallService
+from host_inspector.utils.instrumentutils import instrument
 
 
 def build_firewall_service() -> FirewallService:
@@ -20,4 +21,4 @@ def build_firewall_service() -> FirewallService:
 
     collector_module = importlib.import_module(module_name)
     collector_cls = getattr(collector_module, class_name)
-    return FirewallService(collector=collector_cls())
+    return FirewallService(collector=instrument(collector_cls(), "firewall.collector"))
@@ -1,35 +1,55 @@
 import logging
-import subprocess
 
 from host_inspector.firewall.application.dtos import FirewallRuleDTO
 from host_inspector.firewall.application.dtos import FirewallRulesDTO
 from host_inspector.firewall.application.dtos import FirewallStatusDTO
 from host_inspector.firewall.domain import parse_linux_firewall_output
+from host_inspector.utils.commandutils import COMMAND_ERRORS
+from host_inspector.utils.commandutils import arun_command
+from host_inspector.utils.commandutils import run_command
 
 logger = logging.getLogger(__name__)
 
+STATUS_COMMANDS = {
+    "ufw": ["sudo", "-n", "ufw", "status"],
+}
+RULES_COMMAND = ["sudo", "-n", "ufw", "status", "verbose"]
+RULES_TIMEOUT_SECONDS = 30
+
+
+def _parse_status(output: str) -> FirewallStatusDTO:
+    output = output.strip().lower()
+    if "inactive" in output:
+        return FirewallStatusDTO(overall=False)
+    return FirewallStatusDTO(overall=bool("active" in output or "running" in output))
+
+
+def _parse_rules(
+    output: str,
+    ports=None,
+    enabled_only: bool = False,
+    exclude_any_ports: bool = False,
+) -> FirewallRulesDTO:
+    return FirewallRulesDTO(
+        items=[
+            FirewallRuleDTO(data=rule)
+            for rule in parse_linux_firewall_output(
+                output,
+                ports_filter=ports,
+                enabled_only=enabled_only,
+                exclude_any_ports=exclude_any_ports,
+            )
+        ]
+    )
+
 
 class LinuxFirewallCollector:
     def enabled_status(self) -> FirewallStatusDTO:
-        commands = {
-            "ufw": "sudo ufw status",
-        }
-        for command in commands.values():
+        for command in STATUS_COMMANDS.values():
             try:
-                process = subprocess.run(  # noqa: S602
-                    command,
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                output = process.stdout.strip().lower()
-                if "inactive" in output:
-                    return FirewallStatusDTO(overall=False)
-                return FirewallStatusDTO(
-                    overall=bool("active" in output or "running" in output)
-                )
-            except (subprocess.CalledProcessError, FileNotFoundError):
+                process = run_command(command)
+                return _parse_status(process.stdout)
+            except COMMAND_ERRORS:
                 pass
         return FirewallStatusDTO(overall=False)
 
@@ -41,27 +61,33 @@ class LinuxFirewallCollector:
         exclude_any_ports: bool = False,
     ) -> FirewallRulesDTO:
         del direction
-        command = ["sudo", "ufw", "status", "verbose"]
         try:
-            result = subprocess.run(  # noqa: S603
-                command,
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                check=True,
-                timeout=30,
-            )
-            return FirewallRulesDTO(
-                items=[
-                    FirewallRuleDTO(data=rule)
-                    for rule in parse_linux_firewall_output(
-                        result.stdout,
-                        ports_filter=ports,
-                        enabled_only=enabled_only,
-                        exclude_any_ports=exclude_any_ports,
-                    )
-                ]
-            )
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
-            logger.warning("Error executing command %s", command)
+            result = run_command(RULES_COMMAND, timeout=RULES_TIMEOUT_SECONDS)
+            return _parse_rules(result.stdout, ports, enabled_only, exclude_any_ports)
+        except COMMAND_ERRORS:
+            logger.warning("Error executing command %s", RULES_COMMAND)
+            return FirewallRulesDTO(items=[])
+
+    async def aenabled_status(self) -> FirewallStatusDTO:
+        for command in STATUS_COMMANDS.values():
+            try:
+                process = await arun_command(command)
+                return _parse_status(process.stdout)
+            except COMMAND_ERRORS:
+                pass
+        return FirewallStatusDTO(overall=False)
+
+    async def arules(
+        self,
+        ports=None,
+        direction=None,
+        enabled_only: bool = False,
+        exclude_any_ports: bool = False,
+    ) -> FirewallRulesDTO:
+        del direction
+        try:
+            result = await arun_command(RULES_COMMAND, timeout=RULES_TIMEOUT_SECONDS)
+            return _parse_rules(result.stdout, ports, enabled_only, exclude_any_ports)
+        except COMMAND_ERRORS:
+            logger.warning("Error executing command %s", RULES_COMMAND)
             return FirewallRulesDTO(items=[])
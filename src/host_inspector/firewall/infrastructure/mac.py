@@ -15,3 +15,20 @@ class MacFirewallCollector:
     ) -> FirewallRulesDTO:
         del ports, direction, enabled_only, exclude_any_ports
         return FirewallRulesDTO(items=[])
+
+    async def aenabled_status(self) -> FirewallStatusDTO:
+        return self.enabled_status()
+
+    async def arules(
+        self,
+        ports=None,
+        direction=None,
+        enabled_only: bool = False,
+        exclude_any_ports: bool = False,
+    ) -> FirewallRulesDTO:
+        return self.rules(
+            ports=ports,
+            direction=direction,
+            enabled_only=enabled_only,
+            exclude_any_ports=exclude_any_ports,
+        )
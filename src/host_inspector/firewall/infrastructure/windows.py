@@ -1,40 +1,67 @@
 import logging
 import re
-import subprocess
 
 from host_inspector.firewall.application.dtos import FirewallRuleDTO
 from host_inspector.firewall.application.dtos import FirewallRulesDTO
 from host_inspector.firewall.application.dtos import FirewallStatusDTO
 from host_inspector.firewall.domain import parse_windows_firewall_output
+from host_inspector.utils.commandutils import COMMAND_ERRORS
+from host_inspector.utils.commandutils import arun_command
+from host_inspector.utils.commandutils import run_command
 
 logger = logging.getLogger(__name__)
 
+STATUS_COMMAND = ["netsh", "advfirewall", "show", "allprofiles"]
+RULES_COMMAND = ["netsh", "advfirewall", "firewall", "show", "rule", "name=all"]
+RULES_TIMEOUT_SECONDS = 30
+
+
+def _parse_status(output: str) -> FirewallStatusDTO:
+    profiles = {"domain": False, "private": False, "public": False}
+    for profile in profiles:
+        match = re.search(
+            rf"{profile}\s*profile settings:.*?state\s*on",
+            output,
+            re.IGNORECASE | re.DOTALL,
+        )
+        profiles[profile] = bool(match)
+    profiles["overall"] = any(profiles.values())
+    return FirewallStatusDTO(overall=any(profiles.values()))
+
+
+def _rules_command(direction=None) -> list[str]:
+    command = list(RULES_COMMAND)
+    if direction:
+        command.extend([f"dir={direction}"])
+    return command
+
+
+def _parse_rules(
+    output: str,
+    ports=None,
+    enabled_only: bool = False,
+    exclude_any_ports: bool = False,
+) -> FirewallRulesDTO:
+    return FirewallRulesDTO(
+        items=[
+            FirewallRuleDTO(data=rule)
+            for rule in parse_windows_firewall_output(
+                output,
+                ports_filter=ports,
+                enabled_only=enabled_only,
+                exclude_any_ports=exclude_any_ports,
+            )
+        ]
+    )
+
 
 class WindowsFirewallCollector:
     def enabled_status(self) -> FirewallStatusDTO:
-        command = ["netsh", "advfirewall", "show", "allprofiles"]
         try:
-            result = subprocess.run(  # noqa: S603
-                command,
-                capture_output=True,
-                text=True,
-                check=True,
-                encoding="utf-8",
-            )
-            output = result.stdout
-        except subprocess.CalledProcessError:
+            result = run_command(STATUS_COMMAND)
+        except COMMAND_ERRORS:
             return FirewallStatusDTO(overall=False)
-
-        profiles = {"domain": False, "private": False, "public": False}
-        for profile in profiles:
-            match = re.search(
-                rf"{profile}\s*profile settings:.*?state\s*on",
-                output,
-                re.IGNORECASE | re.DOTALL,
-            )
-            profiles[profile] = bool(match)
-        profiles["overall"] = any(profiles.values())
-        return FirewallStatusDTO(overall=any(profiles.values()))
+        return _parse_status(result.stdout)
 
     def rules(
         self,
@@ -43,30 +70,34 @@ class WindowsFirewallCollector:
         enabled_only: bool = False,
         exclude_any_ports: bool = False,
     ) -> FirewallRulesDTO:
-        command = ["netsh", "advfirewall", "firewall", "show", "rule", "name=all"]
-        if direction:
-            command.extend([f"dir={direction}"])
-
         try:
-            result = subprocess.run(  # noqa: S603
-                command,
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                check=True,
-                timeout=30,
+            result = run_command(
+                _rules_command(direction), timeout=RULES_TIMEOUT_SECONDS
             )
-            return FirewallRulesDTO(
-                items=[
-                    FirewallRuleDTO(data=rule)
-                    for rule in parse_windows_firewall_output(
-                        result.stdout,
-                        ports_filter=ports,
-                        enabled_only=enabled_only,
-                        exclude_any_ports=exclude_any_ports,
-                    )
-                ]
+            return _parse_rules(result.stdout, ports, enabled_only, exclude_any_ports)
+        except COMMAND_ERRORS:
+            logger.exception("Error executing command")
+            return FirewallRulesDTO(items=[])
+
+    async def aenabled_status(self) -> FirewallStatusDTO:
+        try:
+            result = await arun_command(STATUS_COMMAND)
+        except COMMAND_ERRORS:
+            return FirewallStatusDTO(overall=False)
+        return _parse_status(result.stdout)
+
+    async def arules(
+        self,
+        ports=None,
+        direction=None,
+        enabled_only: bool = False,
+        exclude_any_ports: bool = False,
+    ) -> FirewallRulesDTO:
+        try:
+            result = await arun_command(
+                _rules_command(direction), timeout=RULES_TIMEOUT_SECONDS
             )
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+            return _parse_rules(result.stdout, ports, enabled_only, exclude_any_ports)
+        except COMMAND_ERRORS:
             logger.exception("Error executing command")
             return FirewallRulesDTO(items=[])
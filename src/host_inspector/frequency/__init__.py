@@ -0,0 +1,24 @@
+from functools import cache
+
+from .infrastructure import build_frequency_service
+
+__all__ = ["aget_frequency_info", "get_frequency_info"]
+
+
+@cache
+def _get_frequency_service():
+    return build_frequency_service()
+
+
+def get_frequency_info(sample_load: bool = False) -> dict:
+    """Return cpufreq policies, per-core frequencies and throttled CPUs.
+
+    Never blocks unless ``sample_load`` is set and the background CPU
+    sampler is not running; the load is then sampled for 0.3 s.
+    """
+    return _get_frequency_service().get_frequency_info(sample_load=sample_load)
+
+
+async def aget_frequency_info(sample_load: bool = False) -> dict:
+    """Return frequency info as a dict without blocking the event loop."""
+    return await _get_frequency_service().aget_frequency_info(sample_load=sample_load)
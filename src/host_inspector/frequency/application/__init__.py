@@ -0,0 +1,3 @@
+from .service import FrequencyService
+
+__all__ = ["FrequencyService"]
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PolicyLimitsDTO:
+    """Hardware limits of a cpufreq policy; they do not change at runtime."""
+
+    cpus: tuple[int, ...]
+    min_mhz: float | None = None
+    max_mhz: float | None = None
+    driver: str | None = None
+
+
+@dataclass(frozen=True)
+class PolicyStateDTO:
+    current_mhz: float | None = None
+    scaling_min_mhz: float | None = None
+    scaling_max_mhz: float | None = None
+    governor: str | None = None
+    energy_performance_preference: str | None = None
@@ -0,0 +1,29 @@
+from typing import Protocol
+
+from .dtos import PolicyLimitsDTO
+from .dtos import PolicyStateDTO
+
+
+class FrequencyProbePort(Protocol):
+    def policies(self) -> list[str]:
+        """Return the frequency policy names, e.g. ``["policy0", "policy4"]``."""
+
+    def limits(self, policy: str) -> PolicyLimitsDTO:
+        """Return the static limits and CPUs of a policy."""
+
+    def state(self, policy: str) -> PolicyStateDTO:
+        """Return the current frequency, governor and preference of a policy."""
+
+    def core_mhz(self) -> dict[int, float]:
+        """Return measured per-CPU frequencies, or {} if only policies report one."""
+
+
+class CoreLoadPort(Protocol):
+    def latest_busy_percent(self) -> list[float] | None:
+        """Return per-CPU busy percent from a background sample, if there is one."""
+
+    def busy_percent(self) -> list[float]:
+        """Return busy percent for each logical CPU, sampling if needed."""
+
+    async def abusy_percent(self) -> list[float]:
+        """Return busy percent for each logical CPU without blocking."""
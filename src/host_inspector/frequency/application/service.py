@@ -0,0 +1,90 @@
+import asyncio
+from dataclasses import dataclass
+
+from host_inspector.frequency.domain import is_capped
+from host_inspector.frequency.domain import slow_cpus
+from host_inspector.frequency.domain import throttled_cpus
+
+from .ports import CoreLoadPort
+from .ports import FrequencyProbePort
+
+
+def _throttled(
+    slow: list[int], capped: set[int], busy: list[float] | None
+) -> list[int]:
+    # Without a load sample, a slow CPU counts as throttled when its policy
+    # is capped below the hardware maximum.
+    if busy is None:
+        return [cpu for cpu in slow if cpu in capped]
+    return throttled_cpus(slow, busy)
+
+
+@dataclass(frozen=True)
+class FrequencyService:
+    probe: FrequencyProbePort
+    load: CoreLoadPort
+
+    def _read_policies(
+        self,
+    ) -> tuple[list[dict], dict[int, float | None], list[int], set[int]]:
+        policies = []
+        core_mhz: dict[int, float | None] = {}
+        core_max_mhz: dict[int, float | None] = {}
+        capped: set[int] = set()
+        for name in self.probe.policies():
+            limits = self.probe.limits(name)
+            state = self.probe.state(name)
+            policies.append(
+                {
+                    "policy": name,
+                    "cpus": list(limits.cpus),
+                    "driver": limits.driver,
+                    "governor": state.governor,
+                    "energy_performance_preference": (
+                        state.energy_performance_preference
+                    ),
+                    "min_mhz": limits.min_mhz,
+                    "max_mhz": limits.max_mhz,
+                    "scaling_min_mhz": state.scaling_min_mhz,
+                    "scaling_max_mhz": state.scaling_max_mhz,
+                    "current_mhz": state.current_mhz,
+                }
+            )
+            for cpu in limits.cpus:
+                core_mhz[cpu] = state.current_mhz
+                core_max_mhz[cpu] = limits.max_mhz
+            if is_capped(state.scaling_max_mhz, limits.max_mhz):
+                capped.update(limits.cpus)
+        core_mhz.update(self.probe.core_mhz())
+        return policies, core_mhz, slow_cpus(core_mhz, core_max_mhz), capped
+
+    @staticmethod
+    def _build_info(
+        policies: list[dict], core_mhz: dict[int, float | None], throttled: list[int]
+    ) -> dict:
+        return {
+            "policies": policies,
+            "per_core_mhz": dict(sorted(core_mhz.items())),
+            "throttled": throttled,
+        }
+
+    def get_frequency_info(self, sample_load: bool = False) -> dict:
+        """Return per-policy and per-core frequencies.
+
+        ``throttled`` lists busy CPUs running well below their maximum, with
+        the load taken from the background CPU sampler. Without one it lists
+        slow CPUs whose policy is capped below the hardware maximum, unless
+        ``sample_load`` asks for a blocking per-core sample instead.
+        """
+        policies, core_mhz, slow, capped = self._read_policies()
+        busy = self.load.latest_busy_percent() if slow else None
+        if busy is None and slow and sample_load:
+            busy = self.load.busy_percent()
+        return self._build_info(policies, core_mhz, _throttled(slow, capped, busy))
+
+    async def aget_frequency_info(self, sample_load: bool = False) -> dict:
+        policies, core_mhz, slow, capped = await asyncio.to_thread(self._read_policies)
+        busy = self.load.latest_busy_percent() if slow else None
+        if busy is None and slow and sample_load:
+            busy = await self.load.abusy_percent()
+        return self._build_info(policies, core_mhz, _throttled(slow, capped, busy))
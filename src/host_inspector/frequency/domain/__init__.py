@@ -0,0 +1,6 @@
+from .throttling import is_capped
+from .throttling import khz_to_mhz
+from .throttling import slow_cpus
+from .throttling import throttled_cpus
+
+__all__ = ["is_capped", "khz_to_mhz", "slow_cpus", "throttled_cpus"]
@@ -0,0 +1,40 @@
+# A core is "slow" below this fraction of its maximum frequency and "loaded"
+# at or above this busy percent; slow and loaded together means throttled.
+SLOW_RATIO = 0.7
+BUSY_THRESHOLD_PERCENT = 80.0
+
+
+def khz_to_mhz(khz: float | None) -> float | None:
+    return None if khz is None else round(khz / 1000, 1)
+
+
+def is_capped(scaling_max_mhz: float | None, max_mhz: float | None) -> bool:
+    """Return whether a policy's scaling cap sits below the hardware maximum.
+
+    Thermal and power daemons throttle by lowering ``scaling_max_freq``.
+    """
+    return bool(scaling_max_mhz and max_mhz and scaling_max_mhz < max_mhz)
+
+
+def slow_cpus(
+    core_mhz: dict[int, float | None],
+    core_max_mhz: dict[int, float | None],
+    ratio: float = SLOW_RATIO,
+) -> list[int]:
+    """Return the CPUs whose current frequency is below ``ratio`` of their max."""
+    return [
+        cpu
+        for cpu, mhz in sorted(core_mhz.items())
+        if mhz is not None
+        and (max_mhz := core_max_mhz.get(cpu))
+        and mhz < max_mhz * ratio
+    ]
+
+
+def throttled_cpus(
+    candidates: list[int],
+    busy: list[float],
+    threshold: float = BUSY_THRESHOLD_PERCENT,
+) -> list[int]:
+    """Return the candidate CPUs that are busy enough to want full speed."""
+    return [cpu for cpu in candidates if cpu < len(busy) and busy[cpu] >= threshold]
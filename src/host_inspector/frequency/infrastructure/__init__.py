@@ -0,0 +1,3 @@
+from .factory import build_frequency_service
+
+__all__ = ["build_frequency_service"]
@@ -0,0 +1,21 @@
+import sys
+
+from host_inspector.frequency.application.service import FrequencyService
+from host_inspector.utils.instrumentutils import instrument
+
+from .linux import SysfsFrequencyProbe
+from .linux import has_cpufreq
+from .load import PsutilCoreLoad
+from .probe import PsutilFrequencyProbe
+
+
+def build_frequency_service() -> FrequencyService:
+    """Read cpufreq from sysfs on Linux, falling back to psutil elsewhere."""
+    if sys.platform == "linux" and has_cpufreq():
+        probe = SysfsFrequencyProbe()
+    else:
+        probe = PsutilFrequencyProbe()
+    return FrequencyService(
+        probe=instrument(probe, "frequency.probe"),
+        load=instrument(PsutilCoreLoad(), "frequency.load"),
+    )
@@ -0,0 +1,88 @@
+from pathlib import Path
+
+from host_inspector.frequency.application.dtos import PolicyLimitsDTO
+from host_inspector.frequency.application.dtos import PolicyStateDTO
+from host_inspector.frequency.domain import khz_to_mhz
+from host_inspector.utils.cacheutils import ttl_cache
+from host_inspector.utils.sysfsutils import read_cpuinfo
+from host_inspector.utils.sysfsutils import read_text
+
+CPUFREQ_ROOT = Path("/sys/devices/system/cpu/cpufreq")
+
+
+def _read(path: Path) -> str | None:
+    if (text := read_text(path)) is None:
+        return None
+    return text.strip() or None
+
+
+def _read_khz(path: Path) -> float | None:
+    try:
+        return float(_read(path) or "")
+    except ValueError:
+        return None
+
+
+def _policy_number(path: Path) -> int:
+    return int(path.name.removeprefix("policy") or 0)
+
+
+@ttl_cache("frequency")
+def _policies(root: Path) -> list[str]:
+    return [path.name for path in sorted(root.glob("policy*"), key=_policy_number)]
+
+
+@ttl_cache("frequency")
+def _policy_limits(root: Path, policy: str) -> PolicyLimitsDTO:
+    path = root / policy
+    cpus = _read(path / "related_cpus") or _read(path / "affected_cpus") or ""
+    return PolicyLimitsDTO(
+        cpus=tuple(int(cpu) for cpu in cpus.split()),
+        min_mhz=khz_to_mhz(_read_khz(path / "cpuinfo_min_freq")),
+        max_mhz=khz_to_mhz(_read_khz(path / "cpuinfo_max_freq")),
+        driver=_read(path / "scaling_driver"),
+    )
+
+
+def has_cpufreq(root: Path = CPUFREQ_ROOT) -> bool:
+    # Containers and some VMs expose an empty cpufreq directory.
+    return any(root.glob("policy*"))
+
+
+class SysfsFrequencyProbe:
+    """Read cpufreq policies from sysfs; the static limits are read once."""
+
+    def __init__(self, root: Path = CPUFREQ_ROOT):
+        self.root = root
+
+    def policies(self) -> list[str]:
+        return _policies(self.root)
+
+    def limits(self, policy: str) -> PolicyLimitsDTO:
+        return _policy_limits(self.root, policy)
+
+    def state(self, policy: str) -> PolicyStateDTO:
+        path = self.root / policy
+        current = _read_khz(path / "scaling_cur_freq")
+        if current is None:
+            # Only readable by root on some drivers.
+            current = _read_khz(path / "cpuinfo_cur_freq")
+        return PolicyStateDTO(
+            current_mhz=khz_to_mhz(current),
+            scaling_min_mhz=khz_to_mhz(_read_khz(path / "scaling_min_freq")),
+            scaling_max_mhz=khz_to_mhz(_read_khz(path / "scaling_max_freq")),
+            governor=_read(path / "scaling_governor"),
+            energy_performance_preference=_read(path / "energy_performance_preference"),
+        )
+
+    def core_mhz(self) -> dict[int, float]:
+        # Policies often span a cluster; x86 also reports each core's measured
+        # clock in /proc/cpuinfo.
+        cores = {}
+        for index, processor in enumerate(read_cpuinfo().processors):
+            try:
+                cpu = int(processor.get("processor", index))
+                cores[cpu] = round(float(processor["cpu MHz"]), 1)
+            except (KeyError, ValueError):
+                continue
+        return cores
@@ -0,0 +1,25 @@
+from host_inspector.cpu.infrastructure.metrics import PsutilCPUMetrics
+from host_inspector.cpu.infrastructure.sampler import get_cpu_sampler
+
+
+class PsutilCoreLoad:
+    """Per-CPU busy percent from the CPU subsystem's per-core sample.
+
+    Shares the process-wide CPU sampler, so a running sampler answers
+    without blocking.
+    """
+
+    def __init__(self, metrics: PsutilCPUMetrics | None = None):
+        self.metrics = metrics or PsutilCPUMetrics(sampler=get_cpu_sampler())
+
+    def latest_busy_percent(self) -> list[float] | None:
+        sampler = self.metrics.sampler
+        if sampler is None or (usage := sampler.latest_per_core()) is None:
+            return None
+        return usage.busy.tolist()
+
+    def busy_percent(self) -> list[float]:
+        return self.metrics.per_core_usage().busy.tolist()
+
+    async def abusy_percent(self) -> list[float]:
+        return (await self.metrics.aper_core_usage()).busy.tolist()
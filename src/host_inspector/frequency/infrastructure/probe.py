@@ -0,0 +1,41 @@
+import psutil
+
+from host_inspector.frequency.application.dtos import PolicyLimitsDTO
+from host_inspector.frequency.application.dtos import PolicyStateDTO
+from host_inspector.utils.cacheutils import ttl_cache
+
+POLICY_NAME = "cpu"
+
+
+def _mhz(value: float | None) -> float | None:
+    return round(value, 1) if value else None
+
+
+@ttl_cache("frequency")
+def _psutil_limits() -> PolicyLimitsDTO:
+    freq = psutil.cpu_freq()
+    return PolicyLimitsDTO(
+        cpus=tuple(range(psutil.cpu_count() or 0)),
+        min_mhz=_mhz(freq.min) if freq else None,
+        max_mhz=_mhz(freq.max) if freq else None,
+    )
+
+
+class PsutilFrequencyProbe:
+    """Fallback for hosts without cpufreq: one policy covering every CPU."""
+
+    def policies(self) -> list[str]:
+        return [POLICY_NAME]
+
+    def limits(self, policy: str) -> PolicyLimitsDTO:
+        return _psutil_limits()
+
+    def state(self, policy: str) -> PolicyStateDTO:
+        freq = psutil.cpu_freq()
+        return PolicyStateDTO(current_mhz=_mhz(freq.current) if freq else None)
+
+    def core_mhz(self) -> dict[int, float]:
+        per_cpu = psutil.cpu_freq(percpu=True) or []
+        if len(per_cpu) != len(_psutil_limits().cpus):
+            return {}
+        return {cpu: freq.current for cpu, freq in enumerate(per_cpu)}
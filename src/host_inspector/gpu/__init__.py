@@ -2,7 +2,7 @@ from functools import cache
 
 from .infrastructure import build_gpu_service
 
-__all__ = ["get_gpu_info"]
+__all__ = ["aget_gpu_info", "get_gpu_info"]
 
 
 @cache
@@ -12,3 +12,7 @@ def _get_gpu_service():
 
 def get_gpu_info() -> dict | list[dict]:
     return _get_gpu_service().get_gpu_info()
+
+
+async def aget_gpu_info() -> dict | list[dict]:
+    return await _get_gpu_service().aget_gpu_info()
@@ -6,3 +6,8 @@ from .dtos import GPUPayloadDTO
 class GPUCollectorPort(Protocol):
     def gpu_info(self) -> GPUPayloadDTO:
         """Return GPU info payload for the current platform."""
+
+
+class AsyncGPUCollectorPort(Protocol):
+    async def agpu_info(self) -> GPUPayloadDTO:
+        """Return GPU info payload without blocking."""
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+from .dtos import GPUPayloadDTO
 from .ports import GPUCollectorPort
 
 
@@ -9,7 +10,14 @@ class GPUService:
 
     def get_gpu_info(self) -> dict | list[dict]:
         """Return GPU info payload from the collector."""
-        payload = self.collector.gpu_info()
+        return self._build_info(self.collector.gpu_info())
+
+    async def aget_gpu_info(self) -> dict | list[dict]:
+        """Return GPU info payload from the collector's async `agpu_info`."""
+        return self._build_info(await self.collector.agpu_info())
+
+    @staticmethod
+    def _build_info(payload: GPUPayloadDTO) -> dict | list[dict]:
         adapters = [adapter.to_dict() for adapter in payload.adapters]
         if payload.as_list:
             return adapters
@@ -2,6 +2,7 @@ import importlib
 import sys
 
 from host_inspector.gpu.application.service import GPUService
+from host_inspector.utils.instrumentutils import instrument
 
 
 def build_gpu_service() -> GPUService:
@@ -21,4 +22,4 @@ def build_gpu_service() -> GPUService:
 
     collector_module = importlib.import_module(module_name)
     collector_cls = getattr(collector_module, class_name)
-    return GPUService(collector=collector_cls())
+    return GPUService(collector=instrument(collector_cls(), "gpu.collector"))
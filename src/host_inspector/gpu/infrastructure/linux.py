@@ -1,113 +1,156 @@
+import asyncio
 import re
 import shlex
-import subprocess
-from functools import cache
 
 from host_inspector.gpu.application.dtos import GPUInfoDTO
 from host_inspector.gpu.application.dtos import GPUPayloadDTO
+from host_inspector.utils.cacheutils import ttl_cache
+from host_inspector.utils.commandutils import COMMAND_ERRORS
+from host_inspector.utils.commandutils import arun_command
+from host_inspector.utils.commandutils import run_command
+from host_inspector.utils.sysfsutils import read_devicetree
 
+# Resolution changes with monitor hot-plug; model/VRAM are fixed per boot.
+RESOLUTION_TTL_SECONDS = 30.0
 
-@cache
+CONFIG_COMMAND = "vcgencmd get_config int"
+GLXINFO_COMMAND = [
+    "/usr/bin/bash",
+    "-c",
+    'DISPLAY=:0 glxinfo | grep "OpenGL renderer"',
+]
+VRAM_COMMAND = "vcgencmd get_mem gpu"
+RESOLUTION_COMMAND = "xrandr -display :0.0"
+
+MODEL_MAP = {
+    "bcm2835": "Broadcom VideoCore IV",
+    "bcm2836": "Broadcom VideoCore IV",
+    "bcm2837": "Broadcom VideoCore IV",
+    "bcm2711": "Broadcom VideoCore VI",
+    "bcm2710A1": "Broadcom VideoCore VI",
+}
+
+
+def _run(args: list[str]) -> str:
+    proc = run_command(args)
+    return proc.stdout.strip()
+
+
+async def _arun(args: list[str]) -> str:
+    return (await arun_command(args)).stdout.strip()
+
+
+def _devicetree_model() -> str | None:
+    """Map the devicetree GPU node to a model; None when there is no such node."""
+    compatible = read_devicetree("gpu/compatible")
+    if compatible is None:
+        return None
+    for model_key, model in MODEL_MAP.items():
+        if any(model_key in value for value in compatible):
+            return model
+    return "Unknown GPU Model"
+
+
+def _parse_glxinfo(result: str) -> str:
+    return result.split(":")[1].strip()
+
+
+def _parse_vram(result: str) -> str:
+    return result.replace("gpu=", "").replace("M", " MB")
+
+
+def _parse_resolution(result: str) -> str:
+    regex = r"current (\d+) x (\d+)"
+    if match := re.search(regex, result):
+        return f"{match[1]} x {match[2]}"
+    return "--"
+
+
+def _parse_refresh_rate(result: str | None) -> str:
+    if result:
+        for line in result.splitlines():
+            if line.startswith("lcd_framerate="):
+                return f"{int(line.split('=')[1])} Hz"
+    return "--"
+
+
+@ttl_cache("gpu")
 def _get_gpu():
     """Safely get GPU."""
     try:
-        cmd = "vcgencmd get_config int"
-        proc = subprocess.run(  # noqa: S603
-            shlex.split(cmd),
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        return proc.stdout.strip()
-    except (FileNotFoundError, subprocess.CalledProcessError):
+        return _run(shlex.split(CONFIG_COMMAND))
+    except COMMAND_ERRORS:
         return None
 
 
-@cache
+@ttl_cache("gpu", name="get_gpu")
+async def _aget_gpu():
+    try:
+        return await _arun(shlex.split(CONFIG_COMMAND))
+    except COMMAND_ERRORS:
+        return None
+
+
+@ttl_cache("gpu")
 def _get_model() -> str:
     """Get GPU chipset model."""
-    model_map = {
-        "bcm2835": "Broadcom VideoCore IV",
-        "bcm2836": "Broadcom VideoCore IV",
-        "bcm2837": "Broadcom VideoCore IV",
-        "bcm2711": "Broadcom VideoCore VI",
-        "bcm2710A1": "Broadcom VideoCore VI",
-    }
+    if model := _devicetree_model():
+        return model
+
     try:
-        cmd = "cat /sys/firmware/devicetree/base/gpu/compatible"
-        proc = subprocess.run(  # noqa: S603
-            shlex.split(cmd),
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        result = proc.stdout.strip()
-        for model_key, model in model_map.items():
-            if model_key in result:
-                return model
-        return "Unknown GPU Model"
-    except subprocess.CalledProcessError:
-        pass
+        return _parse_glxinfo(_run(GLXINFO_COMMAND))
+    except COMMAND_ERRORS:
+        return "--"
+
+
+@ttl_cache("gpu", name="get_model")
+async def _aget_model() -> str:
+    if model := _devicetree_model():
+        return model
 
     try:
-        result = subprocess.run(
-            ["/usr/bin/bash", "-c", 'DISPLAY=:0 glxinfo | grep "OpenGL renderer"'],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        gpu_info = result.stdout.strip()
-        return gpu_info.split(":")[1].strip()
-    except subprocess.CalledProcessError:
+        return _parse_glxinfo(await _arun(GLXINFO_COMMAND))
+    except COMMAND_ERRORS:
         return "--"
 
 
-@cache
+@ttl_cache("gpu")
 def _get_vram() -> str:
     """Safely get GPU VRAM."""
     try:
-        cmd = "vcgencmd get_mem gpu"
-        proc = subprocess.run(  # noqa: S603
-            shlex.split(cmd),
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        result = proc.stdout.strip()
-        return result.replace("gpu=", "").replace("M", " MB")
-    except (subprocess.CalledProcessError, FileNotFoundError):
+        return _parse_vram(_run(shlex.split(VRAM_COMMAND)))
+    except COMMAND_ERRORS:
+        return "--"
+
+
+@ttl_cache("gpu", name="get_vram")
+async def _aget_vram() -> str:
+    try:
+        return _parse_vram(await _arun(shlex.split(VRAM_COMMAND)))
+    except COMMAND_ERRORS:
         return "--"
 
 
-@cache
+@ttl_cache("gpu", ttl=RESOLUTION_TTL_SECONDS)
 def _get_resolution() -> str:
     """Safely get resolution."""
     try:
-        cmd = "xrandr -display :0.0"
-        proc = subprocess.run(  # noqa: S603
-            shlex.split(cmd),
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        result = proc.stdout.strip()
-        regex = r"current (\d+) x (\d+)"
-        if match := re.search(regex, result):
-            return f"{match[1]} x {match[2]}"
-    except (subprocess.CalledProcessError, FileNotFoundError):
+        return _parse_resolution(_run(shlex.split(RESOLUTION_COMMAND)))
+    except COMMAND_ERRORS:
         return "--"
 
-    return "--"
+
+@ttl_cache("gpu", ttl=RESOLUTION_TTL_SECONDS, name="get_resolution")
+async def _aget_resolution() -> str:
+    try:
+        return _parse_resolution(await _arun(shlex.split(RESOLUTION_COMMAND)))
+    except COMMAND_ERRORS:
+        return "--"
 
 
-@cache
 def _get_refresh_rate() -> str:
     """Safely get refresh rate."""
-    if result := _get_gpu():
-        for line in result.splitlines():
-            if line.startswith("lcd_framerate="):
-                return f"{int(line.split('=')[1])} Hz"
-    return "--"
+    return _parse_refresh_rate(_get_gpu())
 
 
 class LinuxGPUCollector:
@@ -124,3 +167,19 @@ class LinuxGPUCollector:
             ],
             as_list=False,
         )
+
+    async def agpu_info(self) -> GPUPayloadDTO:
+        model, vram, resolution, config = await asyncio.gather(
+            _aget_model(), _aget_vram(), _aget_resolution(), _aget_gpu()
+        )
+        return GPUPayloadDTO(
+            adapters=[
+                GPUInfoDTO(
+                    model=model,
+                    vram=vram,
+                    resolution=resolution,
+                    refresh_rate=_parse_refresh_rate(config),
+                )
+            ],
+            as_list=False,
+        )
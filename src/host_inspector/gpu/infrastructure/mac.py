@@ -1,34 +1,43 @@
 import re
 import shlex
-import subprocess
-from functools import cache
 
 from host_inspector.gpu.application.dtos import GPUInfoDTO
 from host_inspector.gpu.application.dtos import GPUPayloadDTO
+from host_inspector.utils.cacheutils import ttl_cache
+from host_inspector.utils.commandutils import COMMAND_ERRORS
+from host_inspector.utils.commandutils import arun_command
+from host_inspector.utils.commandutils import run_command
 
 from .common import clean_gpu_name
 
+# system_profiler output includes the current resolution of attached displays.
+DISPLAYS_TTL_SECONDS = 30.0
 
-@cache
+GPU_COMMAND = "system_profiler SPDisplaysDataType"
+
+
+@ttl_cache("gpu", ttl=DISPLAYS_TTL_SECONDS)
 def _get_gpu():
     """Safely get GPU."""
     try:
-        cmd = "system_profiler SPDisplaysDataType"
-        proc = subprocess.run(  # noqa: S603
-            shlex.split(cmd),
-            check=True,
-            capture_output=True,
-            text=True,
-        )
+        proc = run_command(shlex.split(GPU_COMMAND))
         return proc.stdout.strip()
-    except subprocess.CalledProcessError:  # pragma: no cover
+    except COMMAND_ERRORS:  # pragma: no cover
         return None
 
 
-@cache
-def _get_model() -> str:
+@ttl_cache("gpu", ttl=DISPLAYS_TTL_SECONDS, name="get_gpu")
+async def _aget_gpu():
+    try:
+        proc = await arun_command(shlex.split(GPU_COMMAND))
+        return proc.stdout.strip()
+    except COMMAND_ERRORS:  # pragma: no cover
+        return None
+
+
+def _get_model(result: str | None) -> str:
     """Get GPU chipset model."""
-    if result := _get_gpu():
+    if result:
         for line in result.split("\n"):
             if "Chipset Model" in line:
                 return clean_gpu_name(
@@ -37,49 +46,52 @@ def _get_model() -> str:
     return "--"  # pragma: no cover
 
 
-@cache
-def _get_vram() -> str:
+def _get_vram(result: str | None) -> str:
     """Get GPU VRAM."""
-    if result := _get_gpu():
+    if result:
         for line in result.split("\n"):
             if "VRAM" in line:
                 return line.split(":")[1].strip()
     return "--"  # pragma: no cover
 
 
-@cache
-def _get_resolution() -> str:
+def _get_resolution(result: str | None) -> str:
     """Get resolution."""
-    if result := _get_gpu():
+    if result:
         regex = r"(\d+) x (\d+)"
         if match := re.search(regex, result):
             return f"{match[1]} x {match[2]}"
     return "--"  # pragma: no cover
 
 
-@cache
-def _get_refresh_rate() -> str:
+def _get_refresh_rate(result: str | None) -> str:
     """Get refresh rate."""
     pattern = re.compile(r"@ (\d+\.\d+)Hz")
-    output = _get_gpu()
-    if output:
-        match = pattern.search(output)
+    if result:
+        match = pattern.search(result)
         if match:
             return f"{match.group(1)} Hz"
     return "--"  # pragma: no cover
 
 
+def _build_payload(result: str | None) -> GPUPayloadDTO:
+    return GPUPayloadDTO(
+        adapters=[
+            GPUInfoDTO(
+                model=_get_model(result),
+                vram=_get_vram(result),
+                resolution=_get_resolution(result),
+                refresh_rate=_get_refresh_rate(result),
+            )
+        ],
+        as_list=False,
+    )
+
+
 class MacGPUCollector:
     def gpu_info(self) -> GPUPayloadDTO:
         """Return a dict of GPU info."""
-        return GPUPayloadDTO(
-            adapters=[
-                GPUInfoDTO(
-                    model=_get_model(),
-                    vram=_get_vram(),
-                    resolution=_get_resolution(),
-                    refresh_rate=_get_refresh_rate(),
-                )
-            ],
-            as_list=False,
-        )
+        return _build_payload(_get_gpu())
+
+    async def agpu_info(self) -> GPUPayloadDTO:
+        return _build_payload(await _aget_gpu())
@@ -1,28 +1,38 @@
 import json
 import shlex
-import subprocess
-from functools import cache
 
 from host_inspector.gpu.application.dtos import GPUInfoDTO
 from host_inspector.gpu.application.dtos import GPUPayloadDTO
 from host_inspector.utils.byteutils import bytes_to_gib
+from host_inspector.utils.cacheutils import ttl_cache
+from host_inspector.utils.commandutils import COMMAND_ERRORS
+from host_inspector.utils.commandutils import arun_command
+from host_inspector.utils.commandutils import run_command
 
 from .common import clean_gpu_name
 
+# Controller output includes the current resolution and refresh rate.
+CONTROLLERS_TTL_SECONDS = 30.0
 
-@cache
+GPU_COMMAND = "powershell Get-CimInstance -ClassName Win32_VideoController | Select-Object Name, CurrentRefreshRate, Current*Resolution, AdapterRAM | ConvertTo-Json -Compress"
+
+
+@ttl_cache("gpu", ttl=CONTROLLERS_TTL_SECONDS)
 def _get_gpu():
     """Safely get GPU."""
     try:
-        cmd = "powershell Get-CimInstance -ClassName Win32_VideoController | Select-Object Name, CurrentRefreshRate, Current*Resolution, AdapterRAM | ConvertTo-Json -Compress"
-        proc = subprocess.run(  # noqa: S603
-            shlex.split(cmd),
-            check=True,
-            capture_output=True,
-            text=True,
-        )
+        proc = run_command(shlex.split(GPU_COMMAND))
         return proc.stdout.strip()
-    except subprocess.CalledProcessError:
+    except COMMAND_ERRORS:
+        return None
+
+
+@ttl_cache("gpu", ttl=CONTROLLERS_TTL_SECONDS, name="get_gpu")
+async def _aget_gpu():
+    try:
+        proc = await arun_command(shlex.split(GPU_COMMAND))
+        return proc.stdout.strip()
+    except COMMAND_ERRORS:
         return None
 
 
@@ -81,12 +91,18 @@ def _build_adapter_info(controller) -> GPUInfoDTO:
     )
 
 
+def _build_payload(gpu_output) -> GPUPayloadDTO:
+    controllers = _parse_controllers(gpu_output)
+    return GPUPayloadDTO(
+        adapters=[_build_adapter_info(controller) for controller in controllers],
+        as_list=True,
+    )
+
+
 class WindowsGPUCollector:
     def gpu_info(self) -> GPUPayloadDTO:
         """Return info dictionaries, one for each display adapter."""
-        gpu_output = _get_gpu()
-        controllers = _parse_controllers(gpu_output)
-        return GPUPayloadDTO(
-            adapters=[_build_adapter_info(controller) for controller in controllers],
-            as_list=True,
-        )
+        return _build_payload(_get_gpu())
+
+    async def agpu_info(self) -> GPUPayloadDTO:
+        return _build_payload(await _aget_gpu())
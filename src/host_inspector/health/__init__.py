@@ -1,8 +1,9 @@
+from collections.abc import Iterable
 from functools import cache
 
 from .infrastructure import build_health_service
 
-__all__ = ["get_health_info"]
+__all__ = ["aget_health_info", "get_health_info"]
 
 
 @cache
@@ -10,6 +11,10 @@ def _get_health_service():
     return build_health_service()
 
 
-def get_health_info() -> dict:
-    """Return overall health information."""
-    return _get_health_service().get_health_info()
+def get_health_info(sections: Iterable[str] | None = None) -> dict:
+    """Return overall health information, probing only ``sections`` when given."""
+    return _get_health_service().get_health_info(sections)
+
+
+async def aget_health_info(sections: Iterable[str] | None = None) -> dict:
+    return await _get_health_service().aget_health_info(sections)
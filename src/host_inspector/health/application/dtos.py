@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from dataclasses import field
 
 
 @dataclass(frozen=True)
@@ -8,3 +9,4 @@ class HealthInputDTO:
     disk: dict
     uptime: dict
     local_datetime: dict
+    pressure: dict = field(default_factory=dict)
@@ -1,8 +1,14 @@
+from collections.abc import Iterable
 from typing import Protocol
 
 from .dtos import HealthInputDTO
 
 
 class HealthProbePort(Protocol):
-    def snapshot(self) -> HealthInputDTO:
-        """Return health aggregate input."""
+    def snapshot(self, sections: Iterable[str] | None = None) -> HealthInputDTO:
+        """Return health aggregate input, probing only ``sections`` when given."""
+
+
+class AsyncHealthProbePort(Protocol):
+    async def asnapshot(self, sections: Iterable[str] | None = None) -> HealthInputDTO:
+        """Return health aggregate input without blocking."""
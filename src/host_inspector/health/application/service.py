@@ -1,18 +1,30 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
 
+from host_inspector.utils.projectutils import select_fields
+
+from .dtos import HealthInputDTO
 from .ports import HealthProbePort
 
+SECTIONS = ("cpu", "mem", "disk", "uptime", "local_datetime", "pressure")
+
 
 @dataclass(frozen=True)
 class HealthService:
     probe: HealthProbePort
 
-    def get_health_info(self) -> dict:
-        snapshot = self.probe.snapshot()
-        return {
-            "cpu": snapshot.cpu,
-            "mem": snapshot.mem,
-            "disk": snapshot.disk,
-            "uptime": snapshot.uptime,
-            "local_datetime": snapshot.local_datetime,
-        }
+    def get_health_info(self, sections: Iterable[str] | None = None) -> dict:
+        if sections is None:
+            return self._build_info(self.probe.snapshot(), SECTIONS)
+        sections = select_fields(sections, SECTIONS, "health")
+        return self._build_info(self.probe.snapshot(sections=sections), sections)
+
+    async def aget_health_info(self, sections: Iterable[str] | None = None) -> dict:
+        if sections is None:
+            return self._build_info(await self.probe.asnapshot(), SECTIONS)
+        sections = select_fields(sections, SECTIONS, "health")
+        return self._build_info(await self.probe.asnapshot(sections=sections), sections)
+
+    @staticmethod
+    def _build_info(snapshot: HealthInputDTO, sections: tuple[str, ...]) -> dict:
+        return {section: getattr(snapshot, section) for section in sections}
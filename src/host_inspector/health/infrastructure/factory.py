@@ -1,7 +1,8 @@
 from host_inspector.health.application.service import HealthService
+from host_inspector.utils.instrumentutils import instrument
 
 from .probe import HealthProbe
 
 
 def build_health_service() -> HealthService:
-    return HealthService(probe=HealthProbe())
+    return HealthService(probe=instrument(HealthProbe(), "health.probe"))
@@ -1,17 +1,76 @@
+from collections.abc import Callable
+from collections.abc import Iterable
+
+from host_inspector.cpu import aget_cpu_info
 from host_inspector.cpu import get_cpu_info
+from host_inspector.date_time import aget_datetime_info
 from host_inspector.date_time import get_datetime_info
+from host_inspector.disk import aget_disk_info
 from host_inspector.disk import get_disk_info
 from host_inspector.health.application.dtos import HealthInputDTO
+from host_inspector.memory import aget_mem_info
 from host_inspector.memory import get_mem_info
+from host_inspector.pressure import aget_pressure_info
+from host_inspector.pressure import get_pressure_info
+from host_inspector.uptime import aget_uptime_info
 from host_inspector.uptime import get_uptime_info
+from host_inspector.utils.collectutils import DEFAULT_DEADLINE_SECONDS
+from host_inspector.utils.collectutils import DEFAULT_PROBE_TIMEOUT_SECONDS
+from host_inspector.utils.collectutils import ProbeTask
+from host_inspector.utils.collectutils import acollect_parallel
+from host_inspector.utils.collectutils import collect_parallel
+from host_inspector.utils.collectutils import select_tasks
+from host_inspector.utils.collectutils import task_defaults
 
 
 class HealthProbe:
-    def snapshot(self) -> HealthInputDTO:
-        return HealthInputDTO(
-            cpu=get_cpu_info(),
-            mem=get_mem_info(),
-            disk=get_disk_info(),
-            uptime=get_uptime_info(),
-            local_datetime=get_datetime_info(),
+    def __init__(
+        self,
+        *,
+        max_workers: int = 6,
+        timeout: float | None = DEFAULT_PROBE_TIMEOUT_SECONDS,
+        deadline: float | None = DEFAULT_DEADLINE_SECONDS,
+    ):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.deadline = deadline
+
+    def _tasks(self, funcs: dict[str, Callable]) -> list[ProbeTask]:
+        return [
+            ProbeTask(section, func, default={}, timeout=self.timeout)
+            for section, func in funcs.items()
+        ]
+
+    def snapshot(self, sections: Iterable[str] | None = None) -> HealthInputDTO:
+        tasks = self._tasks(
+            {
+                "cpu": get_cpu_info,
+                "mem": get_mem_info,
+                "disk": get_disk_info,
+                "uptime": get_uptime_info,
+                "local_datetime": get_datetime_info,
+                "pressure": get_pressure_info,
+            }
+        )
+        results = collect_parallel(
+            select_tasks(tasks, sections),
+            max_workers=self.max_workers,
+            deadline=self.deadline,
+        )
+        return HealthInputDTO(**task_defaults(tasks) | results)
+
+    async def asnapshot(self, sections: Iterable[str] | None = None) -> HealthInputDTO:
+        tasks = self._tasks(
+            {
+                "cpu": aget_cpu_info,
+                "mem": aget_mem_info,
+                "disk": aget_disk_info,
+                "uptime": aget_uptime_info,
+                "local_datetime": aget_datetime_info,
+                "pressure": aget_pressure_info,
+            }
+        )
+        results = await acollect_parallel(
+            select_tasks(tasks, sections), deadline=self.deadline
         )
+        return HealthInputDTO(**task_defaults(tasks) | results)
@@ -1,7 +1,8 @@
 from host_inspector.machine.application.service import MachineService
+from host_inspector.utils.instrumentutils import instrument
 
 from .probe import MachineIdProbe
 
 
 def build_machine_service() -> MachineService:
-    return MachineService(probe=MachineIdProbe())
+    return MachineService(probe=instrument(MachineIdProbe(), "machine.probe"))
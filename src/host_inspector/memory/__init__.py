@@ -1,8 +1,10 @@
+import asyncio
+from collections.abc import Iterable
 from functools import cache
 
 from .infrastructure import build_memory_service
 
-__all__ = ["get_mem_info"]
+__all__ = ["aget_mem_info", "get_mem_info"]
 
 
 @cache
@@ -10,6 +12,16 @@ def _get_memory_service():
     return build_memory_service()
 
 
-def get_mem_info() -> dict:
-    """Return memory info as a dict."""
-    return _get_memory_service().get_mem_info()
+def get_mem_info(fields: Iterable[str] | None = None) -> dict:
+    """Return memory info as a dict, optionally limited to ``fields``.
+
+    Request ``swap``, ``cached``, ``buffers``, ``slab``, ``dirty``,
+    ``writeback`` or ``hugepages`` by name for the extended breakdown.
+    """
+    return _get_memory_service().get_mem_info(fields)
+
+
+async def aget_mem_info(fields: Iterable[str] | None = None) -> dict:
+    """Return memory info as a dict without blocking the event loop."""
+    # procfs/sysfs reads; run off the loop like any other file I/O.
+    return await asyncio.to_thread(get_mem_info, fields)
@@ -1,9 +1,28 @@
 from dataclasses import dataclass
 
 
+@dataclass(frozen=True)
+class MemoryDetailsDTO:
+    """Extended breakdown in bytes; None where the platform does not report it."""
+
+    swap_total: int = 0
+    swap_used: int = 0
+    swap_free: int = 0
+    cached: int | None = None
+    buffers: int | None = None
+    slab_reclaimable: int | None = None
+    slab_unreclaimable: int | None = None
+    dirty: int | None = None
+    writeback: int | None = None
+    hugepages_total: int | None = None  # pages, not bytes
+    hugepages_free: int | None = None  # pages, not bytes
+    hugepage_size: int | None = None
+
+
 @dataclass(frozen=True)
 class MemorySnapshotDTO:
     total: int
     used: int
     available: int
     percent: float
+    details: MemoryDetailsDTO | None = None
@@ -4,5 +4,5 @@ from .dtos import MemorySnapshotDTO
 
 
 class MemoryProbePort(Protocol):
-    def snapshot(self) -> MemorySnapshotDTO:
-        """Return a memory snapshot."""
+    def snapshot(self, *, details: bool = False) -> MemorySnapshotDTO:
+        """Return a memory snapshot, with the extended breakdown if ``details``."""
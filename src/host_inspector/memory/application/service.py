@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 from host_inspector.memory.domain import mem_avail
@@ -7,18 +8,81 @@ from host_inspector.memory.domain import mem_physical
 from host_inspector.memory.domain import mem_physical_str
 from host_inspector.memory.domain import mem_used
 from host_inspector.memory.domain import mem_used_str
+from host_inspector.utils.projectutils import select_fields
 
+from .dtos import MemoryDetailsDTO
 from .ports import MemoryProbePort
 
+MEM_FIELDS = (
+    "physical",
+    "physical_str",
+    "used",
+    "used_str",
+    "avail",
+    "avail_str",
+    "percent",
+    "percent_str",
+)
+# Opt-in: only returned when asked for by name. Values are in bytes.
+DETAIL_FIELDS = (
+    "swap",
+    "cached",
+    "buffers",
+    "slab",
+    "dirty",
+    "writeback",
+    "hugepages",
+)
+
+
+def _detail_values(details: MemoryDetailsDTO) -> dict:
+    swap_percent = (
+        round(details.swap_used / details.swap_total * 100, 1)
+        if details.swap_total
+        else 0.0
+    )
+    return {
+        "swap": {
+            "total": details.swap_total,
+            "used": details.swap_used,
+            "free": details.swap_free,
+            "percent": swap_percent,
+        },
+        "cached": details.cached,
+        "buffers": details.buffers,
+        "slab": {
+            "reclaimable": details.slab_reclaimable,
+            "unreclaimable": details.slab_unreclaimable,
+        },
+        "dirty": details.dirty,
+        "writeback": details.writeback,
+        "hugepages": {
+            "total": details.hugepages_total,
+            "free": details.hugepages_free,
+            "size": details.hugepage_size,
+        },
+    }
+
 
 @dataclass(frozen=True)
 class MemoryService:
     probe: MemoryProbePort
 
-    def get_mem_info(self) -> dict:
-        snapshot = self.probe.snapshot()
+    def get_mem_info(self, fields: Iterable[str] | None = None) -> dict:
+        """Return memory info as a dict.
+
+        ``fields`` limits the result to those keys; the extended breakdown
+        (``swap``, ``cached``, ``slab``, ...) is only read when requested.
+        """
+        if fields is None:
+            fields, snapshot = MEM_FIELDS, self.probe.snapshot()
+        else:
+            fields = select_fields(fields, MEM_FIELDS + DETAIL_FIELDS, "memory")
+            details = any(name in DETAIL_FIELDS for name in fields)
+            snapshot = self.probe.snapshot(details=details)
+
         used_bytes = max(snapshot.total - snapshot.available, 0)
-        return {
+        values = {
             "physical": mem_physical(snapshot.total),
             "physical_str": mem_physical_str(snapshot.total),
             "used": mem_used(used_bytes),
@@ -28,3 +92,6 @@ class MemoryService:
             "percent": mem_percent(snapshot.percent),
             "percent_str": f"{mem_percent(snapshot.percent)}%",
         }
+        if snapshot.details is not None:
+            values |= _detail_values(snapshot.details)
+        return {name: values[name] for name in fields}
@@ -1,7 +1,16 @@
+import sys
+
 from host_inspector.memory.application.service import MemoryService
+from host_inspector.utils.instrumentutils import instrument
+from host_inspector.utils.sysfsutils import MEMINFO_PATH
 
+from .linux import ProcMeminfoProbe
 from .probe import PsutilMemoryProbe
 
 
 def build_memory_service() -> MemoryService:
-    return MemoryService(probe=PsutilMemoryProbe())
+    if sys.platform == "linux" and MEMINFO_PATH.exists():
+        probe = ProcMeminfoProbe()
+    else:
+        probe = PsutilMemoryProbe()
+    return MemoryService(probe=instrument(probe, "memory.probe"))
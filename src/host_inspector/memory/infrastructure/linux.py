@@ -0,0 +1,39 @@
+from host_inspector.memory.application.dtos import MemoryDetailsDTO
+from host_inspector.memory.application.dtos import MemorySnapshotDTO
+from host_inspector.utils.sysfsutils import read_meminfo
+
+
+class ProcMeminfoProbe:
+    """Build the whole snapshot from a single /proc/meminfo read."""
+
+    def snapshot(self, *, details: bool = False) -> MemorySnapshotDTO:
+        meminfo = read_meminfo()
+        total = meminfo.get("MemTotal", 0)
+        available = meminfo.get("MemAvailable", meminfo.get("MemFree", 0))
+        used = max(total - available, 0)
+        extended = None
+        if details:
+            swap_total = meminfo.get("SwapTotal", 0)
+            swap_free = meminfo.get("SwapFree", 0)
+            extended = MemoryDetailsDTO(
+                swap_total=swap_total,
+                swap_used=max(swap_total - swap_free, 0),
+                swap_free=swap_free,
+                cached=meminfo.get("Cached"),
+                buffers=meminfo.get("Buffers"),
+                slab_reclaimable=meminfo.get("SReclaimable"),
+                slab_unreclaimable=meminfo.get("SUnreclaim"),
+                dirty=meminfo.get("Dirty"),
+                writeback=meminfo.get("Writeback"),
+                hugepages_total=meminfo.get("HugePages_Total"),
+                hugepages_free=meminfo.get("HugePages_Free"),
+                hugepage_size=meminfo.get("Hugepagesize"),
+            )
+        return MemorySnapshotDTO(
+            total=total,
+            used=used,
+            available=available,
+            # Same definition psutil.virtual_memory() uses on Linux.
+            percent=round(used / total * 100, 1) if total else 0.0,
+            details=extended,
+        )
@@ -1,14 +1,26 @@
 import psutil
 
+from host_inspector.memory.application.dtos import MemoryDetailsDTO
 from host_inspector.memory.application.dtos import MemorySnapshotDTO
 
 
 class PsutilMemoryProbe:
-    def snapshot(self) -> MemorySnapshotDTO:
+    def snapshot(self, *, details: bool = False) -> MemorySnapshotDTO:
         memory = psutil.virtual_memory()
+        extended = None
+        if details:
+            swap = psutil.swap_memory()
+            extended = MemoryDetailsDTO(
+                swap_total=swap.total,
+                swap_used=swap.used,
+                swap_free=swap.free,
+                cached=getattr(memory, "cached", None),
+                buffers=getattr(memory, "buffers", None),
+            )
         return MemorySnapshotDTO(
             total=memory.total,
             used=memory.used,
             available=memory.available,
             percent=memory.percent,
+            details=extended,
         )
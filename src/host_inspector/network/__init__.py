@@ -1,8 +1,9 @@
+import asyncio
 from functools import cache
 
 from .infrastructure import build_network_service
 
-__all__ = ["get_network_info"]
+__all__ = ["aget_network_info", "get_network_info"]
 
 
 @cache
@@ -13,3 +14,9 @@ def _get_network_service():
 def get_network_info() -> dict:
     """Return network info as dict."""
     return _get_network_service().get_network_info()
+
+
+async def aget_network_info() -> dict:
+    """Return network info as dict without blocking the event loop."""
+    # procfs/sysfs reads; run off the loop like any other file I/O.
+    return await asyncio.to_thread(get_network_info)
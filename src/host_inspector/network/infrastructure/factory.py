@@ -1,7 +1,8 @@
 from host_inspector.network.application.service import NetworkService
+from host_inspector.utils.instrumentutils import instrument
 
 from .probe import SystemNetworkProbe
 
 
 def build_network_service() -> NetworkService:
-    return NetworkService(probe=SystemNetworkProbe())
+    return NetworkService(probe=instrument(SystemNetworkProbe(), "network.probe"))
@@ -1,20 +1,24 @@
 import platform
 import socket
+import sys
 import uuid
-from functools import cache
 from typing import Any
 
 import psutil
 
 from host_inspector.network.application.dtos import NetworkSnapshotDTO
+from host_inspector.utils.cacheutils import ttl_cache
+
+from .routes import DefaultRoute
+from .routes import RouteTable
 
 AF_INET6 = [30, 10, 23]
 AF_LINK = [18, 17, -1]
 
 
-@cache
-def _network_interface_by_ip(ip_address: str) -> tuple[str, list[Any]]:
-    interfaces = psutil.net_if_addrs()
+def _network_interface_by_ip(
+    ip_address: str, interfaces: dict[str, list[Any]]
+) -> tuple[str, list[Any]]:
     for name, addresses in interfaces.items():
         for nic_address in addresses:
             if nic_address.address == ip_address:
@@ -22,21 +26,93 @@ def _network_interface_by_ip(ip_address: str) -> tuple[str, list[Any]]:
     return "--", []
 
 
-def _current_ip_address() -> str:
-    """Safely get internal IPv4 address."""
+def _interface_ipv4(name: str) -> str | None:
+    addresses = psutil.net_if_addrs().get(name, [])
+    return next(
+        (addr.address for addr in addresses if addr.family == socket.AF_INET), None
+    )
+
+
+def _first_up_ipv4() -> str | None:
+    """Return an address of the first interface that is up and not loopback."""
+    stats = psutil.net_if_stats()
+    for name, addresses in psutil.net_if_addrs().items():
+        if not (stat := stats.get(name)) or not stat.isup:
+            continue
+        for addr in addresses:
+            if addr.family == socket.AF_INET and not addr.address.startswith("127."):
+                return addr.address
+    return None
+
+
+def _routed_ip_address() -> str | None:
+    # No packet is sent; connect() on a UDP socket only picks the source
+    # address the routing table would use.
     try:
         with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
             sock.connect(("8.8.8.8", 80))
             return sock.getsockname()[0]
-    except OSError:  # pragma: no cover
-        return "--"
+    except OSError:
+        return None
+
+
+def _address_fingerprint(
+    interfaces: dict[str, list[Any]], route: DefaultRoute | None
+) -> tuple:
+    """Return the addresses the primary IP is chosen from, as a cache key.
+
+    That is the route interface's addresses, or every interface's when there
+    is no default route and any of them may be picked.
+    """
+    names = [route.interface] if route is not None else sorted(interfaces)
+    return tuple(
+        (name, addr.family, addr.address)
+        for name in names
+        for addr in interfaces.get(name, [])
+    )
+
+
+@ttl_cache("network")
+def _primary_ip_address(route: DefaultRoute | None, fingerprint: tuple) -> str:
+    """Return the primary IPv4 address for a default route.
+
+    Keyed by the route and the ``fingerprint`` of the addresses it can pick
+    from, so the answer is recomputed as soon as either changes (a new route,
+    a DHCP lease) and is otherwise reused.
+    """
+    del fingerprint
+    if route is not None:
+        address = _interface_ipv4(route.interface)
+    elif sys.platform != "linux":
+        address = _routed_ip_address()
+    else:
+        # Linux without a default route: an air-gapped or isolated host.
+        address = None
+    return address or _first_up_ipv4() or "--"
 
 
 class SystemNetworkProbe:
+    def __init__(self, routes: RouteTable | None = None):
+        if routes is None and sys.platform == "linux":
+            routes = RouteTable()
+        self.routes = routes
+
+        self._key: tuple | None = None
+
+    def _current_ip_address(self, interfaces: dict[str, list[Any]]) -> str:
+        """Safely get internal IPv4 address without touching the network."""
+        route = self.routes.default_route() if self.routes is not None else None
+        key = (route, _address_fingerprint(interfaces, route))
+        if key != self._key:
+            # Only the current route and addresses are worth keeping.
+            _primary_ip_address.cache_clear()
+            self._key = key
+        return _primary_ip_address(*key)
+
     def snapshot(self) -> NetworkSnapshotDTO:
-        ip_address = _current_ip_address()
-        interface_name, _ = _network_interface_by_ip(ip_address)
-        _, addresses = _network_interface_by_ip(ip_address)
+        interfaces = psutil.net_if_addrs()
+        ip_address = self._current_ip_address(interfaces)
+        interface_name, addresses = _network_interface_by_ip(ip_address, interfaces)
         return NetworkSnapshotDTO(
             hostname=platform.node(),
             ip_address=ip_address,
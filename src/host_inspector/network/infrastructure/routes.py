@@ -0,0 +1,102 @@
+import socket
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+
+from host_inspector.utils.sysfsutils import OpenProcFiles
+
+ROUTE_PATH = Path("/proc/net/route")
+IPV6_ROUTE_PATH = Path("/proc/net/ipv6_route")
+
+RTF_UP = 0x0001
+RTF_REJECT = 0x0200
+IPV4_ROUTE_FIELDS = 8  # Iface ... Mask; MTU/Window/IRTT are not needed
+IPV6_ROUTE_FIELDS = 10
+IPV6_DEFAULT = "0" * 32
+
+
+@dataclass(frozen=True)
+class DefaultRoute:
+    interface: str
+    gateway: str
+    metric: int
+    family: int = socket.AF_INET
+
+
+def _ipv4(little_endian_hex: str) -> str:
+    return socket.inet_ntoa(struct.pack("<I", int(little_endian_hex, 16)))
+
+
+def _ipv6(hex_address: str) -> str:
+    return socket.inet_ntop(socket.AF_INET6, bytes.fromhex(hex_address))
+
+
+def parse_route(text: str) -> DefaultRoute | None:
+    """Return the lowest-metric IPv4 default route in /proc/net/route, if any."""
+    routes = []
+    for line in text.splitlines()[1:]:
+        fields = line.split()
+        if len(fields) < IPV4_ROUTE_FIELDS:
+            continue
+        iface, destination, gateway, flags, _, _, metric, mask = fields[:8]
+        try:
+            if int(destination, 16) or int(mask, 16) or not int(flags, 16) & RTF_UP:
+                continue
+            routes.append(DefaultRoute(iface, _ipv4(gateway), int(metric)))
+        except ValueError:
+            continue
+    return min(routes, key=lambda route: route.metric, default=None)
+
+
+def parse_ipv6_route(text: str) -> DefaultRoute | None:
+    """Return the lowest-metric IPv6 default route in /proc/net/ipv6_route, if any.
+
+    The kernel's catch-all "unreachable" default on ``lo`` is skipped.
+    """
+    routes = []
+    for line in text.splitlines():
+        fields = line.split()
+        if len(fields) < IPV6_ROUTE_FIELDS:
+            continue
+        destination, prefix, _, _, next_hop, metric, _, _, flags, iface = fields[:10]
+        try:
+            flag_bits = int(flags, 16)
+            if (
+                destination != IPV6_DEFAULT
+                or int(prefix, 16)
+                or not flag_bits & RTF_UP
+                or flag_bits & RTF_REJECT
+                or iface == "lo"
+            ):
+                continue
+            routes.append(
+                DefaultRoute(
+                    iface, _ipv6(next_hop), int(metric, 16), family=socket.AF_INET6
+                )
+            )
+        except ValueError:
+            continue
+    return min(routes, key=lambda route: route.metric, default=None)
+
+
+class RouteTable:
+    """Find the default route in /proc/net/{route,ipv6_route}, kept open."""
+
+    def __init__(
+        self, route_path: Path = ROUTE_PATH, ipv6_route_path: Path = IPV6_ROUTE_PATH
+    ):
+        self.route_path = route_path
+        self.ipv6_route_path = ipv6_route_path
+        self._files = OpenProcFiles()
+
+    def close(self) -> None:
+        self._files.close()
+
+    def default_route(self) -> DefaultRoute | None:
+        """Return the IPv4 default route, else the IPv6 one."""
+        route_text = self._files.read(self.route_path)
+        if route_text and (route := parse_route(route_text)):
+            return route
+        if text := self._files.read(self.ipv6_route_path):
+            return parse_ipv6_route(text)
+        return None
@@ -2,10 +2,19 @@ from functools import cache
 
 from .infrastructure import build_os_service
 
-__all__ = ["get_os_info"]
+__all__ = ["aget_os_info", "get_os_info"]
 
 
 @cache
+def _get_os_service():
+    return build_os_service()
+
+
 def get_os_info() -> dict:
     """Return OS info as dict."""
-    return build_os_service().get_os_info()
+    return _get_os_service().get_os_info()
+
+
+async def aget_os_info() -> dict:
+    """Return OS info as dict without blocking the event loop."""
+    return await _get_os_service().aget_os_info()
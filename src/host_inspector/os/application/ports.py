@@ -6,3 +6,8 @@ from .dtos import OSDataDTO
 class OSCollector(Protocol):
     def collect(self) -> OSDataDTO:
         """Collect platform OS information."""
+
+
+class AsyncOSCollector(Protocol):
+    async def acollect(self) -> OSDataDTO:
+        """Collect platform OS information without blocking."""
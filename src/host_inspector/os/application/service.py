@@ -2,6 +2,7 @@ from dataclasses import dataclass
 
 from host_inspector.os.domain import get_macos_edition
 
+from .dtos import OSDataDTO
 from .ports import OSCollector
 
 
@@ -11,8 +12,14 @@ class OSService:
 
     def get_os_info(self) -> dict:
         """Get OS info using the configured collector."""
-        data = self.collector.collect()
+        return self._build_info(self.collector.collect())
 
+    async def aget_os_info(self) -> dict:
+        """Get OS info using the collector's async `acollect`."""
+        return self._build_info(await self.collector.acollect())
+
+    @staticmethod
+    def _build_info(data: OSDataDTO) -> dict:
         info = {
             "name": data.name,
             "version": data.version,
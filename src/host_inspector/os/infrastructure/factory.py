@@ -2,6 +2,7 @@ import importlib
 import sys
 
 from host_inspector.os.application.service import OSService
+from host_inspector.utils.instrumentutils import instrument
 
 
 def build_os_service() -> OSService:
@@ -21,4 +22,4 @@ def build_os_service() -> OSService:
 
     collector_module = importlib.import_module(module_name)
     collector_cls = getattr(collector_module, class_name)
-    return OSService(collector=collector_cls())
+    return OSService(collector=instrument(collector_cls(), "os.collector"))
@@ -1,34 +1,17 @@
-import re
-import shlex
-import subprocess
-from functools import cache
-
 from host_inspector.os.application.dtos import OSDataDTO
+from host_inspector.utils.cacheutils import ttl_cache
+from host_inspector.utils.sysfsutils import read_os_release
 
 
-def _search_pattern(pattern: str, result: str) -> str | None:
-    if matches := re.search(pattern, result):
-        return matches[1].strip()
-    return None
-
-
-@cache
+@ttl_cache("os")
 def _collect_linux_os_data() -> OSDataDTO:
     """Parse /etc/os-release file for name, version, and edition."""
-    cmd = "cat /etc/os-release"
-    proc = subprocess.run(  # noqa: S603
-        shlex.split(cmd),
-        check=True,
-        capture_output=True,
-        text=True,
-    )
-    result = proc.stdout.strip().replace("PRETTY_NAME", "PRETTY")
-
+    release = read_os_release()
     return OSDataDTO(
         platform="linux",
-        name=_search_pattern(r'NAME="(.+)"', result),
-        version=_search_pattern(r'VERSION_ID="(.+)"', result),
-        edition=_search_pattern(r"VERSION_CODENAME=(.+)", result),
+        name=release.get("NAME"),
+        version=release.get("VERSION_ID"),
+        edition=release.get("VERSION_CODENAME"),
         build="--",
     )
 
@@ -36,3 +19,7 @@ def _collect_linux_os_data() -> OSDataDTO:
 class LinuxOSCollector:
     def collect(self) -> OSDataDTO:
         return _collect_linux_os_data()
+
+    async def acollect(self) -> OSDataDTO:
+        # A plain file read; nothing to await.
+        return _collect_linux_os_data()
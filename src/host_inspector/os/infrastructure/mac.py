@@ -1,9 +1,11 @@
 import re
-import shlex
-import subprocess
-from functools import cache
 
 from host_inspector.os.application.dtos import OSDataDTO
+from host_inspector.utils.cacheutils import ttl_cache
+from host_inspector.utils.commandutils import arun_command
+from host_inspector.utils.commandutils import run_command
+
+SW_VERS_COMMAND = ["sw_vers"]
 
 
 def _search_pattern(pattern: str, result: str) -> str | None:
@@ -12,16 +14,20 @@ def _search_pattern(pattern: str, result: str) -> str | None:
     return None
 
 
-@cache
+@ttl_cache("os")
 def _collect_mac_os_data() -> OSDataDTO:
-    cmd = "sw_vers"
-    proc = subprocess.run(  # noqa: S603
-        shlex.split(cmd),
-        check=True,
-        capture_output=True,
-        text=True,
-    )
-    result = proc.stdout.strip()
+    proc = run_command(SW_VERS_COMMAND)
+    return _parse_sw_vers(proc.stdout)
+
+
+@ttl_cache("os", name="collect_mac_os_data")
+async def _acollect_mac_os_data() -> OSDataDTO:
+    proc = await arun_command(SW_VERS_COMMAND)
+    return _parse_sw_vers(proc.stdout)
+
+
+def _parse_sw_vers(output: str) -> OSDataDTO:
+    result = output.strip()
 
     name = _search_pattern(r"ProductName:(.+)", result)
     version = _search_pattern(r"ProductVersion:(.+)", result)
@@ -39,3 +45,6 @@ def _collect_mac_os_data() -> OSDataDTO:
 class MacOSCollector:
     def collect(self) -> OSDataDTO:
         return _collect_mac_os_data()
+
+    async def acollect(self) -> OSDataDTO:
+        return await _acollect_mac_os_data()
@@ -2,12 +2,12 @@ import contextlib
 import platform
 import sys
 import winreg
-from functools import cache
 
 from host_inspector.os.application.dtos import OSDataDTO
+from host_inspector.utils.cacheutils import ttl_cache
 
 
-@cache
+@ttl_cache("os")
 def _get_windows_version() -> str | int:
     # Need this since Windows major.minor reports as 10.x for Windows 11.
     if int(platform.version().split(".")[2]) >= 22000:  # noqa: PLR2004
@@ -15,7 +15,7 @@ def _get_windows_version() -> str | int:
     return platform.win32_ver()[0]
 
 
-@cache
+@ttl_cache("os")
 def _get_windows_display_version() -> str:
     with contextlib.suppress(FileNotFoundError):
         key = r"SOFTWARE\Microsoft\Windows NT\CurrentVersion"
@@ -24,7 +24,7 @@ def _get_windows_display_version() -> str:
     return "--"  # pragma: no cover
 
 
-@cache
+@ttl_cache("os")
 def _collect_windows_os_data() -> OSDataDTO:
     return OSDataDTO(
         platform="win32",
@@ -39,3 +39,7 @@ def _collect_windows_os_data() -> OSDataDTO:
 class WindowsOSCollector:
     def collect(self) -> OSDataDTO:
         return _collect_windows_os_data()
+
+    async def acollect(self) -> OSDataDTO:
+        # platform/registry lookups only; nothing to await.
+        return _collect_windows_os_data()
@@ -2,7 +2,7 @@ from functools import cache
 
 from .infrastructure import build_platform_service
 
-__all__ = ["get_platform_info"]
+__all__ = ["aget_platform_info", "get_platform_info"]
 
 
 @cache
@@ -12,3 +12,7 @@ def _get_platform_service():
 
 def get_platform_info() -> dict:
     return _get_platform_service().get_platform_info()
+
+
+async def aget_platform_info() -> dict:
+    return await _get_platform_service().aget_platform_info()
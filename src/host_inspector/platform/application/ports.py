@@ -6,3 +6,8 @@ from .dtos import PlatformInfoDTO
 class PlatformCollectorPort(Protocol):
     def platform_info(self) -> PlatformInfoDTO:
         """Return platform information for the current OS."""
+
+
+class AsyncPlatformCollectorPort(Protocol):
+    async def aplatform_info(self) -> PlatformInfoDTO:
+        """Return platform information without blocking."""
@@ -9,3 +9,6 @@ class PlatformService:
 
     def get_platform_info(self) -> dict:
         return self.collector.platform_info().to_dict()
+
+    async def aget_platform_info(self) -> dict:
+        return (await self.collector.aplatform_info()).to_dict()
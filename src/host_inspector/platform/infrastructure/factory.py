@@ -2,6 +2,7 @@ import importlib
 import sys
 
 from host_inspector.platform.application.service import PlatformService
+from host_inspector.utils.instrumentutils import instrument
 
 
 def build_platform_service() -> PlatformService:
@@ -20,4 +21,4 @@ def build_platform_service() -> PlatformService:
 
     collector_module = importlib.import_module(module_name)
     collector_cls = getattr(collector_module, class_name)
-    return PlatformService(collector=collector_cls())
+    return PlatformService(collector=instrument(collector_cls(), "platform.collector"))
@@ -1,96 +1,123 @@
 import contextlib
 import platform
-import re
 import shlex
-import subprocess
-from functools import cache
 
 from host_inspector.platform.application.dtos import PlatformInfoDTO
+from host_inspector.utils.cacheutils import ttl_cache
+from host_inspector.utils.commandutils import COMMAND_ERRORS
+from host_inspector.utils.commandutils import arun_command
+from host_inspector.utils.commandutils import run_command
+from host_inspector.utils.sysfsutils import read_cpuinfo
+from host_inspector.utils.sysfsutils import read_devicetree
 
+MODEL_COMMAND = "sudo -n dmidecode -s system-family"
+MANUFACTURER_COMMAND = "sudo -n dmidecode -s system-manufacturer"
+SERIAL_COMMAND = "sudo -n dmidecode -s system-serial-number"
 
-@cache
+
+def _run(cmd: str) -> str:
+    proc = run_command(shlex.split(cmd))
+    return proc.stdout
+
+
+async def _arun(cmd: str) -> str:
+    proc = await arun_command(shlex.split(cmd))
+    return proc.stdout
+
+
+def _devicetree_model() -> str | None:
+    if model := read_devicetree("model"):
+        return model[0].strip()
+    return None
+
+
+@ttl_cache("platform")
 def _get_model() -> str:
-    """Safely get model."""
-    with contextlib.suppress(subprocess.CalledProcessError):
-        cmd = "cat /sys/firmware/devicetree/base/model"
-        proc = subprocess.run(  # noqa: S603
-            shlex.split(cmd),
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        return proc.stdout.strip().rstrip("\x00")
-
-    with contextlib.suppress(subprocess.CalledProcessError):
-        cmd = "sudo dmidecode -s system-family"
-        proc = subprocess.run(  # noqa: S603
-            shlex.split(cmd),
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        return proc.stdout.strip()
+    """Safely get model from the devicetree, then dmidecode."""
+    if model := _devicetree_model():
+        return model
+
+    with contextlib.suppress(*COMMAND_ERRORS):
+        return _run(MODEL_COMMAND).strip()
+
+    return "--"
+
+
+@ttl_cache("platform", name="get_model")
+async def _aget_model() -> str:
+    if model := _devicetree_model():
+        return model
+
+    with contextlib.suppress(*COMMAND_ERRORS):
+        return (await _arun(MODEL_COMMAND)).strip()
 
     return "--"
 
 
-@cache
+@ttl_cache("platform")
 def _get_manufacturer() -> str:
     """Safely get manufacturer."""
     if "Raspberry Pi" in _get_model():
         return "Raspberry Pi Ltd."
 
     try:
-        cmd = "sudo dmidecode -s system-manufacturer"
-        proc = subprocess.run(  # noqa: S603
-            shlex.split(cmd),
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        return proc.stdout.strip()
-    except subprocess.CalledProcessError:
+        return _run(MANUFACTURER_COMMAND).strip()
+    except COMMAND_ERRORS:
         return "--"
 
 
-@cache
+@ttl_cache("platform", name="get_manufacturer")
+async def _aget_manufacturer() -> str:
+    if "Raspberry Pi" in await _aget_model():
+        return "Raspberry Pi Ltd."
+
+    try:
+        return (await _arun(MANUFACTURER_COMMAND)).strip()
+    except COMMAND_ERRORS:
+        return "--"
+
+
+@ttl_cache("platform")
 def _get_serial() -> str:
-    """Safely get serial number."""
-    with contextlib.suppress(subprocess.CalledProcessError):
-        cmd = "cat /proc/cpuinfo"
-        proc = subprocess.run(  # noqa: S603
-            shlex.split(cmd),
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        result = proc.stdout.strip()
-        regex = r"(Serial\s+:)(.+)"
-        if match := re.search(regex, result):
-            return match[2]
-
-    with contextlib.suppress(subprocess.CalledProcessError):
-        cmd = "sudo dmidecode -s system-serial-number"
-        proc = subprocess.run(  # noqa: S603
-            shlex.split(cmd),
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        return proc.stdout.strip()
+    """Safely get serial number from /proc/cpuinfo, then dmidecode."""
+    if serial := read_cpuinfo().serial:
+        return serial
+
+    with contextlib.suppress(*COMMAND_ERRORS):
+        return _run(SERIAL_COMMAND).strip()
 
     return "--"
 
 
+@ttl_cache("platform", name="get_serial")
+async def _aget_serial() -> str:
+    if serial := read_cpuinfo().serial:
+        return serial
+
+    with contextlib.suppress(*COMMAND_ERRORS):
+        return (await _arun(SERIAL_COMMAND)).strip()
+
+    return "--"
+
+
+def _platform_info(manufacturer: str, model: str, serial: str) -> PlatformInfoDTO:
+    uname = platform.uname()
+    return PlatformInfoDTO(
+        system=uname.system,
+        release=uname.release,
+        machine=uname.machine,
+        architecture=platform.architecture()[0],
+        manufacturer=manufacturer,
+        model=model,
+        serial=serial,
+    )
+
+
 class LinuxPlatformCollector:
     def platform_info(self) -> PlatformInfoDTO:
-        uname = platform.uname()
-        return PlatformInfoDTO(
-            system=uname.system,
-            release=uname.release,
-            machine=uname.machine,
-            architecture=platform.architecture()[0],
-            manufacturer=_get_manufacturer(),
-            model=_get_model(),
-            serial=_get_serial(),
+        return _platform_info(_get_manufacturer(), _get_model(), _get_serial())
+
+    async def aplatform_info(self) -> PlatformInfoDTO:
+        return _platform_info(
+            await _aget_manufacturer(), await _aget_model(), await _aget_serial()
         )
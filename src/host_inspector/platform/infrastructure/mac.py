@@ -1,50 +1,58 @@
 import json
 import platform
 import shlex
-import subprocess
-from functools import cache
 
 from host_inspector.platform.application.dtos import PlatformInfoDTO
+from host_inspector.utils.cacheutils import ttl_cache
+from host_inspector.utils.commandutils import COMMAND_ERRORS
+from host_inspector.utils.commandutils import arun_command
+from host_inspector.utils.commandutils import run_command
 
+HARDWARE_COMMAND = "system_profiler -json SPHardwareDataType"
 
-@cache
+
+def _parse_hardware(output: str):
+    result = json.loads(output.strip())
+    if "SPHardwareDataType" in result:
+        return result["SPHardwareDataType"][0]
+    return None
+
+
+@ttl_cache("platform")
 def _get_hardware():
     """Safely get hardware."""
     try:
-        cmd = "system_profiler -json SPHardwareDataType"
-        proc = subprocess.run(  # noqa: S603
-            shlex.split(cmd),
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        result = json.loads(proc.stdout.strip())
-        if "SPHardwareDataType" in result:
-            return result["SPHardwareDataType"][0]
-    except subprocess.CalledProcessError:  # pragma: no cover
+        proc = run_command(shlex.split(HARDWARE_COMMAND))
+        return _parse_hardware(proc.stdout)
+    except COMMAND_ERRORS:  # pragma: no cover
         return None
-    return None
 
 
-@cache
-def _get_model() -> str:
-    return result.get("machine_name") if (result := _get_hardware()) else ""
+@ttl_cache("platform", name="get_hardware")
+async def _aget_hardware():
+    try:
+        proc = await arun_command(shlex.split(HARDWARE_COMMAND))
+        return _parse_hardware(proc.stdout)
+    except COMMAND_ERRORS:  # pragma: no cover
+        return None
 
 
-@cache
-def _get_serial() -> str:
-    return result.get("serial_number") if (result := _get_hardware()) else ""
+def _platform_info(hardware) -> PlatformInfoDTO:
+    uname = platform.uname()
+    return PlatformInfoDTO(
+        system=uname.system,
+        release=uname.release,
+        machine=uname.machine,
+        architecture=platform.architecture()[0],
+        manufacturer="Apple Inc.",
+        model=hardware.get("machine_name") if hardware else "",
+        serial=hardware.get("serial_number") if hardware else "",
+    )
 
 
 class MacPlatformCollector:
     def platform_info(self) -> PlatformInfoDTO:
-        uname = platform.uname()
-        return PlatformInfoDTO(
-            system=uname.system,
-            release=uname.release,
-            machine=uname.machine,
-            architecture=platform.architecture()[0],
-            manufacturer="Apple Inc.",
-            model=_get_model(),
-            serial=_get_serial(),
-        )
+        return _platform_info(_get_hardware())
+
+    async def aplatform_info(self) -> PlatformInfoDTO:
+        return _platform_info(await _aget_hardware())
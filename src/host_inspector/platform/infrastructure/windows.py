@@ -1,71 +1,95 @@
+import asyncio
 import platform
 import shlex
-import subprocess
-from functools import cache
 
 from host_inspector.platform.application.dtos import PlatformInfoDTO
+from host_inspector.utils.cacheutils import ttl_cache
+from host_inspector.utils.commandutils import COMMAND_ERRORS
+from host_inspector.utils.commandutils import arun_command
+from host_inspector.utils.commandutils import run_command
 
+MANUFACTURER_COMMAND = "powershell -Command '(Get-CimInstance -ClassName Win32_ComputerSystem).Manufacturer'"
+MODEL_COMMAND = (
+    "powershell -Command '(Get-CimInstance -ClassName Win32_ComputerSystem).Model'"
+)
+SERIAL_COMMAND = "powershell -Command '(Get-WmiObject win32_bios).SerialNumber'"
 
-@cache
+
+def _run(cmd: str) -> str:
+    proc = run_command(shlex.split(cmd))
+    return proc.stdout.strip()
+
+
+@ttl_cache("platform")
 def _get_manufacturer() -> str:
     """Safely get manufacturer."""
     try:
-        cmd = "powershell -Command '(Get-CimInstance -ClassName Win32_ComputerSystem).Manufacturer'"
-        proc = subprocess.run(  # noqa: S603
-            shlex.split(cmd),
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        result = proc.stdout.strip()
-        return result.replace("Manufacturer", "").strip()
-    except subprocess.CalledProcessError:
+        return _run(MANUFACTURER_COMMAND).replace("Manufacturer", "").strip()
+    except COMMAND_ERRORS:
         return "--"
 
 
-@cache
+@ttl_cache("platform")
 def _get_model() -> str:
     """Safely get model."""
     try:
-        cmd = "powershell -Command '(Get-CimInstance -ClassName Win32_ComputerSystem).Model'"
-        proc = subprocess.run(  # noqa: S603
-            shlex.split(cmd),
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        result = proc.stdout.strip()
-        return result.replace("Model", "").strip()
-    except subprocess.CalledProcessError:
+        return _run(MODEL_COMMAND).replace("Model", "").strip()
+    except COMMAND_ERRORS:
         return "--"
 
 
-@cache
+@ttl_cache("platform")
 def _get_serial() -> str:
     """Safely get serial number."""
     try:
-        cmd = "powershell -Command '(Get-WmiObject win32_bios).SerialNumber'"
-        proc = subprocess.run(  # noqa: S603
-            shlex.split(cmd),
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        result = proc.stdout.strip()
-        return result.replace("SerialNumber", "").strip()
-    except subprocess.CalledProcessError:
+        return _run(SERIAL_COMMAND).replace("SerialNumber", "").strip()
+    except COMMAND_ERRORS:
+        return "--"
+
+
+async def _arun_field(cmd: str, label: str) -> str:
+    try:
+        proc = await arun_command(shlex.split(cmd))
+        return proc.stdout.strip().replace(label, "").strip()
+    except COMMAND_ERRORS:
         return "--"
 
 
+@ttl_cache("platform", name="get_manufacturer")
+async def _aget_manufacturer() -> str:
+    return await _arun_field(MANUFACTURER_COMMAND, "Manufacturer")
+
+
+@ttl_cache("platform", name="get_model")
+async def _aget_model() -> str:
+    return await _arun_field(MODEL_COMMAND, "Model")
+
+
+@ttl_cache("platform", name="get_serial")
+async def _aget_serial() -> str:
+    return await _arun_field(SERIAL_COMMAND, "SerialNumber")
+
+
+def _platform_info(manufacturer: str, model: str, serial: str) -> PlatformInfoDTO:
+    uname = platform.uname()
+    return PlatformInfoDTO(
+        system=uname.system,
+        release=uname.release,
+        machine=uname.machine,
+        architecture=platform.architecture()[0],
+        manufacturer=manufacturer,
+        model=model,
+        serial=serial,
+    )
+
+
 class WindowsPlatformCollector:
     def platform_info(self) -> PlatformInfoDTO:
-        uname = platform.uname()
-        return PlatformInfoDTO(
-            system=uname.system,
-            release=uname.release,
-            machine=uname.machine,
-            architecture=platform.architecture()[0],
-            manufacturer=_get_manufacturer(),
-            model=_get_model(),
-            serial=_get_serial(),
+        return _platform_info(_get_manufacturer(), _get_model(), _get_serial())
+
+    async def aplatform_info(self) -> PlatformInfoDTO:
+        # The three powershell queries are independent, so run them together.
+        manufacturer, model, serial = await asyncio.gather(
+            _aget_manufacturer(), _aget_model(), _aget_serial()
         )
+        return _platform_info(manufacturer, model, serial)
@@ -0,0 +1,26 @@
+import asyncio
+from functools import cache
+
+from .infrastructure import build_pressure_service
+
+__all__ = ["aget_pressure_info", "get_pressure_info"]
+
+
+@cache
+def _get_pressure_service():
+    return build_pressure_service()
+
+
+def get_pressure_info() -> dict:
+    """Return load averages and PSI stall averages/rates as a dict.
+
+    ``stall_rate`` is the percent of time stalled since the previous call at
+    least a second ago (None before there is one), so polling this every
+    second yields per-second stall rates.
+    """
+    return _get_pressure_service().get_pressure_info()
+
+
+async def aget_pressure_info() -> dict:
+    """Return pressure info as a dict without blocking the event loop."""
+    return await asyncio.to_thread(get_pressure_info)
@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from dataclasses import field
+
+
+@dataclass(frozen=True)
+class PressureLineDTO:
+    """One ``some``/``full`` line of a /proc/pressure file."""
+
+    avg10: float
+    avg60: float
+    avg300: float
+    total: int  # cumulative stall time in microseconds
+
+
+@dataclass(frozen=True)
+class ResourcePressureDTO:
+    some: PressureLineDTO | None = None
+    full: PressureLineDTO | None = None
+
+
+@dataclass(frozen=True)
+class PressureSnapshotDTO:
+    load_average: tuple[float, float, float]
+    logical_cpus: int
+    timestamp: float  # monotonic seconds, for rates between snapshots
+    resources: dict[str, ResourcePressureDTO] = field(default_factory=dict)
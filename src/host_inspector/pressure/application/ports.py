@@ -0,0 +1,8 @@
+from typing import Protocol
+
+from .dtos import PressureSnapshotDTO
+
+
+class PressureProbePort(Protocol):
+    def snapshot(self) -> PressureSnapshotDTO:
+        """Return load averages and PSI counters for cpu, memory and io."""
@@ -0,0 +1,93 @@
+import threading
+from collections import deque
+from dataclasses import dataclass
+from dataclasses import field
+
+from host_inspector.pressure.domain import load_per_cpu
+from host_inspector.pressure.domain import stall_rate
+
+from .dtos import PressureLineDTO
+from .dtos import PressureSnapshotDTO
+from .ports import PressureProbePort
+
+LOAD_WINDOWS = ("1min", "5min", "15min")
+# Shortest window a stall rate is measured over; shorter ones are noise.
+MIN_RATE_INTERVAL_SECONDS = 1.0
+MAX_RECENT_SNAPSHOTS = 64
+
+
+class PressureHistory:
+    """Keep recent snapshots so counters can be turned into rates.
+
+    The service is shared by every caller (``get_pressure_info`` and each
+    ``get_health_info``), so a rate is measured against the newest snapshot
+    at least ``min_interval`` seconds old rather than whichever call came
+    last, which may have been milliseconds ago.
+    """
+
+    def __init__(self, min_interval: float = MIN_RATE_INTERVAL_SECONDS):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._recent: deque[PressureSnapshotDTO] = deque(maxlen=MAX_RECENT_SNAPSHOTS)
+
+    def baseline(self, snapshot: PressureSnapshotDTO) -> PressureSnapshotDTO | None:
+        """Record ``snapshot`` and return the one to diff it against, if any."""
+        with self._lock:
+            baseline = None
+            while (
+                self._recent
+                and snapshot.timestamp - self._recent[0].timestamp >= self.min_interval
+            ):
+                baseline = self._recent.popleft()
+            if baseline is not None:
+                # Still the best baseline for calls over the next interval.
+                self._recent.appendleft(baseline)
+            self._recent.append(snapshot)
+            return baseline
+
+
+def _line_info(
+    line: PressureLineDTO, before: PressureLineDTO | None, elapsed: float
+) -> dict:
+    return {
+        "avg10": line.avg10,
+        "avg60": line.avg60,
+        "avg300": line.avg300,
+        "total": line.total,
+        # Percent of wall time stalled over the last interval; None until a
+        # snapshot at least MIN_RATE_INTERVAL_SECONDS old exists.
+        "stall_rate": (
+            None if before is None else stall_rate(before.total, line.total, elapsed)
+        ),
+    }
+
+
+@dataclass(frozen=True)
+class PressureService:
+    probe: PressureProbePort
+    history: PressureHistory = field(default_factory=PressureHistory, compare=False)
+
+    def get_pressure_info(self) -> dict:
+        snapshot = self.probe.snapshot()
+        previous = self.history.baseline(snapshot)
+        elapsed = snapshot.timestamp - previous.timestamp if previous else 0.0
+
+        resources = {}
+        for name, pressure in snapshot.resources.items():
+            before = previous.resources.get(name) if previous else None
+            resources[name] = {
+                kind: _line_info(line, getattr(before, kind, None), elapsed)
+                for kind in ("some", "full")
+                if (line := getattr(pressure, kind)) is not None
+            }
+
+        return {
+            "load_average": dict(zip(LOAD_WINDOWS, snapshot.load_average, strict=True)),
+            "load_per_cpu": {
+                window: load_per_cpu(load, snapshot.logical_cpus)
+                for window, load in zip(
+                    LOAD_WINDOWS, snapshot.load_average, strict=True
+                )
+            },
+            **resources,
+        }
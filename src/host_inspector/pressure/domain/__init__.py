@@ -0,0 +1,4 @@
+from .rates import load_per_cpu
+from .rates import stall_rate
+
+__all__ = ["load_per_cpu", "stall_rate"]
@@ -0,0 +1,10 @@
+def stall_rate(before_us: int, after_us: int, elapsed: float) -> float | None:
+    """Return the percent of ``elapsed`` seconds spent stalled between two totals."""
+    if elapsed <= 0 or after_us < before_us:
+        return None
+    return round((after_us - before_us) / (elapsed * 1_000_000) * 100, 2)
+
+
+def load_per_cpu(load: float, logical_cpus: int) -> float | None:
+    """Return a load average normalized by CPU count (1.0 means saturated)."""
+    return round(load / logical_cpus, 2) if logical_cpus > 0 else None
@@ -0,0 +1,3 @@
+from .factory import build_pressure_service
+
+__all__ = ["build_pressure_service"]
@@ -0,0 +1,12 @@
+import sys
+
+from host_inspector.pressure.application.service import PressureService
+from host_inspector.utils.instrumentutils import instrument
+
+from .linux import ProcPressureProbe
+from .probe import PsutilPressureProbe
+
+
+def build_pressure_service() -> PressureService:
+    probe = ProcPressureProbe() if sys.platform == "linux" else PsutilPressureProbe()
+    return PressureService(probe=instrument(probe, "pressure.probe"))
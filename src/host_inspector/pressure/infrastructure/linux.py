@@ -0,0 +1,67 @@
+import time
+from pathlib import Path
+
+import psutil
+
+from host_inspector.pressure.application.dtos import PressureLineDTO
+from host_inspector.pressure.application.dtos import PressureSnapshotDTO
+from host_inspector.pressure.application.dtos import ResourcePressureDTO
+from host_inspector.utils.sysfsutils import OpenProcFiles
+
+PRESSURE_ROOT = Path("/proc/pressure")
+LOADAVG_PATH = Path("/proc/loadavg")
+RESOURCES = ("cpu", "memory", "io")
+
+
+def parse_pressure(text: str) -> ResourcePressureDTO:
+    """Parse a /proc/pressure file, e.g. ``some avg10=0.12 ... total=12345``."""
+    lines: dict[str, PressureLineDTO] = {}
+    for line in text.splitlines():
+        kind, _, rest = line.partition(" ")
+        values = dict(item.split("=", 1) for item in rest.split() if "=" in item)
+        try:
+            lines[kind] = PressureLineDTO(
+                avg10=float(values["avg10"]),
+                avg60=float(values["avg60"]),
+                avg300=float(values["avg300"]),
+                total=int(values["total"]),
+            )
+        except (KeyError, ValueError):
+            continue
+    return ResourcePressureDTO(some=lines.get("some"), full=lines.get("full"))
+
+
+def parse_loadavg(text: str) -> tuple[float, float, float]:
+    """Parse the first three fields of /proc/loadavg."""
+    one, five, fifteen = (float(value) for value in text.split()[:3])
+    return one, five, fifteen
+
+
+class ProcPressureProbe:
+    """Read /proc/loadavg and /proc/pressure/* through file descriptors kept open.
+
+    PSI is missing on kernels before 4.20 or when disabled; load averages then
+    come from psutil.
+    """
+
+    def __init__(self, root: Path = PRESSURE_ROOT, loadavg_path: Path = LOADAVG_PATH):
+        self.root = root
+        self.loadavg_path = loadavg_path
+        self._files = OpenProcFiles()
+
+    def close(self) -> None:
+        self._files.close()
+
+    def snapshot(self) -> PressureSnapshotDTO:
+        text = self._files.read(self.loadavg_path)
+        load = parse_loadavg(text) if text else psutil.getloadavg()
+        resources = {}
+        for name in RESOURCES:
+            if (text := self._files.read(self.root / name)) is not None:
+                resources[name] = parse_pressure(text)
+        return PressureSnapshotDTO(
+            load_average=load,
+            logical_cpus=psutil.cpu_count() or 0,
+            timestamp=time.monotonic(),
+            resources=resources,
+        )
@@ -0,0 +1,16 @@
+import time
+
+import psutil
+
+from host_inspector.pressure.application.dtos import PressureSnapshotDTO
+
+
+class PsutilPressureProbe:
+    """Load averages only; PSI is Linux-specific."""
+
+    def snapshot(self) -> PressureSnapshotDTO:
+        return PressureSnapshotDTO(
+            load_average=psutil.getloadavg(),
+            logical_cpus=psutil.cpu_count() or 0,
+            timestamp=time.monotonic(),
+        )
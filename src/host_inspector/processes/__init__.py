@@ -0,0 +1,23 @@
+from functools import cache
+
+from .application.service import DEFAULT_INTERVAL_SECONDS
+from .infrastructure import build_process_table
+
+__all__ = ["get_top_processes"]
+
+
+@cache
+def _get_process_table():
+    return build_process_table()
+
+
+def get_top_processes(
+    n: int = 10, by: str = "cpu", interval: float = DEFAULT_INTERVAL_SECONDS
+) -> list[dict]:
+    """Return the top ``n`` processes by ``cpu``, ``rss`` or ``io``.
+
+    The process table is shared, so CPU and I/O rates after the first call
+    cover the time since the previous CPU or I/O ranking, and never less
+    than ``interval`` seconds.
+    """
+    return _get_process_table().top(n=n, by=by, interval=interval)
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ProcessInfoDTO:
+    """One process as read in a pass; counters are cumulative since it started."""
+
+    pid: int
+    name: str
+    username: str | None
+    create_time: float
+    cpu_seconds: float  # user + system
+    rss: int
+    io_bytes: int  # read + written
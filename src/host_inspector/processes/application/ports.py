@@ -0,0 +1,8 @@
+from typing import Protocol
+
+from .dtos import ProcessInfoDTO
+
+
+class ProcessProbePort(Protocol):
+    def processes(self) -> list[ProcessInfoDTO]:
+        """Yield every process visible to us, read in a single pass."""
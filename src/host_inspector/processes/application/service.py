@@ -0,0 +1,145 @@
+import heapq
+import threading
+import time
+from array import array
+from collections.abc import Callable
+
+from .dtos import ProcessInfoDTO
+from .ports import ProcessProbePort
+
+DEFAULT_INTERVAL_SECONDS = 0.5
+SORT_KEYS = ("cpu", "rss", "io")
+
+
+class _Pass:
+    """One pass over the process list stored column-wise.
+
+    Numbers live in ``array`` columns indexed by row, and ``rows`` maps a
+    pid to its row, so thousands of processes cost a few flat buffers
+    rather than a dict per process.
+    """
+
+    def __init__(self, at: float):
+        self.at = at
+        self.rows: dict[int, int] = {}
+        self.pids = array("q")
+        self.names: list[str] = []
+        self.usernames: list[str | None] = []
+        self.create_time = array("d")
+        self.cpu_seconds = array("d")
+        self.rss = array("Q")
+        self.io_bytes = array("Q")
+        self.cpu_percent = array("d")
+        self.io_bps = array("d")
+
+    def __len__(self) -> int:
+        return len(self.pids)
+
+    def add(self, proc: ProcessInfoDTO) -> None:
+        self.rows[proc.pid] = len(self.pids)
+        self.pids.append(proc.pid)
+        self.names.append(proc.name)
+        self.usernames.append(proc.username)
+        self.create_time.append(proc.create_time)
+        self.cpu_seconds.append(proc.cpu_seconds)
+        self.rss.append(proc.rss)
+        self.io_bytes.append(proc.io_bytes)
+
+    def diff(self, previous: "_Pass | None") -> None:
+        """Fill the rate columns from the deltas against ``previous``.
+
+        A pid that is new, or was reused by a different process (its
+        create time changed), has no baseline and reports zero.
+        """
+        elapsed = self.at - previous.at if previous is not None else 0.0
+        for row, pid in enumerate(self.pids):
+            before = previous.rows.get(pid) if previous is not None else None
+            if (
+                before is None
+                or elapsed <= 0
+                or previous.create_time[before] != self.create_time[row]
+            ):
+                self.cpu_percent.append(0.0)
+                self.io_bps.append(0.0)
+                continue
+            cpu = self.cpu_seconds[row] - previous.cpu_seconds[before]
+            io = self.io_bytes[row] - previous.io_bytes[before]
+            self.cpu_percent.append(max(0.0, cpu) / elapsed * 100)
+            self.io_bps.append(max(0, io) / elapsed)
+
+    def row(self, row: int) -> dict:
+        return {
+            "pid": self.pids[row],
+            "name": self.names[row],
+            "username": self.usernames[row],
+            "cpu_percent": round(self.cpu_percent[row], 1),
+            "rss": self.rss[row],
+            "io_bps": round(self.io_bps[row], 1),
+        }
+
+
+class ProcessTable:
+    """Rank processes by CPU, resident memory or I/O from one pass each.
+
+    Each pass is a single read of the process list through the probe, and
+    the CPU and I/O rates are deltas against the previous pass.
+    ``cpu_percent`` is relative to one CPU, as in ``top``.
+    """
+
+    def __init__(
+        self,
+        probe: ProcessProbePort,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.probe = probe
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._previous: _Pass | None = None
+
+    def sample(self, *, keep: bool = True) -> _Pass:
+        """Take one pass and diff it against the last kept one.
+
+        With ``keep=False`` the pass is not stored, so the next rates are
+        still measured against the previous baseline.
+        """
+        current = _Pass(self._clock())
+        for proc in self.probe.processes():
+            current.add(proc)
+        with self._lock:
+            current.diff(self._previous)
+            if keep:
+                self._previous = current
+        return current
+
+    def _wait_for_baseline(self, interval: float) -> None:
+        """Make sure the kept pass is at least ``interval`` seconds old."""
+        previous = self._previous
+        if previous is None:
+            self.sample()
+            time.sleep(interval)
+        elif (remaining := interval - (self._clock() - previous.at)) > 0:
+            # Called again right away (or by another caller): a rate over a
+            # few milliseconds is mostly noise, so wait out the interval.
+            time.sleep(remaining)
+
+    def top(
+        self, n: int = 10, by: str = "cpu", interval: float = DEFAULT_INTERVAL_SECONDS
+    ) -> list[dict]:
+        """Return the ``n`` heaviest processes by ``cpu``, ``rss`` or ``io``.
+
+        CPU and I/O rates are measured since the last CPU or I/O ranking,
+        over at least ``interval`` seconds: the first ranking takes a
+        baseline pass and waits, and one that comes sooner sleeps for the
+        rest of the interval. An ``rss`` ranking needs no rates and leaves
+        the baseline alone.
+        """
+        if by not in SORT_KEYS:
+            msg = f"Unknown sort key {by!r}; expected one of {', '.join(SORT_KEYS)}"
+            raise ValueError(msg)
+        if by != "rss":
+            self._wait_for_baseline(interval)
+        table = self.sample(keep=by != "rss")
+        column = {"cpu": table.cpu_percent, "rss": table.rss, "io": table.io_bps}[by]
+        rows = heapq.nlargest(n, range(len(table)), key=column.__getitem__)
+        return [table.row(row) for row in rows]
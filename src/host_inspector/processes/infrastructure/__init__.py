@@ -0,0 +1,3 @@
+from .factory import build_process_table
+
+__all__ = ["build_process_table"]
@@ -0,0 +1,8 @@
+from host_inspector.processes.application.service import ProcessTable
+from host_inspector.utils.instrumentutils import instrument
+
+from .probe import PsutilProcessProbe
+
+
+def build_process_table() -> ProcessTable:
+    return ProcessTable(probe=instrument(PsutilProcessProbe(), "processes.probe"))
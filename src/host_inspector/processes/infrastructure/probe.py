@@ -0,0 +1,40 @@
+from collections.abc import Callable
+from collections.abc import Iterable
+
+import psutil
+
+from host_inspector.processes.application.dtos import ProcessInfoDTO
+
+# Fetched per process inside one ``oneshot()`` block by ``process_iter``.
+ATTRS = ("name", "username", "create_time", "cpu_times", "memory_info", "io_counters")
+
+
+def _process_info(pid: int, info: dict) -> ProcessInfoDTO:
+    cpu, memory, io = info["cpu_times"], info["memory_info"], info["io_counters"]
+    return ProcessInfoDTO(
+        pid=pid,
+        name=info["name"] or "",
+        username=info["username"],
+        create_time=info["create_time"] or 0.0,
+        cpu_seconds=cpu.user + cpu.system if cpu else 0.0,
+        rss=memory.rss if memory else 0,
+        io_bytes=io.read_bytes + io.write_bytes if io else 0,
+    )
+
+
+class PsutilProcessProbe:
+    """One ``psutil.process_iter`` pass over the attributes in ``ATTRS``.
+
+    Attributes a process denies us (or that the platform lacks, such as
+    ``io_counters`` on macOS) read as zero.
+    """
+
+    def __init__(self, process_iter: Callable[..., Iterable] = psutil.process_iter):
+        self._process_iter = process_iter
+
+    def processes(self) -> list[ProcessInfoDTO]:
+        # A list rather than a generator, so instrumentation times the pass.
+        return [
+            _process_info(proc.pid, proc.info)
+            for proc in self._process_iter(attrs=list(ATTRS), ad_value=None)
+        ]
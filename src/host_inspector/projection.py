@@ -0,0 +1,87 @@
+import importlib
+from collections.abc import Iterable
+
+__all__ = ["collect"]
+
+# section -> (module, function, keyword the function projects on). Sections
+# without a keyword are cheap to collect whole and are filtered afterwards.
+SECTIONS = {
+    "cpu": ("host_inspector.cpu", "get_cpu_info", "fields"),
+    "datetime": ("host_inspector.date_time", "get_datetime_info", None),
+    "device": ("host_inspector.device", "get_device_info", "sections"),
+    "disk": ("host_inspector.disk", "get_disk_info", "fields"),
+    "display": ("host_inspector.display", "get_display_info", None),
+    "firewall": ("host_inspector.firewall", "get_firewall_info", None),
+    "frequency": ("host_inspector.frequency", "get_frequency_info", None),
+    "gpu": ("host_inspector.gpu", "get_gpu_info", None),
+    "health": ("host_inspector.health", "get_health_info", "sections"),
+    "mem": ("host_inspector.memory", "get_mem_info", "fields"),
+    "network": ("host_inspector.network", "get_network_info", None),
+    "os": ("host_inspector.os", "get_os_info", None),
+    "platform": ("host_inspector.platform", "get_platform_info", None),
+    "pressure": ("host_inspector.pressure", "get_pressure_info", None),
+    "uptime": ("host_inspector.uptime", "get_uptime_info", None),
+}
+
+
+def _plan(
+    sections: Iterable[str] | None, fields: Iterable[str] | None
+) -> dict[str, set[str] | None]:
+    """Map each section to the keys requested from it (``None`` for all)."""
+    # A bare string is one name, not an iterable of one-letter names.
+    if isinstance(sections, str):
+        sections = (sections,)
+    if isinstance(fields, str):
+        fields = (fields,)
+    plan: dict[str, set[str] | None] = {}
+    for section in sections or ():
+        plan[section] = None
+    for path in fields or ():
+        section, sep, key = path.partition(".")
+        if not sep or not key:
+            msg = f"Field {path!r} must look like '<section>.<key>'"
+            raise ValueError(msg)
+        if section in plan and plan[section] is None:
+            continue
+        plan.setdefault(section, set()).add(key)
+
+    if unknown := set(plan).difference(SECTIONS):
+        msg = f"Unknown section(s): {', '.join(sorted(unknown))}"
+        raise ValueError(msg)
+    return plan
+
+
+def collect(
+    sections: Iterable[str] | None = None, fields: Iterable[str] | None = None
+) -> dict:
+    """Return only the requested host information, keyed by section.
+
+    ``sections`` names whole sections (``"mem"``, ``"device"``); ``fields``
+    names keys within a section (``"cpu.count"``, ``"device.os"``); either
+    may also be a single name. Ports that feed none of the requested keys
+    are not run, so ``cpu.count`` never samples usage and ``device.os``
+    never probes the GPU or displays.
+    """
+    plan = _plan(sections, fields)
+    if not plan:
+        msg = "Request at least one section or field"
+        raise ValueError(msg)
+
+    result = {}
+    for section, keys in plan.items():
+        module_name, func_name, keyword = SECTIONS[section]
+        func = getattr(importlib.import_module(module_name), func_name)
+        if keys is None:
+            result[section] = func()
+        elif keyword is not None:
+            result[section] = func(**{keyword: keys})
+        else:
+            info = func()
+            if not isinstance(info, dict):
+                msg = f"Section {section!r} has no fields; request it whole"
+                raise ValueError(msg)
+            if unknown := keys.difference(info):
+                msg = f"Unknown {section} field(s): {', '.join(sorted(unknown))}"
+                raise ValueError(msg)
+            result[section] = {key: value for key, value in info.items() if key in keys}
+    return result
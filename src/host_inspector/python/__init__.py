@@ -2,7 +2,7 @@ from functools import cache
 
 from .infrastructure import build_python_service
 
-__all__ = ["get_python_info"]
+__all__ = ["aget_python_info", "get_python_info"]
 
 
 @cache
@@ -13,3 +13,9 @@ def _get_python_service():
 def get_python_info() -> dict:
     """Get current Python info as dict."""
     return _get_python_service().get_python_info()
+
+
+async def aget_python_info() -> dict:
+    """Get current Python info as dict without blocking."""
+    # psutil/stdlib reads only; nothing here waits on a subprocess.
+    return get_python_info()
@@ -1,7 +1,8 @@
 from host_inspector.python.application.service import PythonService
+from host_inspector.utils.instrumentutils import instrument
 
 from .probe import SystemPythonProbe
 
 
 def build_python_service() -> PythonService:
-    return PythonService(probe=SystemPythonProbe())
+    return PythonService(probe=instrument(SystemPythonProbe(), "python.probe"))
@@ -0,0 +1,33 @@
+from functools import cache
+
+from .infrastructure import build_metric_sampler
+
+__all__ = [
+    "get_metric_stats",
+    "start_metric_sampler",
+    "stop_metric_sampler",
+]
+
+
+@cache
+def _get_metric_sampler():
+    return build_metric_sampler()
+
+
+def start_metric_sampler(
+    interval: float | None = None, retention: float | None = None
+) -> None:
+    """Start the process-wide sampler (1 s interval, 5 min retention by default)."""
+    _get_metric_sampler().start(interval=interval, retention=retention)
+
+
+def stop_metric_sampler() -> None:
+    _get_metric_sampler().stop()
+
+
+def get_metric_stats(window: float = 60.0) -> dict[str, dict | None]:
+    """Return windowed min/mean/max/p95 for each sampled metric.
+
+    A metric is None until the sampler has data inside the window.
+    """
+    return _get_metric_sampler().stats(window)
@@ -0,0 +1,3 @@
+from .service import MetricSampler
+
+__all__ = ["MetricSampler"]
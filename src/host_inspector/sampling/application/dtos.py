@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class MetricCountersDTO:
+    """Everything one sampler tick reads: cumulative counters and memory use."""
+
+    cpu_times: Any  # a ``psutil.cpu_times()`` result
+    memory_percent: float
+    disk_read_bytes: int = 0
+    disk_write_bytes: int = 0
+    net_sent_bytes: int = 0
+    net_recv_bytes: int = 0
@@ -0,0 +1,8 @@
+from typing import Protocol
+
+from .dtos import MetricCountersDTO
+
+
+class MetricProbePort(Protocol):
+    def snapshot(self) -> MetricCountersDTO:
+        """Return CPU times, memory percent and cumulative disk/network bytes."""
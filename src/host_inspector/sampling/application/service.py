@@ -0,0 +1,136 @@
+import math
+import threading
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from host_inspector.cpu.infrastructure.sampler import busy_percent
+from host_inspector.utils.ringutils import RingBuffer
+
+from .ports import MetricProbePort
+
+if TYPE_CHECKING:
+    from .dtos import MetricCountersDTO
+
+DEFAULT_INTERVAL_SECONDS = 1.0
+DEFAULT_RETENTION_SECONDS = 300.0
+
+METRICS = (
+    "cpu_percent",
+    "mem_percent",
+    "disk_read_bps",
+    "disk_write_bps",
+    "net_sent_bps",
+    "net_recv_bps",
+)
+# rate metric -> the cumulative counter it is derived from.
+RATE_COUNTERS = {
+    "disk_read_bps": "disk_read_bytes",
+    "disk_write_bps": "disk_write_bytes",
+    "net_sent_bps": "net_sent_bytes",
+    "net_recv_bps": "net_recv_bytes",
+}
+
+
+class MetricSampler:
+    """Sample CPU, memory, disk and network at a fixed rate into ring buffers.
+
+    Each metric keeps ``retention / interval`` samples in preallocated
+    buffers, so memory stays constant however long the sampler runs.
+    Counters (CPU times, disk and network bytes) are stored as rates over
+    the preceding interval.
+    """
+
+    def __init__(
+        self,
+        probe: MetricProbePort,
+        interval: float = DEFAULT_INTERVAL_SECONDS,
+        retention: float = DEFAULT_RETENTION_SECONDS,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.probe = probe
+        self.interval = interval
+        self.retention = retention
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._allocate()
+
+    def _allocate(self) -> None:
+        capacity = max(1, math.ceil(self.retention / self.interval))
+        self._buffers = {name: RingBuffer(capacity) for name in METRICS}
+        self._previous: tuple[float, MetricCountersDTO] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def sample(self) -> None:
+        """Take one sample now; the background thread calls this every interval."""
+        now = self._clock()
+        counters = self.probe.snapshot()
+        with self._lock:
+            self._buffers["mem_percent"].append(now, counters.memory_percent)
+            if self._previous is not None:
+                then, before = self._previous
+                elapsed = now - then
+                if elapsed > 0:
+                    self._buffers["cpu_percent"].append(
+                        now, busy_percent(before.cpu_times, counters.cpu_times)
+                    )
+                    for name, counter in RATE_COUNTERS.items():
+                        delta = getattr(counters, counter) - getattr(before, counter)
+                        self._buffers[name].append(now, max(0, delta) / elapsed)
+            self._previous = (now, counters)
+
+    def stats(self, window: float = 60.0) -> dict[str, dict | None]:
+        """Return min/mean/max/p95 per metric over the last ``window`` seconds."""
+        start = self._clock() - window
+        with self._lock:
+            return {
+                name: stats.to_dict() if (stats := buffer.stats(start)) else None
+                for name, buffer in self._buffers.items()
+            }
+
+    def start(
+        self, interval: float | None = None, retention: float | None = None
+    ) -> None:
+        """Start sampling; calling start on a running sampler is a no-op.
+
+        Changing ``interval`` or ``retention`` reallocates (and clears) the
+        buffers. Rates restart from the first new sample, so none spans the
+        time the sampler was stopped.
+        """
+        with self._lock:
+            if self.running:
+                return
+            if interval is not None or retention is not None:
+                self.interval = interval or self.interval
+                self.retention = retention or self.retention
+                self._allocate()
+            self._previous = None
+            # A fresh event per thread, so a thread that outlived its stop()
+            # join cannot be revived by this start().
+            self._stop = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(self._stop,),
+                name="host-inspector-metric-sampler",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        with self._lock:
+            thread, self._thread = self._thread, None
+            self._stop.set()
+        if thread is None:
+            return
+        thread.join(timeout)
+
+    def _run(self, stop: threading.Event) -> None:
+        self.sample()
+        while not stop.wait(self.interval):
+            self.sample()
@@ -0,0 +1,3 @@
+from .factory import build_metric_sampler
+
+__all__ = ["build_metric_sampler"]
@@ -0,0 +1,8 @@
+from host_inspector.sampling.application.service import MetricSampler
+from host_inspector.utils.instrumentutils import instrument
+
+from .probe import PsutilMetricProbe
+
+
+def build_metric_sampler() -> MetricSampler:
+    return MetricSampler(probe=instrument(PsutilMetricProbe(), "sampling.probe"))
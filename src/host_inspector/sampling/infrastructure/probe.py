@@ -0,0 +1,17 @@
+import psutil
+
+from host_inspector.sampling.application.dtos import MetricCountersDTO
+
+
+class PsutilMetricProbe:
+    def snapshot(self) -> MetricCountersDTO:
+        disk = psutil.disk_io_counters()
+        net = psutil.net_io_counters()
+        return MetricCountersDTO(
+            cpu_times=psutil.cpu_times(),
+            memory_percent=psutil.virtual_memory().percent,
+            disk_read_bytes=disk.read_bytes if disk else 0,
+            disk_write_bytes=disk.write_bytes if disk else 0,
+            net_sent_bytes=net.bytes_sent if net else 0,
+            net_recv_bytes=net.bytes_recv if net else 0,
+        )
@@ -1,8 +1,9 @@
+import asyncio
 from functools import cache
 
 from .infrastructure import build_uptime_service
 
-all__all__ = ["get_uptime_info"]
+__all__ = ["aget_uptime_info", "get_uptime_info"]
 
 
 @cache
@@ -13,3 +14,9 @@ def _get_uptime_service():
 def get_uptime_info() -> dict:
     """Return uptime info as a dict."""
     return _get_uptime_service().get_uptime_info()
+
+
+async def aget_uptime_info() -> dict:
+    """Return uptime info as a dict without blocking the event loop."""
+    # procfs/sysfs reads; run off the loop like any other file I/O.
+    return await asyncio.to_thread(get_uptime_info)
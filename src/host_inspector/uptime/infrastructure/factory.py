@@ -1,7 +1,8 @@
 from host_inspector.uptime.application.service import UptimeService
+from host_inspector.utils.instrumentutils import instrument
 
 from .probe import PsutilUptimeProbe
 
 
 def build_uptime_service() -> UptimeService:
-    return UptimeService(probe=PsutilUptimeProbe())
+    return UptimeService(probe=instrument(PsutilUptimeProbe(), "uptime.probe"))
@@ -0,0 +1,236 @@
+import inspect
+import threading
+import time
+from collections.abc import Callable
+from collections.abc import Hashable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from dataclasses import replace
+from functools import wraps
+from typing import Any
+
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: float | None
+
+
+class TTLCache:
+    """Thread-safe store of probe results grouped by subsystem.
+
+    Entries are keyed by probe name (``"<subsystem>.<probe>"``) and call
+    arguments. A TTL of ``None`` means the entry never expires on its own.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[Hashable, _Entry]] = {}
+        self._ttls: dict[str, float | None] = {}
+        self._stats: dict[str, CacheStats] = {}
+
+    @staticmethod
+    def _subsystem(name: str) -> str:
+        return name.split(".", 1)[0]
+
+    def _stats_for(self, subsystem: str) -> CacheStats:
+        return self._stats.setdefault(subsystem, CacheStats())
+
+    def configure_ttl(self, name: str, ttl: float | None) -> None:
+        """Override the TTL for a subsystem (``"gpu"``) or a probe (``"gpu.get_resolution"``)."""
+        with self._lock:
+            self._ttls[name] = ttl
+
+    def reset_ttl(self, name: str | None = None) -> None:
+        """Drop TTL overrides for one subsystem/probe, or all of them."""
+        with self._lock:
+            if name is None:
+                self._ttls.clear()
+            else:
+                self._ttls.pop(name, None)
+
+    def resolve_ttl(self, name: str, default: float | None) -> float | None:
+        """Return the effective TTL: probe override, subsystem override, then default."""
+        with self._lock:
+            if name in self._ttls:
+                return self._ttls[name]
+            return self._ttls.get(self._subsystem(name), default)
+
+    def get(self, name: str, key: Hashable) -> Any:
+        """Return a cached value, or the module-level ``_MISSING`` sentinel."""
+        subsystem = self._subsystem(name)
+        with self._lock:
+            stats = self._stats_for(subsystem)
+            entries = self._entries.get(subsystem, {})
+            entry = entries.get((name, key))
+            if entry is None:
+                stats.misses += 1
+                return _MISSING
+            if entry.expires_at is not None and entry.expires_at <= self._clock():
+                del entries[(name, key)]
+                stats.evictions += 1
+                stats.misses += 1
+                return _MISSING
+            stats.hits += 1
+            return entry.value
+
+    def set(self, name: str, key: Hashable, value: Any, ttl: float | None) -> None:
+        expires_at = None if ttl is None else self._clock() + ttl
+        with self._lock:
+            subsystem = self._subsystem(name)
+            self._entries.setdefault(subsystem, {})[(name, key)] = _Entry(
+                value=value, expires_at=expires_at
+            )
+
+    def invalidate(self, name: str | None = None, key: Hashable = _MISSING) -> int:
+        """Evict entries and return how many were removed.
+
+        With no arguments everything is evicted; ``name`` may be a subsystem or
+        a probe name, and ``key`` narrows a probe to a single set of arguments.
+        """
+        with self._lock:
+            targets = list(self._entries) if name is None else [self._subsystem(name)]
+
+            removed = 0
+            for subsystem in targets:
+                entries = self._entries.get(subsystem, {})
+                if name is None or name == subsystem:
+                    doomed = list(entries)
+                elif key is _MISSING:
+                    doomed = [k for k in entries if k[0] == name]
+                else:
+                    doomed = [k for k in entries if k == (name, key)]
+                for entry_key in doomed:
+                    del entries[entry_key]
+                self._stats_for(subsystem).evictions += len(doomed)
+                removed += len(doomed)
+            return removed
+
+    def stats(self, subsystem: str | None = None) -> CacheStats:
+        """Return a copy of the stats for one subsystem, or totals across all."""
+        with self._lock:
+            if subsystem is not None:
+                return replace(self._stats_for(subsystem))
+            total = CacheStats()
+            for stats in self._stats.values():
+                total.hits += stats.hits
+                total.misses += stats.misses
+                total.evictions += stats.evictions
+            return total
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+_cache = TTLCache()
+
+# Set by `track_lookups`; each decorated helper appends True (hit) or False.
+_lookups: ContextVar[list[bool] | None] = ContextVar("cache_lookups", default=None)
+
+
+@contextmanager
+def track_lookups() -> Iterator[list[bool]]:
+    """Record whether each cached-helper lookup made in this context was a hit."""
+    lookups: list[bool] = []
+    token = _lookups.set(lookups)
+    try:
+        yield lookups
+    finally:
+        _lookups.reset(token)
+
+
+def _note_lookup(value: Any) -> None:
+    if (lookups := _lookups.get()) is not None:
+        lookups.append(value is not _MISSING)
+
+
+def _make_key(args: tuple, kwargs: dict) -> Hashable:
+    return (args, tuple(sorted(kwargs.items()))) if kwargs else args
+
+
+def ttl_cache(subsystem: str, ttl: float | None = None, *, name: str | None = None):
+    """Cache a probe helper in the shared cache under ``subsystem``.
+
+    ``ttl`` is the default lifetime in seconds (``None`` never expires); it can
+    be overridden at runtime with :func:`configure_ttl`. Coroutine functions
+    cache their awaited result; pass the same ``name`` to a sync helper and its
+    async twin so they share one entry.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        probe_name = f"{subsystem}.{name or func.__name__.lstrip('_')}"
+
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                key = _make_key(args, kwargs)
+                value = _cache.get(probe_name, key)
+                _note_lookup(value)
+                if value is _MISSING:
+                    value = await func(*args, **kwargs)
+                    _cache.set(
+                        probe_name, key, value, _cache.resolve_ttl(probe_name, ttl)
+                    )
+                return value
+
+        else:
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                key = _make_key(args, kwargs)
+                value = _cache.get(probe_name, key)
+                _note_lookup(value)
+                if value is _MISSING:
+                    value = func(*args, **kwargs)
+                    _cache.set(
+                        probe_name, key, value, _cache.resolve_ttl(probe_name, ttl)
+                    )
+                return value
+
+        def invalidate(*args, **kwargs) -> int:
+            return _cache.invalidate(probe_name, _make_key(args, kwargs))
+
+        wrapper.probe_name = probe_name
+        wrapper.invalidate = invalidate
+        wrapper.cache_clear = lambda: _cache.invalidate(probe_name)
+        return wrapper
+
+    return decorator
+
+
+def configure_ttl(name: str, ttl: float | None) -> None:
+    """Set the TTL for a subsystem (``"network"``) or probe (``"gpu.get_resolution"``)."""
+    _cache.configure_ttl(name, ttl)
+
+
+def reset_ttl(name: str | None = None) -> None:
+    """Restore default TTLs for one subsystem/probe, or all of them."""
+    _cache.reset_ttl(name)
+
+
+def invalidate(name: str | None = None) -> int:
+    """Evict cached results for a probe, a subsystem, or everything."""
+    return _cache.invalidate(name)
+
+
+def cache_stats(subsystem: str | None = None) -> CacheStats:
+    """Return hit/miss/eviction counts for a subsystem, or totals."""
+    return _cache.stats(subsystem)
+
+
+def reset_cache_stats() -> None:
+    _cache.reset_stats()
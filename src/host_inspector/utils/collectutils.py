@@ -0,0 +1,211 @@
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Sequence
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import wait
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_PROBE_TIMEOUT_SECONDS = 10.0
+DEFAULT_DEADLINE_SECONDS = 15.0
+
+
+@dataclass(frozen=True)
+class ProbeTask:
+    name: str
+    func: Callable[[], Any]
+    default: Any = None
+    timeout: float | None = DEFAULT_PROBE_TIMEOUT_SECONDS
+
+
+def select_tasks(
+    tasks: Sequence[ProbeTask], names: Iterable[str] | None
+) -> list[ProbeTask]:
+    """Return the tasks named in ``names`` (all of them for ``None``)."""
+    if names is None:
+        return list(tasks)
+    names = set(names)
+    return [task for task in tasks if task.name in names]
+
+
+def task_defaults(tasks: Sequence[ProbeTask]) -> dict[str, Any]:
+    return {task.name: task.default for task in tasks}
+
+
+def run_in_thread(
+    func: Callable[..., Any], *args: Any, name: str = "host-inspector-probe"
+) -> Future:
+    """Run ``func(*args)`` on a new daemon thread and return a future for it.
+
+    Unlike executor workers, daemon threads are not joined at interpreter
+    exit, so a call stuck in the kernel (a dead NFS mount, a wedged driver)
+    cannot hold up shutdown. Await the result with ``asyncio.wrap_future``.
+    """
+    future: Future = Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = func(*args)
+        except BaseException as exc:  # noqa: BLE001 - handed to the caller
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+    threading.Thread(target=run, name=name, daemon=True).start()
+    return future
+
+
+class AbandonedProbes:
+    """Probes whose timed-out thread is still running.
+
+    A probe stuck in the kernel may never return. Launching it again on the
+    next collection would only strand another thread next to it, so it
+    yields its default until the first thread finishes, which bounds the
+    stuck threads to one per probe.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._running: set[Callable[[], Any]] = set()
+
+    def __contains__(self, func: Callable[[], Any]) -> bool:
+        with self._lock:
+            return func in self._running
+
+    def add(self, func: Callable[[], Any], future: Future) -> None:
+        with self._lock:
+            self._running.add(func)
+        future.add_done_callback(lambda _: self.discard(func))
+
+    def discard(self, func: Callable[[], Any]) -> None:
+        with self._lock:
+            self._running.discard(func)
+
+
+_abandoned = AbandonedProbes()
+
+
+def _expiry(task: ProbeTask, started: float, deadline_at: float | None) -> float | None:
+    """Return when a task started at ``started`` runs out of time."""
+    expiry = started + task.timeout if task.timeout is not None else None
+    if deadline_at is None:
+        return expiry
+    return deadline_at if expiry is None else min(expiry, deadline_at)
+
+
+def _abandon_expired(
+    running: dict[Future, tuple[ProbeTask, float | None]],
+    results: dict[str, Any],
+    now: float,
+) -> None:
+    """Give up on running probes past their expiry; they keep their thread."""
+    for future, (task, expiry) in list(running.items()):
+        if expiry is not None and expiry <= now:
+            del running[future]
+            _abandoned.add(task.func, future)
+            logger.warning("Probe %s timed out", task.name)
+            results[task.name] = task.default
+
+
+def collect_parallel(
+    tasks: Sequence[ProbeTask],
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    deadline: float | None = DEFAULT_DEADLINE_SECONDS,
+) -> dict[str, Any]:
+    """Run independent probes on daemon threads and return results by name.
+
+    At most ``max_workers`` probes run at once. Each probe's timeout is
+    measured from when it starts; the deadline from the start of the
+    collection. A probe that times out or raises yields its default; a
+    timed-out probe is abandoned on its daemon thread, frees its slot for
+    the next probe and never delays interpreter exit. Until that thread
+    finishes, later collections do not start the probe again.
+    """
+    results: dict[str, Any] = {}
+    if not tasks:
+        return results
+
+    now = time.monotonic()
+    deadline_at = now + deadline if deadline is not None else None
+    queued = list(reversed(tasks))
+    running: dict[Future, tuple[ProbeTask, float | None]] = {}
+    workers = max(1, max_workers)
+    while queued or running:
+        while queued and len(running) < workers:
+            task = queued.pop()
+            if task.func in _abandoned:
+                logger.warning(
+                    "Probe %s is still stuck from an earlier call", task.name
+                )
+                results[task.name] = task.default
+                continue
+            running[run_in_thread(task.func)] = (task, _expiry(task, now, deadline_at))
+
+        expiries = [expiry for _, expiry in running.values() if expiry is not None]
+        timeout = max(0.0, min(expiries) - now) if expiries else None
+        done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+        now = time.monotonic()
+        for future in done:
+            task, _ = running.pop(future)
+            try:
+                results[task.name] = future.result()
+            except Exception:
+                logger.exception("Probe %s failed", task.name)
+                results[task.name] = task.default
+        _abandon_expired(running, results, now)
+        if deadline_at is not None and now >= deadline_at:
+            for task in queued:
+                logger.warning("Probe %s missed the collection deadline", task.name)
+                results[task.name] = task.default
+            queued.clear()
+    return {task.name: results[task.name] for task in tasks}
+
+
+async def _arun_task(task: ProbeTask) -> Any:
+    try:
+        return await asyncio.wait_for(task.func(), task.timeout)
+    except TimeoutError:
+        logger.warning("Probe %s timed out", task.name)
+    except Exception:
+        logger.exception("Probe %s failed", task.name)
+    return task.default
+
+
+async def acollect_parallel(
+    tasks: Sequence[ProbeTask],
+    *,
+    deadline: float | None = DEFAULT_DEADLINE_SECONDS,
+) -> dict[str, Any]:
+    """Await independent async probes concurrently and return results by name.
+
+    Each task's `func` is a coroutine function. Probes still pending at the
+    deadline are cancelled and yield their default.
+    """
+    if not tasks:
+        return {}
+
+    futures = {task.name: asyncio.ensure_future(_arun_task(task)) for task in tasks}
+    _, pending = await asyncio.wait(futures.values(), timeout=deadline)
+    for future in pending:
+        future.cancel()
+
+    results: dict[str, Any] = {}
+    for task in tasks:
+        future = futures[task.name]
+        if future in pending:
+            logger.warning("Probe %s missed the collection deadline", task.name)
+            results[task.name] = task.default
+        else:
+            results[task.name] = future.result()
+    return results
@@ -0,0 +1,306 @@
+import asyncio
+import subprocess
+import sys
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from collections.abc import Sequence
+from dataclasses import dataclass
+from dataclasses import fields
+from dataclasses import replace
+
+DEFAULT_COMMAND_TIMEOUT_SECONDS = 10.0
+DEFAULT_MAX_CONCURRENT_COMMANDS = 4
+DEFAULT_RESULT_TTL_SECONDS = 2.0
+
+# Everything a collector should treat as "the tool could not give an answer":
+# missing executable, non-zero exit (with check) and timeouts.
+COMMAND_ERRORS = (OSError, subprocess.SubprocessError)
+
+
+@dataclass
+class CommandStats:
+    calls: int = 0
+    forks: int = 0
+    cache_hits: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    wall_time: float = 0.0
+
+
+def _decode(data: bytes) -> str:
+    """Decode output the way `subprocess.run(text=True)` does (universal newlines)."""
+    return (
+        data.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+    )
+
+
+def _caller_name() -> str:
+    """Return the module name of the first frame outside this module."""
+    frame = sys._getframe(1)  # noqa: SLF001
+    while frame is not None and frame.f_globals.get("__name__") == __name__:
+        frame = frame.f_back
+    return frame.f_globals.get("__name__", "?") if frame is not None else "?"
+
+
+class CommandRunner:
+    """Run external commands with a timeout, a concurrency limit and memoization.
+
+    Identical argv lists run within ``result_ttl`` seconds of each other share
+    one fork. Calls, forks, cache hits, failures, timeouts and wall time are
+    accounted per caller (the calling module unless ``caller`` is given).
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT_COMMANDS,
+        result_ttl: float = DEFAULT_RESULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_concurrent = max_concurrent
+        self.result_ttl = result_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._async_slots: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._results: dict[
+            tuple[str, ...], tuple[float, subprocess.CompletedProcess]
+        ] = {}
+        self._stats: dict[str, CommandStats] = {}
+
+    def _cached(self, key: tuple[str, ...]) -> subprocess.CompletedProcess | None:
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= self._clock():
+                del self._results[key]
+                return None
+            return entry[1]
+
+    def _store(
+        self, key: tuple[str, ...], result: subprocess.CompletedProcess, ttl: float
+    ) -> None:
+        if ttl > 0:
+            with self._lock:
+                self._results[key] = (self._clock() + ttl, result)
+
+    def _record(
+        self,
+        caller: str,
+        *,
+        forked: bool = True,
+        elapsed: float = 0.0,
+        failed: bool = False,
+        timed_out: bool = False,
+    ) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(caller, CommandStats())
+            stats.calls += 1
+            stats.forks += forked
+            stats.cache_hits += not forked
+            stats.failures += failed
+            stats.timeouts += timed_out
+            stats.wall_time += elapsed
+
+    def _async_slot(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            slot = self._async_slots.get(loop)
+            if slot is None:
+                slot = self._async_slots[loop] = asyncio.Semaphore(self.max_concurrent)
+            return slot
+
+    @staticmethod
+    def _finish(
+        result: subprocess.CompletedProcess, check: bool
+    ) -> subprocess.CompletedProcess:
+        if check:
+            result.check_returncode()
+        return result
+
+    def run(
+        self,
+        args: Sequence[str],
+        *,
+        check: bool = True,
+        timeout: float | None = DEFAULT_COMMAND_TIMEOUT_SECONDS,
+        cache_ttl: float | None = None,
+        caller: str | None = None,
+    ) -> subprocess.CompletedProcess:
+        """Run ``args`` like `subprocess.run(capture_output=True, text=True)`."""
+        caller = caller or _caller_name()
+        key = tuple(args)
+        ttl = self.result_ttl if cache_ttl is None else cache_ttl
+        if ttl > 0 and (result := self._cached(key)) is not None:
+            self._record(caller, forked=False)
+            return self._finish(result, check)
+
+        started = self._clock()
+        with self._slots:
+            try:
+                result = subprocess.run(  # noqa: S603
+                    list(args),
+                    capture_output=True,
+                    text=True,
+                    encoding="utf-8",
+                    errors="replace",
+                    check=False,
+                    timeout=timeout,
+                )
+            except subprocess.TimeoutExpired:
+                self._record(
+                    caller, elapsed=self._clock() - started, failed=True, timed_out=True
+                )
+                raise
+            except OSError:
+                self._record(caller, elapsed=self._clock() - started, failed=True)
+                raise
+
+        self._record(
+            caller, elapsed=self._clock() - started, failed=result.returncode != 0
+        )
+        self._store(key, result, ttl)
+        return self._finish(result, check)
+
+    async def arun(
+        self,
+        args: Sequence[str],
+        *,
+        check: bool = True,
+        timeout: float | None = DEFAULT_COMMAND_TIMEOUT_SECONDS,  # noqa: ASYNC109
+        cache_ttl: float | None = None,
+        caller: str | None = None,
+    ) -> subprocess.CompletedProcess:
+        """Async twin of :meth:`run` built on `asyncio.create_subprocess_exec`."""
+        caller = caller or _caller_name()
+        key = tuple(args)
+        ttl = self.result_ttl if cache_ttl is None else cache_ttl
+        if ttl > 0 and (result := self._cached(key)) is not None:
+            self._record(caller, forked=False)
+            return self._finish(result, check)
+
+        started = self._clock()
+        async with self._async_slot():
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *args,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+            except OSError:
+                self._record(caller, elapsed=self._clock() - started, failed=True)
+                raise
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+            except TimeoutError:
+                process.kill()
+                await process.wait()
+                self._record(
+                    caller, elapsed=self._clock() - started, failed=True, timed_out=True
+                )
+                raise subprocess.TimeoutExpired(list(args), timeout) from None
+            except asyncio.CancelledError:
+                process.kill()
+                raise
+
+        result = subprocess.CompletedProcess(
+            list(args), process.returncode, _decode(stdout), _decode(stderr)
+        )
+        self._record(
+            caller, elapsed=self._clock() - started, failed=result.returncode != 0
+        )
+        self._store(key, result, ttl)
+        return self._finish(result, check)
+
+    def stats(self, caller: str | None = None) -> CommandStats:
+        """Return a copy of the stats for one caller, or totals across all."""
+        with self._lock:
+            if caller is not None:
+                return replace(self._stats.get(caller, CommandStats()))
+            total = CommandStats()
+            for stats in self._stats.values():
+                for field in fields(CommandStats):
+                    setattr(
+                        total,
+                        field.name,
+                        getattr(total, field.name) + getattr(stats, field.name),
+                    )
+            return total
+
+    def stats_by_caller(self) -> dict[str, CommandStats]:
+        with self._lock:
+            return {caller: replace(stats) for caller, stats in self._stats.items()}
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def clear_results(self) -> None:
+        with self._lock:
+            self._results.clear()
+
+
+_runner = CommandRunner()
+
+
+def run_command(
+    args: Sequence[str],
+    *,
+    check: bool = True,
+    timeout: float | None = DEFAULT_COMMAND_TIMEOUT_SECONDS,
+    cache_ttl: float | None = None,
+    caller: str | None = None,
+) -> subprocess.CompletedProcess:
+    """Run a command through the shared runner.
+
+    Mirrors `subprocess.run(args, capture_output=True, text=True)`: raises
+    `FileNotFoundError` for a missing executable, `CalledProcessError` on a
+    non-zero exit when `check` is set and `TimeoutExpired` on timeout.
+    ``cache_ttl`` overrides how long the result is reused (``0`` disables).
+    """
+    return _runner.run(
+        args,
+        check=check,
+        timeout=timeout,
+        cache_ttl=cache_ttl,
+        caller=caller or _caller_name(),
+    )
+
+
+async def arun_command(
+    args: Sequence[str],
+    *,
+    check: bool = True,
+    timeout: float | None = DEFAULT_COMMAND_TIMEOUT_SECONDS,  # noqa: ASYNC109
+    cache_ttl: float | None = None,
+    caller: str | None = None,
+) -> subprocess.CompletedProcess:
+    """Run a command through the shared runner without blocking the event loop."""
+    return await _runner.arun(
+        args,
+        check=check,
+        timeout=timeout,
+        cache_ttl=cache_ttl,
+        caller=caller or _caller_name(),
+    )
+
+
+def command_stats(caller: str | None = None) -> CommandStats:
+    """Return call/fork/timeout counts and wall time for a caller, or totals."""
+    return _runner.stats(caller)
+
+
+def command_stats_by_caller() -> dict[str, CommandStats]:
+    return _runner.stats_by_caller()
+
+
+def reset_command_stats() -> None:
+    _runner.reset_stats()
+
+
+def clear_command_results() -> None:
+    """Forget memoized command results so the next call forks again."""
+    _runner.clear_results()
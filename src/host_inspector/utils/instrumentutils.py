@@ -0,0 +1,221 @@
+import bisect
+import inspect
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from dataclasses import field
+from dataclasses import replace
+from functools import wraps
+from typing import Any
+from typing import TypeVar
+
+from host_inspector.utils.cacheutils import track_lookups
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Upper bounds (seconds) of the histogram buckets; the last bucket is open.
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+@dataclass(frozen=True)
+class ProbeEvent:
+    port: str
+    method: str
+    duration: float
+    outcome: str  # "ok" or "error"
+    exception_type: str | None = None
+    # True when every cached helper the call touched was a hit, False if any
+    # missed, None when the call went through no cached helper at all.
+    cache_hit: bool | None = None
+
+    @property
+    def name(self) -> str:
+        return f"{self.port}.{self.method}"
+
+
+@dataclass
+class Histogram:
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    counts: list[int] = field(default_factory=list)
+    count: int = 0
+    errors: int = 0
+    cache_hits: int = 0
+    total: float = 0.0
+    min: float | None = None
+    max: float | None = None
+
+    def __post_init__(self):
+        if not self.counts:
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, event: ProbeEvent) -> None:
+        self.counts[bisect.bisect_left(self.buckets, event.duration)] += 1
+        self.count += 1
+        self.errors += event.outcome == "error"
+        self.cache_hits += bool(event.cache_hit)
+        self.total += event.duration
+        self.min = event.duration if self.min is None else min(self.min, event.duration)
+        self.max = event.duration if self.max is None else max(self.max, event.duration)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class HistogramRegistry:
+    """Thread-safe latency histograms keyed by ``"<port>.<method>"``."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._histograms: dict[str, Histogram] = {}
+
+    def __call__(self, event: ProbeEvent) -> None:
+        with self._lock:
+            histogram = self._histograms.get(event.name)
+            if histogram is None:
+                histogram = self._histograms[event.name] = Histogram(self.buckets)
+            histogram.observe(event)
+
+    def snapshot(self) -> dict[str, Histogram]:
+        with self._lock:
+            return {
+                name: replace(histogram, counts=list(histogram.counts))
+                for name, histogram in self._histograms.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+
+class _Listeners:
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Replaced, never mutated, so `emit` can iterate without the lock.
+        self.callbacks: tuple[Callable[[ProbeEvent], None], ...] = ()
+
+    def add(self, callback: Callable[[ProbeEvent], None]) -> None:
+        with self._lock:
+            if callback not in self.callbacks:
+                self.callbacks = (*self.callbacks, callback)
+
+    def remove(self, callback: Callable[[ProbeEvent], None]) -> None:
+        with self._lock:
+            self.callbacks = tuple(cb for cb in self.callbacks if cb is not callback)
+
+    def emit(self, event: ProbeEvent) -> None:
+        for callback in self.callbacks:
+            try:
+                callback(event)
+            except Exception:
+                logger.exception("Instrumentation callback %r failed", callback)
+
+
+_listeners = _Listeners()
+registry = HistogramRegistry()
+
+
+def _event(
+    port: str,
+    method: str,
+    started: float,
+    lookups: list[bool],
+    exc: BaseException | None = None,
+) -> ProbeEvent:
+    return ProbeEvent(
+        port=port,
+        method=method,
+        duration=time.perf_counter() - started,
+        outcome="ok" if exc is None else "error",
+        exception_type=None if exc is None else type(exc).__name__,
+        cache_hit=all(lookups) if lookups else None,
+    )
+
+
+class InstrumentedPort:
+    """Proxy that reports every method call on ``target`` to the listeners.
+
+    With no listeners registered, calls go straight to the target.
+    """
+
+    def __init__(self, target: Any, port: str):
+        self._target = target
+        self._port = port
+
+    def __repr__(self) -> str:
+        return f"InstrumentedPort({self._target!r}, port={self._port!r})"
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+        wrapper = self._wrap(name, attr)
+        # Cache on the proxy so later lookups skip __getattr__.
+        setattr(self, name, wrapper)
+        return wrapper
+
+    def _wrap(self, method: str, func: Callable) -> Callable:
+        port = self._port
+
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def awrapper(*args, **kwargs):
+                if not _listeners.callbacks:
+                    return await func(*args, **kwargs)
+                started = time.perf_counter()
+                with track_lookups() as lookups:
+                    try:
+                        result = await func(*args, **kwargs)
+                    except Exception as exc:
+                        _listeners.emit(_event(port, method, started, lookups, exc))
+                        raise
+                _listeners.emit(_event(port, method, started, lookups))
+                return result
+
+            return awrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _listeners.callbacks:
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            with track_lookups() as lookups:
+                try:
+                    result = func(*args, **kwargs)
+                except Exception as exc:
+                    _listeners.emit(_event(port, method, started, lookups, exc))
+                    raise
+            _listeners.emit(_event(port, method, started, lookups))
+            return result
+
+        return wrapper
+
+
+def instrument(target: T, port: str) -> T:
+    """Wrap a port implementation so its calls are reported as ``port.<method>``."""
+    return InstrumentedPort(target, port)  # type: ignore[return-value]
+
+
+def add_listener(callback: Callable[[ProbeEvent], None]) -> None:
+    """Call ``callback`` with a :class:`ProbeEvent` after every port call."""
+    _listeners.add(callback)
+
+
+def remove_listener(callback: Callable[[ProbeEvent], None]) -> None:
+    _listeners.remove(callback)
+
+
+def enable_histograms() -> HistogramRegistry:
+    """Start feeding the in-memory histogram registry and return it."""
+    _listeners.add(registry)
+    return registry
+
+
+def disable_histograms() -> None:
+    _listeners.remove(registry)
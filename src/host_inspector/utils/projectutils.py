@@ -0,0 +1,20 @@
+from collections.abc import Iterable
+from collections.abc import Sequence
+
+
+def select_fields(
+    requested: Iterable[str] | None, available: Sequence[str], label: str
+) -> tuple[str, ...]:
+    """Return the requested names in ``available`` order; ``None`` selects all.
+
+    A bare string is taken as a single name.
+
+    Raises ``ValueError`` for names that are not in ``available``.
+    """
+    if requested is None:
+        return tuple(available)
+    requested = {requested} if isinstance(requested, str) else set(requested)
+    if unknown := requested.difference(available):
+        msg = f"Unknown {label} field(s): {', '.join(sorted(unknown))}"
+        raise ValueError(msg)
+    return tuple(name for name in available if name in requested)
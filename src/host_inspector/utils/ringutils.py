@@ -0,0 +1,86 @@
+import math
+from array import array
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class WindowStats:
+    count: int
+    min: float
+    mean: float
+    max: float
+    p95: float
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "min": round(self.min, 2),
+            "mean": round(self.mean, 2),
+            "max": round(self.max, 2),
+            "p95": round(self.p95, 2),
+        }
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Return the nearest-rank percentile of an already sorted, non-empty list."""
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class RingBuffer:
+    """Fixed-capacity series of ``(timestamp, value)`` pairs.
+
+    Both columns are preallocated ``array("d")`` buffers; once full, each
+    append overwrites the oldest sample, so memory never grows.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            msg = "capacity must be at least 1"
+            raise ValueError(msg)
+        self.capacity = capacity
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: float, value: float) -> tuple[float, float] | None:
+        """Add a sample and return the one it overwrote, if the buffer was full."""
+        evicted = None
+        if self._size == self.capacity:
+            evicted = (self._timestamps[self._next], self._values[self._next])
+        self._timestamps[self._next] = timestamp
+        self._values[self._next] = value
+        self._next = (self._next + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+        return evicted
+
+    def items(self) -> list[tuple[float, float]]:
+        """Return every ``(timestamp, value)`` pair, oldest first."""
+        oldest = (self._next - self._size) % self.capacity
+        return [
+            (self._timestamps[index], self._values[index])
+            for index in (
+                (oldest + offset) % self.capacity for offset in range(self._size)
+            )
+        ]
+
+    def since(self, start: float) -> list[float]:
+        """Return values with ``timestamp >= start``, oldest first."""
+        return [value for timestamp, value in self.items() if timestamp >= start]
+
+    def stats(self, start: float) -> WindowStats | None:
+        """Return min/mean/max/p95 of the values since ``start``, or None if empty."""
+        if not (values := self.since(start)):
+            return None
+        ordered = sorted(values)
+        return WindowStats(
+            count=len(ordered),
+            min=ordered[0],
+            mean=math.fsum(ordered) / len(ordered),
+            max=ordered[-1],
+            p95=percentile(ordered, 95),
+        )
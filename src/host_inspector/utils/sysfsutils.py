@@ -0,0 +1,180 @@
+import os
+import shlex
+import threading
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+
+OS_RELEASE_PATHS = (Path("/etc/os-release"), Path("/usr/lib/os-release"))
+CPUINFO_PATH = Path("/proc/cpuinfo")
+MEMINFO_PATH = Path("/proc/meminfo")
+DEVICETREE_ROOTS = (Path("/sys/firmware/devicetree/base"), Path("/proc/device-tree"))
+PREAD_SIZE = 4096
+
+# `lscpu` names ARM cores from the MIDR implementer/part ids; /proc/cpuinfo on
+# arm64 only carries the raw ids. These are the cores our Pi fleet ships with.
+ARM_CPU_PARTS = {
+    ("0x41", "0xb76"): "ARM1176",
+    ("0x41", "0xc07"): "Cortex-A7",
+    ("0x41", "0xd03"): "Cortex-A53",
+    ("0x41", "0xd08"): "Cortex-A72",
+    ("0x41", "0xd0b"): "Cortex-A76",
+}
+
+
+@dataclass(frozen=True)
+class CPUInfo:
+    processors: list[dict[str, str]] = field(default_factory=list)
+    system: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def model_name(self) -> str | None:
+        """Return the processor model the way `lscpu` reports it."""
+        if not self.processors:
+            return self.system.get("Processor")
+        first = self.processors[0]
+        if name := first.get("model name") or first.get("Processor"):
+            return name
+        return ARM_CPU_PARTS.get(
+            (first.get("CPU implementer", ""), first.get("CPU part", ""))
+        )
+
+    @property
+    def serial(self) -> str | None:
+        return self.system.get("Serial")
+
+
+def read_text(path: str | Path) -> str | None:
+    """Return the contents of a file, or None if it cannot be read."""
+    try:
+        return Path(path).read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return None
+
+
+def parse_os_release(text: str) -> dict[str, str]:
+    """Parse os-release(5) ``KEY=value`` lines, unquoting values."""
+    fields: dict[str, str] = {}
+    for line in text.splitlines():
+        key, sep, value = line.strip().partition("=")
+        if not sep or key.startswith("#"):
+            continue
+        try:
+            parts = shlex.split(value)
+        except ValueError:
+            parts = [value.strip("\"'")]
+        fields[key] = " ".join(parts)
+    return fields
+
+
+def read_os_release() -> dict[str, str]:
+    for path in OS_RELEASE_PATHS:
+        if (text := read_text(path)) is not None:
+            return parse_os_release(text)
+    return {}
+
+
+def parse_cpuinfo(text: str) -> CPUInfo:
+    """Split /proc/cpuinfo into per-processor blocks and system-wide fields.
+
+    Blocks that start with ``processor`` describe one logical CPU; anything
+    else (e.g. the Raspberry Pi ``Hardware``/``Revision``/``Serial`` trailer)
+    is merged into ``system``.
+    """
+    processors: list[dict[str, str]] = []
+    system: dict[str, str] = {}
+    for block in text.strip().split("\n\n"):
+        fields: dict[str, str] = {}
+        for line in block.splitlines():
+            key, sep, value = line.partition(":")
+            if sep:
+                fields[key.strip()] = value.strip()
+        if "processor" in fields:
+            processors.append(fields)
+        else:
+            system.update(fields)
+    return CPUInfo(processors=processors, system=system)
+
+
+def read_cpuinfo() -> CPUInfo:
+    return parse_cpuinfo(read_text(CPUINFO_PATH) or "")
+
+
+def parse_meminfo(text: str) -> dict[str, int]:
+    """Parse /proc/meminfo into bytes; unitless fields (``HugePages_*``) are counts."""
+    fields: dict[str, int] = {}
+    for line in text.splitlines():
+        key, sep, rest = line.partition(":")
+        parts = rest.split()
+        if not sep or not parts:
+            continue
+        try:
+            value = int(parts[0])
+        except ValueError:
+            continue
+        fields[key.strip()] = value * 1024 if parts[1:] == ["kB"] else value
+    return fields
+
+
+def read_meminfo() -> dict[str, int]:
+    return parse_meminfo(read_text(MEMINFO_PATH) or "")
+
+
+def parse_cpu_list(text: str) -> tuple[int, ...]:
+    """Expand a kernel cpulist such as ``"0-3,8,10-11"`` into sorted CPU ids."""
+    cpus: set[int] = set()
+    for part in text.strip().split(","):
+        if not part:
+            continue
+        first, _, last = part.partition("-")
+        cpus.update(range(int(first), int(last or first) + 1))
+    return tuple(sorted(cpus))
+
+
+class OpenProcFiles:
+    """Re-read procfs files through file descriptors kept open.
+
+    procfs regenerates a file on every read at offset 0, so polling one is a
+    ``pread`` rather than an open/read/close. A file that cannot be opened
+    (no IPv6, PSI disabled, no procfs) is not tried again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._fds: dict[Path, int | None] = {}
+
+    def _fd(self, path: Path) -> int | None:
+        with self._lock:
+            if path not in self._fds:
+                try:
+                    self._fds[path] = os.open(path, os.O_RDONLY)
+                except OSError:
+                    self._fds[path] = None
+            return self._fds[path]
+
+    def read(self, path: Path) -> str | None:
+        """Return the current contents of ``path``, or None if it cannot be read."""
+        if (fd := self._fd(path)) is None:
+            return None
+        chunks = []
+        try:
+            while chunk := os.pread(fd, PREAD_SIZE, PREAD_SIZE * len(chunks)):
+                chunks.append(chunk)
+        except OSError:
+            return None
+        return b"".join(chunks).decode("ascii", errors="replace")
+
+    def close(self) -> None:
+        with self._lock:
+            for fd in self._fds.values():
+                if fd is not None:
+                    os.close(fd)
+            self._fds.clear()
+
+
+def read_devicetree(node: str) -> list[str] | None:
+    """Return the NUL-separated strings of a devicetree property, e.g. ``"model"``."""
+    for root in DEVICETREE_ROOTS:
+        if (text := read_text(root / node)) is not None:
+            return [value for value in text.split("\x00") if value]
+    return None
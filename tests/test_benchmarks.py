@@ -0,0 +1,42 @@
+from benchmarks.runner import compare
+from benchmarks.runner import main
+from benchmarks.stubs import stub_cases
+
+
+def test_stub_cases_run():
+    for case in stub_cases():
+        assert case.func() is not None, case.name
+
+
+def test_compare_flags_regressions_beyond_tolerance():
+    base = {"p50_us": 100.0, "p90_us": 120.0, "alloc_peak_kib": 1.0, "subprocesses": 1}
+    same = dict(base)
+    slower = {**base, "p50_us": 200.0, "subprocesses": 2}
+
+    assert compare({"case": same}, {"case": base}, tolerance=0.25) == []
+    regressions = compare({"case": slower}, {"case": base}, tolerance=0.25)
+    assert regressions == ["case: subprocesses 2 > 1"]
+
+
+def test_compare_gates_latency_only_when_asked():
+    base = {"p50_us": 100.0, "p90_us": 120.0, "alloc_peak_kib": 1.0, "subprocesses": 1}
+    noisy = {**base, "p50_us": 180.0, "alloc_peak_kib": 1.05}
+    slower = {**base, "p50_us": 250.0, "alloc_peak_kib": 1.5}
+
+    assert compare({"case": noisy}, {"case": base}, 0.1, timing_tolerance=1.0) == []
+    assert compare({"case": slower}, {"case": base}, 0.1) == [
+        "case: alloc_peak_kib 1.5 > 1.0 (+10%)"
+    ]
+    regressions = compare({"case": slower}, {"case": base}, 0.1, timing_tolerance=1.0)
+    assert "case: p50_us 250.0 > 100.0 (+100%)" in regressions
+
+
+def test_runner_updates_baseline(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    args = ["--mode", "stub", "--iterations", "3", "--baseline", str(baseline)]
+
+    assert main([*args, "--case", "parse_cpuinfo", "--update"]) == 0
+    assert "parse_cpuinfo" in baseline.read_text()
+    assert (
+        main([*args, "--case", "parse_cpuinfo", "--check", "--tolerance", "100"]) == 0
+    )
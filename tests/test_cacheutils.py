@@ -0,0 +1,97 @@
+import asyncio
+
+from host_inspector.utils.cacheutils import TTLCache
+from host_inspector.utils.cacheutils import cache_stats
+from host_inspector.utils.cacheutils import configure_ttl
+from host_inspector.utils.cacheutils import invalidate
+from host_inspector.utils.cacheutils import reset_ttl
+from host_inspector.utils.cacheutils import ttl_cache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_entries_expire():
+    clock = FakeClock()
+    store = TTLCache(clock=clock)
+    store.set("gpu.get_resolution", (), "1920 x 1080", ttl=30)
+
+    assert store.get("gpu.get_resolution", ()) == "1920 x 1080"
+    clock.now = 31.0
+    assert store.get("gpu.get_resolution", ()) != "1920 x 1080"
+
+    stats = store.stats("gpu")
+    assert (stats.hits, stats.misses, stats.evictions) == (1, 1, 1)
+
+
+def test_ttl_cache_invalidate_by_key_probe_and_subsystem():
+    store = TTLCache()
+    store.set("network.interface", ("10.0.0.1",), "eth0", ttl=None)
+    store.set("network.interface", ("10.0.0.2",), "eth1", ttl=None)
+    store.set("network.hostname", (), "host", ttl=None)
+    store.set("gpu.get_model", (), "GPU", ttl=None)
+
+    assert store.invalidate("network.interface", ("10.0.0.1",)) == 1
+    assert store.invalidate("network.interface") == 1
+    assert store.invalidate("network") == 1
+    assert store.invalidate() == 1
+    assert store.stats().evictions == 4  # noqa: PLR2004
+
+
+def test_ttl_cache_resolves_ttl_overrides():
+    store = TTLCache()
+    assert store.resolve_ttl("gpu.get_resolution", 30) == 30  # noqa: PLR2004
+    store.configure_ttl("gpu", 10)
+    assert store.resolve_ttl("gpu.get_resolution", 30) == 10  # noqa: PLR2004
+    store.configure_ttl("gpu.get_resolution", None)
+    assert store.resolve_ttl("gpu.get_resolution", 30) is None
+
+
+def test_ttl_cache_decorator():
+    calls = []
+
+    @ttl_cache("test_subsystem")
+    def _probe(value):
+        calls.append(value)
+        return value * 2
+
+    try:
+        assert _probe(2) == 4  # noqa: PLR2004
+        assert _probe(2) == 4  # noqa: PLR2004
+        assert calls == [2]
+        assert _probe.probe_name == "test_subsystem.probe"
+        assert cache_stats("test_subsystem").hits == 1
+
+        _probe.invalidate(2)
+        _probe(2)
+        assert calls == [2, 2]
+
+        configure_ttl("test_subsystem", 0)
+        invalidate("test_subsystem")
+        _probe(3)
+        _probe(3)
+        assert calls == [2, 2, 3, 3]
+    finally:
+        reset_ttl("test_subsystem")
+        invalidate("test_subsystem")
+
+
+def test_ttl_cache_decorator_caches_awaited_result():
+    calls = []
+
+    @ttl_cache("test_async_subsystem")
+    async def _aprobe():
+        calls.append(1)
+        return "value"
+
+    try:
+        assert asyncio.run(_aprobe()) == "value"
+        assert asyncio.run(_aprobe()) == "value"
+        assert calls == [1]
+    finally:
+        invalidate("test_async_subsystem")
@@ -0,0 +1,199 @@
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import host_inspector
+from host_inspector.utils.collectutils import ProbeTask
+from host_inspector.utils.collectutils import _abandoned
+from host_inspector.utils.collectutils import acollect_parallel
+from host_inspector.utils.collectutils import collect_parallel
+
+
+def _sleeper(seconds: float, value):
+    def probe():
+        time.sleep(seconds)
+        return value
+
+    return probe
+
+
+def _failing_probe():
+    msg = "boom"
+    raise RuntimeError(msg)
+
+
+def test_collect_parallel_runs_probes_concurrently():
+    started = time.monotonic()
+    results = collect_parallel(
+        [ProbeTask(name, _sleeper(0.2, name)) for name in ("a", "b", "c")],
+        max_workers=3,
+    )
+    elapsed = time.monotonic() - started
+
+    assert results == {"a": "a", "b": "b", "c": "c"}
+    assert elapsed < 0.5  # noqa: PLR2004
+
+
+def test_collect_parallel_per_probe_timeout_uses_default():
+    release = threading.Event()
+    results = collect_parallel(
+        [
+            ProbeTask("fast", _sleeper(0.0, {"ok": True}), default={}),
+            ProbeTask("slow", release.wait, default={}, timeout=0.05),
+        ],
+    )
+    release.set()
+
+    assert results == {"fast": {"ok": True}, "slow": {}}
+
+
+def test_collect_parallel_overall_deadline():
+    release = threading.Event()
+    started = time.monotonic()
+    results = collect_parallel(
+        [
+            ProbeTask("a", release.wait, default=[], timeout=None),
+            ProbeTask("b", release.wait, default=[], timeout=None),
+        ],
+        deadline=0.1,
+    )
+    elapsed = time.monotonic() - started
+    release.set()
+
+    assert results == {"a": [], "b": []}
+    assert elapsed < 0.5  # noqa: PLR2004
+
+
+def test_collect_parallel_timeout_starts_when_the_probe_starts():
+    results = collect_parallel(
+        [
+            ProbeTask("first", _sleeper(0.1, 1), timeout=0.3),
+            ProbeTask("queued", _sleeper(0.1, 2), timeout=0.15),
+        ],
+        max_workers=1,
+    )
+
+    assert results == {"first": 1, "queued": 2}
+
+
+def test_collect_parallel_timed_out_probe_frees_its_slot():
+    release = threading.Event()
+    started = time.monotonic()
+    results = collect_parallel(
+        [
+            ProbeTask("hung", release.wait, default="timed out", timeout=0.05),
+            ProbeTask("next", _sleeper(0.0, "ran")),
+        ],
+        max_workers=1,
+    )
+    elapsed = time.monotonic() - started
+    release.set()
+
+    assert results == {"hung": "timed out", "next": "ran"}
+    assert elapsed < 0.5  # noqa: PLR2004
+
+
+def test_collect_parallel_hung_probe_does_not_block_exit():
+    script = (
+        "import time\n"
+        "from host_inspector.utils.collectutils import ProbeTask, collect_parallel\n"
+        "print(collect_parallel([ProbeTask('hung', lambda: time.sleep(30), "
+        "timeout=0.1)]))\n"
+    )
+    started = time.monotonic()
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        timeout=20,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(Path(host_inspector.__file__).parents[1])},
+    )
+    elapsed = time.monotonic() - started
+
+    assert completed.stdout.strip() == "{'hung': None}"
+    assert elapsed < 10  # noqa: PLR2004
+
+
+def test_collect_parallel_does_not_relaunch_a_stuck_probe():
+    release = threading.Event()
+    calls = []
+
+    def hung():
+        calls.append(1)
+        release.wait(5)
+        return "late"
+
+    task = ProbeTask("hung", hung, default="timed out", timeout=0.05)
+    for _ in range(3):
+        assert collect_parallel([task]) == {"hung": "timed out"}
+    # One stranded thread, not one per collection.
+    assert len(calls) == 1
+
+    release.set()
+    deadline = time.monotonic() + 2.0
+    while hung in _abandoned and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert collect_parallel([task]) == {"hung": "late"}
+    assert len(calls) == 2  # noqa: PLR2004
+
+
+def test_collect_parallel_failure_uses_default():
+    results = collect_parallel(
+        [
+            ProbeTask("ok", _sleeper(0.0, 1)),
+            ProbeTask("broken", _failing_probe, default={}),
+        ],
+    )
+
+    assert results == {"ok": 1, "broken": {}}
+
+
+def test_collect_parallel_empty():
+    assert collect_parallel([]) == {}
+
+
+def _asleeper(seconds: float, value):
+    async def probe():
+        await asyncio.sleep(seconds)
+        return value
+
+    return probe
+
+
+async def _afailing_probe():
+    msg = "boom"
+    raise RuntimeError(msg)
+
+
+def test_acollect_parallel_runs_probes_concurrently():
+    started = time.monotonic()
+    results = asyncio.run(
+        acollect_parallel(
+            [ProbeTask(name, _asleeper(0.2, name)) for name in ("a", "b", "c")]
+        )
+    )
+    elapsed = time.monotonic() - started
+
+    assert results == {"a": "a", "b": "b", "c": "c"}
+    assert elapsed < 0.5  # noqa: PLR2004
+
+
+def test_acollect_parallel_timeouts_and_failures_use_defaults():
+    results = asyncio.run(
+        acollect_parallel(
+            [
+                ProbeTask("fast", _asleeper(0.0, {"ok": True}), default={}),
+                ProbeTask("slow", _asleeper(5.0, "late"), default={}, timeout=0.05),
+                ProbeTask("broken", _afailing_probe, default=[]),
+                ProbeTask("overdue", _asleeper(5.0, "late"), default={}, timeout=None),
+            ],
+            deadline=0.2,
+        )
+    )
+
+    assert results == {"fast": {"ok": True}, "slow": {}, "broken": [], "overdue": {}}
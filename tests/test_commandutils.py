@@ -0,0 +1,92 @@
+import asyncio
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from host_inspector.utils.commandutils import CommandRunner
+from host_inspector.utils.commandutils import arun_command
+from host_inspector.utils.commandutils import command_stats
+from host_inspector.utils.commandutils import run_command
+
+
+def test_arun_command_captures_text_output():
+    result = asyncio.run(arun_command([sys.executable, "-c", "print('a\\r\\nb')"]))
+
+    assert result.returncode == 0
+    assert result.stdout == "a\nb\n"
+
+
+def test_arun_command_checks_return_code():
+    args = [sys.executable, "-c", "raise SystemExit(3)"]
+    with pytest.raises(subprocess.CalledProcessError):
+        asyncio.run(arun_command(args))
+
+    expected_returncode = 3
+    assert asyncio.run(arun_command(args, check=False)).returncode == (
+        expected_returncode
+    )
+
+
+def test_arun_command_times_out():
+    args = [sys.executable, "-c", "import time; time.sleep(5)"]
+    with pytest.raises(subprocess.TimeoutExpired):
+        asyncio.run(arun_command(args, timeout=0.1))
+
+
+def test_arun_command_missing_executable():
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(arun_command(["host-inspector-no-such-command"]))
+
+
+def test_run_command_memoizes_identical_argv_within_ttl():
+    runner = CommandRunner(result_ttl=60.0)
+    args = [sys.executable, "-c", "import time; print(time.monotonic_ns())"]
+
+    first = runner.run(args, caller="test")
+    second = runner.run(args, caller="test")
+    uncached = runner.run(args, cache_ttl=0, caller="test")
+    stats = runner.stats("test")
+
+    assert first.stdout == second.stdout
+    assert uncached.stdout != first.stdout
+    assert (stats.calls, stats.forks, stats.cache_hits) == (3, 2, 1)
+    assert stats.wall_time > 0
+
+
+def test_run_command_counts_failures_and_timeouts():
+    runner = CommandRunner(result_ttl=0)
+    with pytest.raises(subprocess.TimeoutExpired):
+        runner.run([sys.executable, "-c", "import time; time.sleep(5)"], timeout=0.1)
+    with pytest.raises(FileNotFoundError):
+        runner.run(["host-inspector-no-such-command"])
+
+    stats = runner.stats(__name__)
+    assert (stats.calls, stats.failures, stats.timeouts) == (2, 2, 1)
+
+
+def test_run_command_limits_concurrency():
+    runner = CommandRunner(max_concurrent=1, result_ttl=0)
+    args = [sys.executable, "-c", "import time; time.sleep(0.2)"]
+    threads = [threading.Thread(target=runner.run, args=(args,)) for _ in range(2)]
+
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert time.monotonic() - started >= 0.4  # noqa: PLR2004
+
+
+def test_shared_runner_accounts_calling_module():
+    before = command_stats(__name__).calls
+
+    async def acaller():
+        return await arun_command([sys.executable, "-c", "pass"], cache_ttl=0)
+
+    run_command([sys.executable, "-c", "pass"], cache_ttl=0)
+    asyncio.run(acaller())
+    assert command_stats(__name__).calls == before + 2
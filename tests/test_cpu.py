@@ -1,10 +1,39 @@
+import asyncio
+import threading
+import time
+from collections import namedtuple
 from types import SimpleNamespace
 
+import psutil
+import pytest
+
+from host_inspector import aget_cpu_info
 from host_inspector import get_cpu_info
+from host_inspector.cpu.application.dtos import CPUTimesPercentDTO
+from host_inspector.cpu.application.dtos import CPUTopologyDTO
+from host_inspector.cpu.application.dtos import LogicalCPUDTO
+from host_inspector.cpu.application.dtos import PerCoreUsageDTO
 from host_inspector.cpu.application.dtos import TemperatureInfoDTO
 from host_inspector.cpu.application.service import CPUService
+from host_inspector.cpu.application.service import StealTracker
 from host_inspector.cpu.infrastructure.metrics import SAMPLE_INTERVAL_SECONDS
 from host_inspector.cpu.infrastructure.metrics import PsutilCPUMetrics
+from host_inspector.cpu.infrastructure.sampler import CPUUsageSampler
+from host_inspector.cpu.infrastructure.sampler import busy_percent
+from host_inspector.cpu.infrastructure.sampler import per_core_usage
+from host_inspector.cpu.infrastructure.sampler import times_from_percent
+from host_inspector.cpu.infrastructure.sampler import times_percent
+from host_inspector.cpu.infrastructure.thermal import discover_sensors
+from host_inspector.cpu.infrastructure.thermal import package_max
+from host_inspector.cpu.infrastructure.thermal import read_sensors
+from host_inspector.cpu.infrastructure.topology import read_topology
+from host_inspector.utils.sysfsutils import parse_cpu_list
+
+CPUTimes = namedtuple("CPUTimes", ["user", "system", "idle"])  # noqa: PYI024
+LinuxCPUTimes = namedtuple(  # noqa: PYI024
+    "LinuxCPUTimes",
+    ["user", "nice", "system", "idle", "iowait", "irq", "softirq", "steal"],
+)
 
 
 class StubMetrics:
@@ -26,6 +55,17 @@ class StubMetrics:
     def usage_percent(self) -> float:
         return self._percent
 
+    async def ausage_percent(self) -> float:
+        return self._percent
+
+    def per_core_usage(self) -> PerCoreUsageDTO:
+        usage = PerCoreUsageDTO()
+        usage.busy.extend([self._percent] * self._logical)
+        return usage
+
+    async def aper_core_usage(self) -> PerCoreUsageDTO:
+        return self.per_core_usage()
+
 
 class StubPlatform:
     def __init__(self, *, processor: str, temperature: dict):
@@ -38,6 +78,12 @@ class StubPlatform:
     def temperature_info(self) -> dict:
         return TemperatureInfoDTO(data=self._temperature)
 
+    async def aprocessor_name(self) -> str:
+        return self._processor
+
+    async def atemperature_info(self) -> dict:
+        return TemperatureInfoDTO(data=self._temperature)
+
 
 def test_get_cpu_info():
     cpu_info = get_cpu_info()
@@ -80,6 +126,51 @@ def test_cpu_service_get_cpu_info_formats_output():
     }
 
 
+def test_cpu_service_aget_cpu_info_matches_sync():
+    service = CPUService(
+        metrics=StubMetrics(physical=4, logical=8, freq_mhz=2400.0, percent=3.0),
+        platform=StubPlatform(processor="Test CPU", temperature={}),
+    )
+
+    assert asyncio.run(service.aget_cpu_info()) == service.get_cpu_info()
+
+
+def test_aget_cpu_info():
+    assert set(asyncio.run(aget_cpu_info())) == set(get_cpu_info())
+
+
+class ExplodingPlatform:
+    def processor_name(self) -> str:
+        msg = "processor_name should not be called"
+        raise AssertionError(msg)
+
+    def temperature_info(self) -> dict:
+        msg = "temperature_info should not be called"
+        raise AssertionError(msg)
+
+
+def test_cpu_service_fields_skip_unrequested_ports():
+    metrics = StubMetrics(physical=8, logical=16, freq_mhz=3200.0, percent=12.5)
+    metrics.usage_percent = None  # would raise TypeError if called
+    service = CPUService(metrics=metrics, platform=ExplodingPlatform())
+
+    assert service.get_cpu_info(fields=["logical", "count"]) == {
+        "count": 8,
+        "logical": 16,
+    }
+    assert service.get_cpu_info(fields="frequency_str") == {"frequency_str": "3.2 GHz"}
+
+
+def test_cpu_service_unknown_field_raises():
+    service = CPUService(
+        metrics=StubMetrics(physical=1, logical=1, freq_mhz=1000.0, percent=0.0),
+        platform=StubPlatform(processor="Test CPU", temperature={}),
+    )
+
+    with pytest.raises(ValueError, match="cores"):
+        service.get_cpu_info(fields=["cores"])
+
+
 def test_cpu_service_mhz_to_ghz():
     service = CPUService(
         metrics=StubMetrics(physical=1, logical=1, freq_mhz=1000.0, percent=0.0),
@@ -101,3 +192,342 @@ def test_psutil_metrics_usage_percent_uses_sampled_idle(mocker):
 
     assert metrics.usage_percent() == expected_percent
     patched.assert_called_once_with(interval=SAMPLE_INTERVAL_SECONDS)
+
+
+def test_busy_percent_from_cpu_times_delta():
+    expected_percent = 25.0
+    before = CPUTimes(user=10.0, system=10.0, idle=80.0)
+    after = CPUTimes(user=20.0, system=20.0, idle=140.0)
+    assert busy_percent(before, after) == expected_percent
+    assert busy_percent(after, after) == 0.0
+
+
+def test_psutil_metrics_usage_percent_prefers_running_sampler(mocker):
+    expected_percent = 50.0
+    ticks = iter(range(1000))
+
+    def fake_cpu_times(percpu):
+        assert percpu
+        tick = next(ticks)
+        return [CPUTimes(user=tick * 5.0, system=tick * 5.0, idle=tick * 10.0)] * 2
+
+    mocker.patch(
+        "host_inspector.cpu.infrastructure.sampler.psutil.cpu_times",
+        side_effect=fake_cpu_times,
+    )
+    patched = mocker.patch(
+        "host_inspector.cpu.infrastructure.metrics.psutil.cpu_times_percent",
+    )
+    sampler = CPUUsageSampler(interval=0.01)
+    metrics = PsutilCPUMetrics(sampler=sampler)
+    sampler.start()
+    try:
+        deadline = time.monotonic() + 2.0
+        while sampler.latest() is None and time.monotonic() < deadline:
+            time.sleep(0.005)
+        assert sampler.running
+        assert metrics.usage_percent() == expected_percent
+        assert metrics.per_core_usage().busy.tolist() == [expected_percent] * 2
+    finally:
+        sampler.stop()
+
+    assert not sampler.running
+    assert sampler.latest() is None
+    patched.assert_not_called()
+
+
+def test_cpu_sampler_stop_that_times_out_keeps_values_and_allows_restart(mocker):
+    release = threading.Event()
+    calls = iter(range(1000))
+
+    def fake_cpu_times(percpu):
+        call = next(calls)
+        if call == 1:
+            release.wait(5.0)  # the first thread's second read hangs
+        return [CPUTimes(user=call * 5.0, system=call * 5.0, idle=call * 10.0)]
+
+    mocker.patch(
+        "host_inspector.cpu.infrastructure.sampler.psutil.cpu_times",
+        side_effect=fake_cpu_times,
+    )
+    sampler = CPUUsageSampler(interval=0.01)
+    sampler.start()
+    time.sleep(0.05)
+    sampler._latest = 12.5  # noqa: SLF001
+    sampler.stop(timeout=0.01)
+    assert sampler.latest() == 12.5  # noqa: PLR2004
+
+    sampler.start()
+    release.set()
+    try:
+        time.sleep(0.05)
+        assert sampler.running
+    finally:
+        sampler.stop()
+    assert sampler.latest() is None
+
+
+def test_per_core_usage_breaks_down_each_cpu():
+    before = [
+        LinuxCPUTimes(0, 0, 0, 0, 0, 0, 0, 0),
+        LinuxCPUTimes(0, 0, 0, 0, 0, 0, 0, 0),
+    ]
+    after = [
+        LinuxCPUTimes(40, 10, 20, 10, 10, 4, 1, 5),
+        LinuxCPUTimes(0, 0, 0, 100, 0, 0, 0, 0),
+    ]
+
+    usage = per_core_usage(before, after, sampled_at=7.0)
+
+    assert len(usage) == 2  # noqa: PLR2004
+    assert usage.total.busy == 45.0  # noqa: PLR2004
+    assert usage.total.sampled_at == 7.0  # noqa: PLR2004
+    assert usage.to_dict() == {
+        "user": [50.0, 0.0],
+        "system": [20.0, 0.0],
+        "iowait": [10.0, 0.0],
+        "irq": [5.0, 0.0],
+        "steal": [5.0, 0.0],
+        "busy": [90.0, 0.0],
+    }
+
+
+def test_per_core_usage_tolerates_missing_categories_and_no_delta():
+    times = [CPUTimes(user=1.0, system=1.0, idle=1.0)]
+    usage = per_core_usage(times, times)
+    assert usage.to_dict() == {
+        "user": [0.0],
+        "system": [0.0],
+        "iowait": [0.0],
+        "irq": [0.0],
+        "steal": [0.0],
+        "busy": [0.0],
+    }
+
+
+def test_per_core_usage_skips_a_cpu_hot_plug():
+    before = [CPUTimes(user=1.0, system=1.0, idle=1.0)]
+    after = [CPUTimes(user=2.0, system=1.0, idle=1.0)] * 2
+
+    usage = per_core_usage(before, after)
+
+    assert len(usage) == 0
+    assert usage.total is None
+
+
+def test_cpu_service_percent_and_per_core_share_one_sample():
+    metrics = StubMetrics(physical=2, logical=2, freq_mhz=1000.0, percent=25.0)
+    metrics.usage_percent = None  # would raise TypeError if called
+    before = [CPUTimes(user=0.0, system=0.0, idle=0.0)] * 2
+    after = [CPUTimes(user=30.0, system=0.0, idle=70.0)] * 2
+    metrics.per_core_usage = lambda: per_core_usage(before, after)
+    service = CPUService(metrics=metrics, platform=ExplodingPlatform())
+
+    info = service.get_cpu_info(fields=["percent", "per_core"])
+
+    assert info == {"percent": 30.0, "per_core": info["per_core"]}
+    assert info["per_core"]["busy"] == [30.0, 30.0]
+
+
+def test_cpu_service_per_core_is_opt_in():
+    service = CPUService(
+        metrics=StubMetrics(physical=2, logical=4, freq_mhz=1000.0, percent=25.0),
+        platform=StubPlatform(processor="Test CPU", temperature={}),
+    )
+
+    assert "per_core" not in service.get_cpu_info()
+    info = service.get_cpu_info(fields=["per_core", "logical"])
+    assert list(info) == ["logical", "per_core"]
+    assert info["per_core"]["busy"] == [25.0] * 4
+    assert asyncio.run(service.aget_cpu_info(fields=["per_core"])) == {
+        "per_core": info["per_core"]
+    }
+
+
+def _write(path, value):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"{value}\n")
+
+
+def test_thermal_sensors_discovered_once_and_resampled(tmp_path):
+    hwmon = tmp_path / "hwmon" / "hwmon0"
+    _write(hwmon / "name", "k10temp")
+    _write(hwmon / "temp1_input", 61250)
+    _write(hwmon / "temp1_label", "Tctl")
+    _write(hwmon / "temp1_crit", 100000)
+    nvme = tmp_path / "hwmon" / "hwmon1"
+    _write(nvme / "name", "nvme")
+    _write(nvme / "temp1_input", 70000)
+    zone = tmp_path / "thermal" / "thermal_zone0"
+    _write(zone / "type", "acpitz")
+    _write(zone / "temp", 40000)
+    _write(zone / "trip_point_0_type", "critical")
+    _write(zone / "trip_point_0_temp", 105000)
+    _write(zone / "trip_point_1_type", "passive")
+    _write(zone / "trip_point_1_temp", 95000)
+
+    sensors = discover_sensors(tmp_path / "thermal", tmp_path / "hwmon")
+    assert [(s.chip, s.label, s.critical) for s in sensors] == [
+        ("k10temp", "Tctl", 100.0),
+        ("nvme", "temp1", None),
+        ("acpitz", "thermal_zone0", 105.0),
+    ]
+    assert sensors[2].trips == (("critical", 105.0), ("passive", 95.0))
+
+    readings = read_sensors(sensors)
+    assert [celsius for _, celsius in readings] == [61.2, 70.0, 40.0]
+    assert package_max(readings) == 61.2  # noqa: PLR2004
+
+    _write(hwmon / "temp1_input", 75500)
+    assert discover_sensors(tmp_path / "thermal", tmp_path / "hwmon") is sensors
+    assert package_max(read_sensors(sensors)) == 75.5  # noqa: PLR2004
+
+
+def test_package_max_ignores_non_cpu_sensors(tmp_path):
+    _write(tmp_path / "hwmon" / "hwmon0" / "name", "nvme")
+    _write(tmp_path / "hwmon" / "hwmon0" / "temp1_input", 50000)
+    sensors = discover_sensors(tmp_path / "thermal", tmp_path / "hwmon")
+    assert package_max(read_sensors(sensors)) is None
+
+
+def _fake_topology(root):
+    # Two cores with SMT (0/2 and 1/3), one socket, a NUMA node per core.
+    for cpu in range(4):
+        base = root / "cpu" / f"cpu{cpu}"
+        _write(base / "topology" / "core_id", cpu % 2)
+        _write(base / "topology" / "physical_package_id", 0)
+        _write(base / "topology" / "core_cpus_list", f"{cpu % 2},{cpu % 2 + 2}")
+        _write(base / "cache" / "index0" / "level", 2)
+        _write(base / "cache" / "index0" / "type", "Unified")
+        _write(base / "cache" / "index0" / "size", "1024K")
+        _write(
+            base / "cache" / "index0" / "shared_cpu_list", f"{cpu % 2},{cpu % 2 + 2}"
+        )
+        _write(base / "cache" / "index1" / "level", 3)
+        _write(base / "cache" / "index1" / "type", "Unified")
+        _write(base / "cache" / "index1" / "size", "32M")
+        _write(base / "cache" / "index1" / "shared_cpu_list", "0-3")
+    (root / "cpu" / "cpufreq").mkdir()
+    for node, cpus in ((0, "0,2"), (1, "1,3")):
+        _write(root / "node" / f"node{node}" / "cpulist", cpus)
+        _write(
+            root / "node" / f"node{node}" / "meminfo",
+            f"Node {node} MemTotal:       16384 kB",
+        )
+
+
+def test_read_topology_from_sysfs(tmp_path):
+    _fake_topology(tmp_path)
+
+    topology = read_topology(tmp_path / "cpu", tmp_path / "node")
+
+    assert topology.sockets == 1
+    assert topology.cores == 2  # noqa: PLR2004
+    assert topology.threads_per_core == 2  # noqa: PLR2004
+    assert topology.one_per_core() == (0, 1)
+    assert topology.one_per_core(node=1) == (1,)
+    assert topology.cpus_on_node(0) == (0, 2)
+    assert topology.siblings(3) == (1, 3)
+    assert topology.sharing_cache(0, 2) == (0, 2)
+    assert topology.sharing_cache(0, 3) == (0, 1, 2, 3)
+    assert topology.nodes[1].memory_kb == 16384  # noqa: PLR2004
+    assert topology.to_dict()["caches"][-1] == {
+        "level": 3,
+        "type": "Unified",
+        "size_kb": 32768,
+        "cpus": [0, 1, 2, 3],
+    }
+    assert read_topology(tmp_path / "cpu", tmp_path / "node") is topology
+
+
+def test_topology_tells_cores_apart_when_core_ids_repeat():
+    # arm64 big.LITTLE: each cluster numbers its cores from 0 again.
+    cpus = tuple(
+        LogicalCPUDTO(cpu=cpu, core=cpu % 2, package=0, siblings=(cpu,))
+        for cpu in range(4)
+    )
+    topology = CPUTopologyDTO(cpus=cpus)
+
+    assert topology.cores == 4  # noqa: PLR2004
+    assert topology.threads_per_core == 1
+    assert topology.one_per_core() == (0, 1, 2, 3)
+
+
+def test_read_topology_falls_back_without_sysfs(tmp_path):
+    topology = read_topology(tmp_path / "cpu", tmp_path / "node")
+    assert len(topology.cpus) == psutil.cpu_count()
+    assert topology.one_per_core() == tuple(range(psutil.cpu_count()))
+
+
+def test_parse_cpu_list():
+    assert parse_cpu_list("0-2,8,10-11\n") == (0, 1, 2, 8, 10, 11)
+    assert parse_cpu_list("") == ()
+
+
+class SampledMetrics(StubMetrics):
+    def __init__(self, steal_values: list[float]):
+        super().__init__(physical=1, logical=1, freq_mhz=1000.0, percent=0.0)
+        self.samples = iter(steal_values)
+        self.sampled_at = 0.0
+
+    def usage_percent(self) -> float:
+        msg = "usage must come from the times sample"
+        raise AssertionError(msg)
+
+    def times_percent(self) -> CPUTimesPercentDTO:
+        self.sampled_at += 1.0
+        steal = next(self.samples)
+        return CPUTimesPercentDTO(
+            busy=steal + 5.0, steal=steal, sampled_at=self.sampled_at
+        )
+
+
+def test_cpu_service_times_share_the_usage_sample():
+    service = CPUService(
+        metrics=SampledMetrics([12.0, 15.0, 11.0, 2.0]),
+        platform=StubPlatform(processor="Test CPU", temperature={}),
+    )
+    fields = ["percent", "times", "noisy_neighbour"]
+
+    first = service.get_cpu_info(fields=fields)
+    assert first["percent"] == 17.0  # noqa: PLR2004
+    assert first["times"]["steal"] == 12.0  # noqa: PLR2004
+    assert set(first["times"]) == {
+        "user",
+        "system",
+        "iowait",
+        "irq",
+        "softirq",
+        "steal",
+        "guest",
+    }
+    assert first["noisy_neighbour"] is False
+    assert service.get_cpu_info(fields=fields)["noisy_neighbour"] is False
+    assert service.get_cpu_info(fields=fields)["noisy_neighbour"] is True
+    assert service.get_cpu_info(fields=fields)["noisy_neighbour"] is False
+
+
+def test_steal_tracker_counts_each_sample_once():
+    tracker = StealTracker(threshold=10.0, consecutive=2)
+    high = CPUTimesPercentDTO(busy=50.0, steal=20.0, sampled_at=1.0)
+    assert tracker.observe(high) is False
+    assert tracker.observe(high) is False
+    assert tracker.observe(CPUTimesPercentDTO(busy=50.0, steal=20.0, sampled_at=2.0))
+
+
+def test_times_from_percent_and_delta():
+    Percent = namedtuple(  # noqa: PYI024
+        "Percent", ["user", "nice", "system", "idle", "iowait", "steal"]
+    )
+    times = times_from_percent(Percent(20.0, 5.0, 10.0, 50.0, 10.0, 5.0), 1.0)
+    assert times.busy == 50.0  # noqa: PLR2004
+    assert times.user == 25.0  # noqa: PLR2004
+    assert times.iowait == 10.0  # noqa: PLR2004
+    assert times.steal == 5.0  # noqa: PLR2004
+    assert times.irq == 0.0
+
+    before = LinuxCPUTimes(0, 0, 0, 0, 0, 0, 0, 0)
+    after = LinuxCPUTimes(40, 10, 20, 10, 10, 4, 1, 5)
+    delta = times_percent(before, after, 2.0)
+    assert (delta.busy, delta.steal, delta.softirq) == (90.0, 5.0, 1.0)
+    assert times_percent(after, after, 3.0).busy == 0.0
@@ -1,6 +1,7 @@
 from host_inspector import get_device_info
 from host_inspector.device.application.dtos import DeviceInputDTO
 from host_inspector.device.application.service import DeviceService
+from host_inspector.device.infrastructure.probe import DeviceProbe
 
 
 def test_get_device_info():
@@ -21,7 +22,7 @@ def test_get_device_info():
 
 
 class StubProbe:
-    def snapshot(self) -> DeviceInputDTO:
+    def snapshot(self, sections=None) -> DeviceInputDTO:
         return DeviceInputDTO(
             os={"name": "macOS"},
             platform={"system": "Darwin"},
@@ -40,3 +41,25 @@ def test_device_service_output():
         "gpu": {"model": "GPU"},
         "display": [{"name": "Display"}],
     }
+
+
+def test_device_service_sections():
+    service = DeviceService(probe=StubProbe())
+    assert service.get_device_info(sections=["network", "os"]) == {
+        "os": {"name": "macOS"},
+        "network": {"ip_address": "127.0.0.1"},
+    }
+
+
+def test_device_probe_only_runs_requested_sections(mocker):
+    mocker.patch(
+        "host_inspector.device.infrastructure.probe.get_os_info",
+        return_value={"name": "Linux"},
+    )
+    gpu = mocker.patch("host_inspector.device.infrastructure.probe.get_gpu_info")
+
+    snapshot = DeviceProbe().snapshot(sections=["os"])
+
+    assert snapshot.os == {"name": "Linux"}
+    assert snapshot.gpu == {}
+    gpu.assert_not_called()
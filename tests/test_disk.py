@@ -1,8 +1,33 @@
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import host_inspector
 from host_inspector import get_disk_info
+from host_inspector.disk import aget_disk_info
+from host_inspector.disk.application.dtos import BlockDeviceStatsDTO
+from host_inspector.disk.application.dtos import DiskScanDTO
 from host_inspector.disk.application.dtos import DiskSnapshotDTO
+from host_inspector.disk.application.dtos import DiskStatsSnapshotDTO
+from host_inspector.disk.application.dtos import PartitionDTO
+from host_inspector.disk.application.service import DiskIOService
+from host_inspector.disk.application.service import DiskScanService
 from host_inspector.disk.application.service import DiskService
+from host_inspector.disk.application.service import FillForecaster
+from host_inspector.disk.domain import LinearTrend
 from host_inspector.disk.domain import disk_physical
 from host_inspector.disk.domain import disk_physical_str
+from host_inspector.disk.infrastructure.linux import parse_diskstats
+from host_inspector.disk.infrastructure.linux import partition_parents
+from host_inspector.disk.infrastructure.scanner import DirectoryScanner
+from host_inspector.disk.infrastructure.statvfs import StatvfsDiskProbe
 
 
 class StubProbe:
@@ -16,6 +41,33 @@ class StubProbe:
             percent=50.0,
         )
 
+    def mountpoint(self, path: str) -> str:
+        return "/data" if path.startswith("/data") else "/"
+
+    def partitions(self):
+        return [
+            PartitionDTO("/dev/sda1", "/", "ext4"),
+            PartitionDTO("tmpfs", "/run", "tmpfs"),
+            PartitionDTO("/dev/loop0", "/snap/core/1", "squashfs"),
+            PartitionDTO("/dev/sdb1", "/data", "xfs"),
+            PartitionDTO("/dev/sdb1", "/data", "xfs"),
+            PartitionDTO("nas:/export", "/mnt/nas", "nfs4"),
+        ]
+
+
+class HangingProbe(StubProbe):
+    def __init__(self):
+        self.release = threading.Event()
+        self.calls = []
+
+    def snapshot(self, path: str = "/"):
+        self.calls.append(path)
+        if path == "/mnt/nas":
+            self.release.wait(5)
+        if path == "/data":
+            raise PermissionError(path)
+        return super().snapshot(path)
+
 
 def test_get_disk_info_shape():
     info = get_disk_info()
@@ -48,3 +100,419 @@ def test_disk_service_output():
     assert info["physical"] == expected_physical_gb
     assert info["percent"] == expected_percent
     assert info["percent_str"] == f"{expected_percent}%"
+
+
+def test_disk_inventory_skips_pseudo_filesystems():
+    service = DiskService(probe=StubProbe())
+    inventory = service.get_disk_inventory()
+    assert [m["mountpoint"] for m in inventory] == ["/", "/data", "/mnt/nas"]
+    assert all(m["status"] == "ok" for m in inventory)
+    assert inventory[0]["physical"] == 18  # noqa: PLR2004
+
+
+def test_disk_inventory_marks_hung_mounts_without_blocking():
+    probe = HangingProbe()
+    service = DiskService(probe=probe)
+    try:
+        status = {m["mountpoint"]: m["status"] for m in service.get_disk_inventory(0.2)}
+        assert status == {"/": "ok", "/data": "error", "/mnt/nas": "unresponsive"}
+        assert "physical" not in service.get_disk_inventory(0.2)[2]
+        # The first call is still blocked; no second thread is sent after it.
+        assert probe.calls.count("/mnt/nas") == 1
+    finally:
+        probe.release.set()
+
+
+def test_disk_inventory_async():
+    probe = HangingProbe()
+    service = DiskService(probe=probe)
+
+    async def inventory():
+        try:
+            return await service.aget_disk_inventory(0.2)
+        finally:
+            probe.release.set()
+
+    statuses = [m["status"] for m in asyncio.run(inventory())]
+    assert statuses == ["ok", "error", "unresponsive"]
+
+
+# A mount whose statvfs outlives the inventory call by seconds; exiting must
+# not wait for it, from either the sync or the async inventory.
+HUNG_MOUNT_SCRIPT = """
+import asyncio, sys, time
+from host_inspector.disk.application.dtos import DiskSnapshotDTO, PartitionDTO
+from host_inspector.disk.application.service import DiskService
+
+class Probe:
+    def partitions(self):
+        return [PartitionDTO("nas:/export", "/mnt/nas", "nfs4")]
+
+    def snapshot(self, path="/"):
+        time.sleep(4)
+        return DiskSnapshotDTO(total=1, used=0, free=1, percent=0.0)
+
+service = DiskService(probe=Probe())
+if sys.argv[1] == "async":
+    inventory = asyncio.run(service.aget_disk_inventory(mount_timeout=0.2))
+else:
+    inventory = service.get_disk_inventory(mount_timeout=0.2)
+print(inventory[0]["status"])
+"""
+
+
+@pytest.mark.parametrize("mode", ["sync", "async"])
+def test_disk_inventory_hung_mount_does_not_block_exit(mode):
+    started = time.monotonic()
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", HUNG_MOUNT_SCRIPT, mode],
+        capture_output=True,
+        text=True,
+        timeout=20,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(Path(host_inspector.__file__).parents[1])},
+    )
+    elapsed = time.monotonic() - started
+
+    assert completed.stdout.strip() == "unresponsive"
+    assert elapsed < 3  # noqa: PLR2004
+
+
+def test_aget_disk_info_keeps_statvfs_off_the_event_loop(mocker):
+    release = threading.Event()
+    mocker.patch(
+        "host_inspector.disk.get_disk_info",
+        side_effect=lambda **_: release.wait(5) and {"percent": 1.0},
+    )
+
+    async def main():
+        pending = asyncio.ensure_future(aget_disk_info())
+        await asyncio.sleep(0.05)
+        assert not pending.done()  # the loop keeps running meanwhile
+        release.set()
+        return await pending
+
+    assert asyncio.run(main()) == {"percent": 1.0}
+
+
+DISKSTATS = """\
+   7       0 loop0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0
+   8       0 sda 1000 10 80000 2000 500 5 40000 3000 2 1500 5000 0 0 0 0
+   8       1 sda1 900 10 72000 1800 500 5 40000 3000 2 1400 4800 0 0 0 0
+ 259       0 nvme0n1 10 0 80 1 0 0 0 0 0 1 1
+"""
+
+
+def test_parse_diskstats_skips_idle_devices_and_links_partitions():
+    devices = parse_diskstats(DISKSTATS, {"sda1": "sda"})
+    assert set(devices) == {"sda", "sda1", "nvme0n1"}
+    assert devices["sda"].read_sectors == 80000  # noqa: PLR2004
+    assert devices["sda"].weighted_ms == 5000  # noqa: PLR2004
+    assert devices["sda1"].parent == "sda"
+    assert devices["nvme0n1"].parent is None
+
+
+def test_partition_parents_from_sysfs(tmp_path):
+    devices = tmp_path / "devices"
+    (devices / "sda" / "sda1").mkdir(parents=True)
+    (devices / "sda" / "sda1" / "partition").write_text("1")
+    block = tmp_path / "block"
+    block.mkdir()
+    (block / "sda").symlink_to(devices / "sda")
+    (block / "sda1").symlink_to(devices / "sda" / "sda1")
+    assert partition_parents(block) == {"sda1": "sda"}
+
+
+class StubIOProbe:
+    def __init__(self):
+        self.snapshots = [
+            DiskStatsSnapshotDTO(
+                timestamp=10.0,
+                devices={
+                    "sda": BlockDeviceStatsDTO(reads=100, read_sectors=0, read_ms=0),
+                    "sda1": BlockDeviceStatsDTO(reads=100, parent="sda"),
+                },
+            ),
+            DiskStatsSnapshotDTO(
+                timestamp=12.0,
+                devices={
+                    "sda": BlockDeviceStatsDTO(
+                        reads=300,
+                        read_sectors=4096,
+                        read_ms=400,
+                        writes=100,
+                        write_ms=500,
+                        io_ms=1000,
+                        weighted_ms=3000,
+                        in_flight=1,
+                    ),
+                    "sda1": BlockDeviceStatsDTO(reads=300, parent="sda"),
+                },
+            ),
+        ]
+
+    def snapshot(self):
+        return self.snapshots.pop(0)
+
+
+def test_disk_io_rates_from_successive_snapshots(mocker):
+    sleep = mocker.patch("host_inspector.disk.application.service.time.sleep")
+    info = DiskIOService(probe=StubIOProbe()).get_disk_io_info(interval=0.1)
+
+    sleep.assert_called_once_with(0.1)
+    sda = info["sda"]
+    assert set(info) == {"sda"}
+    assert sda["read_iops"] == 100.0  # noqa: PLR2004
+    assert sda["write_iops"] == 50.0  # noqa: PLR2004
+    assert sda["read_bps"] == 4096 * 512 / 2
+    assert sda["read_await_ms"] == 2.0  # noqa: PLR2004
+    assert sda["write_await_ms"] == 5.0  # noqa: PLR2004
+    assert sda["await_ms"] == 3.0  # noqa: PLR2004
+    assert sda["util_percent"] == 50.0  # noqa: PLR2004
+    assert sda["queue_depth"] == 1.5  # noqa: PLR2004
+    assert sda["partitions"]["sda1"]["read_iops"] == 100.0  # noqa: PLR2004
+
+
+def test_disk_io_call_soon_after_the_last_waits_out_the_interval(mocker):
+    sleep = mocker.patch("host_inspector.disk.application.service.time.sleep")
+    probe = StubIOProbe()
+    service = DiskIOService(probe=probe, clock=lambda: 10.1)
+    service.history.swap(probe.snapshot())
+
+    info = service.get_disk_io_info(interval=0.5)
+
+    sleep.assert_called_once()
+    assert sleep.call_args.args[0] == pytest.approx(0.4)
+    assert info["sda"]["read_iops"] == 100.0  # noqa: PLR2004
+
+
+def _write(path, size: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(os.urandom(size))
+
+
+def _tree(tmp_path):
+    _write(tmp_path / "logs" / "big.log", 256 * 1024)
+    _write(tmp_path / "logs" / "old" / "a.log", 64 * 1024)
+    _write(tmp_path / "cache" / "blob", 128 * 1024)
+    _write(tmp_path / "small.txt", 10)
+    return tmp_path
+
+
+def test_scan_reports_largest_directories_and_files(tmp_path):
+    root = _tree(tmp_path)
+    scan = DirectoryScanner(max_workers=2).scan(str(root), top=2)
+
+    assert scan.root == str(root.resolve())
+    assert scan.directories == 4  # noqa: PLR2004
+    assert scan.files == 4  # noqa: PLR2004
+    assert scan.errors == 0
+    assert [path for path, _ in scan.largest_directories] == [
+        str(root / "logs"),
+        str(root / "cache"),
+    ]
+    assert [path for path, _ in scan.largest_files] == [
+        str(root / "logs" / "big.log"),
+        str(root / "cache" / "blob"),
+    ]
+    logs = dict(scan.largest_directories)[str(root / "logs")]
+    assert scan.total_bytes > logs >= 320 * 1024
+
+
+def test_rescan_only_rereads_changed_directories(tmp_path):
+    root = _tree(tmp_path)
+    scanner = DirectoryScanner(max_workers=2)
+    first = scanner.scan(str(root), top=3)
+    assert first.reused == 0
+
+    assert scanner.scan(str(root), top=3).reused == 4  # noqa: PLR2004
+
+    _write(root / "cache" / "new", 512 * 1024)
+    third = scanner.scan(str(root), top=3)
+    assert third.reused == 3  # noqa: PLR2004
+    assert third.largest_files[0][0] == str(root / "cache" / "new")
+    assert third.total_bytes > first.total_bytes
+
+
+def test_hard_links_are_counted_once(tmp_path):
+    _write(tmp_path / "a" / "data", 256 * 1024)
+    (tmp_path / "b").mkdir()
+    os.link(tmp_path / "a" / "data", tmp_path / "b" / "data")
+    once = DirectoryScanner().scan(str(tmp_path / "a")).total_bytes
+    both = DirectoryScanner().scan(str(tmp_path)).total_bytes
+    assert both < 2 * once
+
+
+class StubScanner:
+    def scan(self, root: str, top: int = 20) -> DiskScanDTO:
+        return DiskScanDTO(
+            root=root,
+            total_bytes=3_000_000,
+            directories=2,
+            files=1,
+            largest_directories=(("/data/logs", 2_000_000),),
+            largest_files=(("/data/logs/big.log", 1_000_000),)[:top],
+        )
+
+
+def test_disk_scan_service_output():
+    info = DiskScanService(scanner=StubScanner()).scan_disk_usage("/data", top=5)
+    assert info["total_str"] == "3.0 MB"
+    assert info["largest_directories"] == [
+        {"path": "/data/logs", "size": 2_000_000, "size_str": "2.0 MB"}
+    ]
+    assert info["largest_files"][0]["path"] == "/data/logs/big.log"
+    assert info["reused_directories"] == 0
+
+
+def test_linear_trend_slides_its_window():
+    trend = LinearTrend(capacity=3)
+    trend.add(0.0, 5.0)
+    assert trend.slope() is None
+    for x in range(1, 4):
+        trend.add(float(x), 2.0 * x)
+    # (0, 5) fell out of the window; the rest lie on y = 2x.
+    assert len(trend) == 3  # noqa: PLR2004
+    assert trend.slope() == pytest.approx(2.0)
+    for x in range(4, 20):
+        trend.add(float(x), -3.0 * x)
+    assert trend.slope() == pytest.approx(-3.0)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_fill_forecaster_time_to_full():
+    clock = Clock()
+    forecaster = FillForecaster(min_interval=60.0, clock=clock)
+    gib = 1024**3
+    free = 10 * gib
+    for _ in range(4):
+        forecaster.observe("/data", free)
+        forecaster.observe("/data", free)  # too soon; ignored
+        clock.now += 1800.0
+        free -= gib  # 2 GiB/hour
+
+    forecast = forecaster.forecast("/data", free)
+    assert forecast["samples"] == 4  # noqa: PLR2004
+    assert forecast["growth_bytes_per_hour"] == pytest.approx(2 * gib)
+    assert forecast["hours_to_full"] == 3.0  # noqa: PLR2004
+    assert forecaster.forecast("/other", free)["hours_to_full"] is None
+
+
+def test_fill_forecaster_keeps_a_bounded_number_of_mounts():
+    clock = Clock()
+    forecaster = FillForecaster(min_interval=0.0, clock=clock, max_mounts=2)
+    for mount in ("/a", "/b", "/a", "/c"):
+        clock.now += 1.0
+        forecaster.observe(mount, 100)
+
+    # "/b" was observed least recently, so it made room for "/c".
+    assert forecaster.forecast("/a", 100)["samples"] == 2  # noqa: PLR2004
+    assert forecaster.forecast("/b", 100)["samples"] == 0
+    assert forecaster.forecast("/c", 100)["samples"] == 1
+
+
+def test_get_disk_info_only_records_history_for_forecasts():
+    service = DiskService(probe=StubProbe())
+    for path in ("/", "/usr", "/home/x"):
+        service.get_disk_info(path)
+    assert service.forecaster.forecast("/", 0)["samples"] == 0
+
+
+def test_disk_info_forecast_is_opt_in():
+    clock = Clock()
+    service = DiskService(probe=StubProbe(), forecaster=FillForecaster(clock=clock))
+    assert "forecast" not in service.get_disk_info()
+    info = service.get_disk_info(fields=["percent", "forecast"])
+    assert set(info) == {"percent", "forecast"}
+    assert info["forecast"]["samples"] == 1
+    assert info["forecast"]["growth_bytes_per_hour"] is None
+
+    inventory = service.get_disk_inventory(fields=["forecast"])
+    assert set(inventory[0]) == {"device", "mountpoint", "fstype", "status", "forecast"}
+    # Paths on the same filesystem share its history.
+    clock.now += 60.0
+    info = service.get_disk_info("/usr/share", fields=["forecast"])
+    assert info["forecast"]["samples"] == 2  # noqa: PLR2004
+    info = service.get_disk_info("/data/x", fields=["forecast"])
+    assert info["forecast"]["samples"] == 2  # noqa: PLR2004
+    with pytest.raises(ValueError, match="Unknown disk field"):
+        service.get_disk_info(fields=["bogus"])
+
+
+def test_statvfs_probe_reads_usage_inodes_and_flags_in_one_call(mocker):
+    statvfs = mocker.patch(
+        "host_inspector.disk.infrastructure.statvfs.os.statvfs",
+        return_value=SimpleNamespace(
+            f_frsize=4096,
+            f_blocks=1000,
+            f_bfree=300,
+            f_bavail=250,
+            f_files=500,
+            f_ffree=0,
+            f_flag=os.ST_RDONLY | os.ST_NOATIME,
+        ),
+    )
+    mocker.patch(
+        "host_inspector.disk.infrastructure.probe.mount_types",
+        return_value={"/": "ext4", "/srv": "xfs"},
+    )
+    probe = StatvfsDiskProbe()
+    snapshot = probe.snapshot("/srv/data")
+
+    statvfs.assert_called_once_with("/srv/data")
+    assert snapshot.total == 1000 * 4096
+    assert snapshot.used == 700 * 4096
+    assert snapshot.free == 250 * 4096
+    assert snapshot.percent == 73.7  # noqa: PLR2004
+    assert snapshot.inodes_free == 0
+    assert snapshot.flags == ("ro", "noatime")
+    assert probe.filesystem_type("/srv/data") == "xfs"
+    assert probe.mountpoint("/srv/data") == "/srv"
+
+
+def test_disk_info_inodes_fstype_and_flags_are_opt_in():
+    class InodeProbe(StubProbe):
+        def __init__(self):
+            self.fstype_calls = []
+
+        def snapshot(self, path: str = "/"):
+            return DiskSnapshotDTO(
+                total=100,
+                used=10,
+                free=90,
+                percent=10.0,
+                inodes_total=1000,
+                inodes_free=0,
+                flags=("noatime",),
+            )
+
+        def filesystem_type(self, path: str):
+            self.fstype_calls.append(path)
+            return "ext4"
+
+    probe = InodeProbe()
+    service = DiskService(probe=probe)
+    service.get_disk_info(fields=["percent"])
+    assert probe.fstype_calls == []
+
+    info = service.get_disk_info(fields=["percent", "inodes", "fstype", "flags"])
+    assert info == {
+        "percent": 10.0,
+        "inodes": {"total": 1000, "used": 1000, "free": 0, "percent": 100.0},
+        "fstype": "ext4",
+        "flags": ["noatime"],
+    }
+    # The inventory takes the type from the mount table it already read.
+    inventory = service.get_disk_inventory(fields=["fstype"])
+    assert [m["fstype"] for m in inventory] == ["ext4", "xfs", "nfs4"]
+    assert probe.fstype_calls == ["/"]
+    # Probes without statvfs (Windows) report None.
+    bare = DiskService(probe=StubProbe()).get_disk_info(fields=["inodes", "flags"])
+    assert bare == {"inodes": None, "flags": None}
@@ -0,0 +1,147 @@
+import asyncio
+import threading
+
+from host_inspector import get_frequency_info
+from host_inspector.frequency.application.dtos import PolicyLimitsDTO
+from host_inspector.frequency.application.dtos import PolicyStateDTO
+from host_inspector.frequency.application.service import FrequencyService
+from host_inspector.frequency.domain import is_capped
+from host_inspector.frequency.domain import slow_cpus
+from host_inspector.frequency.domain import throttled_cpus
+from host_inspector.frequency.infrastructure.linux import SysfsFrequencyProbe
+
+
+def test_get_frequency_info():
+    info = get_frequency_info()
+    assert set(info) == {"policies", "per_core_mhz", "throttled"}
+    assert isinstance(info["policies"], list)
+    assert isinstance(info["throttled"], list)
+
+
+class StubProbe:
+    def __init__(self, current_mhz: float, scaling_max_mhz: float | None = None):
+        self.current_mhz = current_mhz
+        self.scaling_max_mhz = scaling_max_mhz
+
+    def policies(self) -> list[str]:
+        self.read_on = threading.current_thread()
+        return ["policy0"]
+
+    def limits(self, policy: str) -> PolicyLimitsDTO:
+        return PolicyLimitsDTO(cpus=(0, 1), min_mhz=800.0, max_mhz=3000.0)
+
+    def state(self, policy: str) -> PolicyStateDTO:
+        return PolicyStateDTO(
+            current_mhz=self.current_mhz,
+            scaling_max_mhz=self.scaling_max_mhz,
+            governor="powersave",
+        )
+
+    def core_mhz(self) -> dict[int, float]:
+        return {1: 2900.0}
+
+
+class StubLoad:
+    def __init__(self, busy: list[float], latest: list[float] | None = None):
+        self.busy = busy
+        self.latest = latest
+        self.calls = 0
+
+    def latest_busy_percent(self) -> list[float] | None:
+        return self.latest
+
+    def busy_percent(self) -> list[float]:
+        self.calls += 1
+        return self.busy
+
+    async def abusy_percent(self) -> list[float]:
+        return self.busy_percent()
+
+
+def test_frequency_service_flags_slow_busy_cores_from_the_sampler():
+    load = StubLoad([], latest=[95.0, 99.0])
+    service = FrequencyService(probe=StubProbe(current_mhz=1200.0), load=load)
+
+    info = service.get_frequency_info()
+
+    assert info["policies"][0]["governor"] == "powersave"
+    assert info["policies"][0]["cpus"] == [0, 1]
+    assert info["per_core_mhz"] == {0: 1200.0, 1: 2900.0}
+    assert info["throttled"] == [0]
+    assert asyncio.run(service.aget_frequency_info()) == info
+    assert load.calls == 0
+    # The async variant reads sysfs off the event loop's thread.
+    assert service.probe.read_on is not threading.main_thread()
+
+
+def test_frequency_service_only_samples_load_when_asked():
+    load = StubLoad([95.0, 99.0])
+    service = FrequencyService(probe=StubProbe(current_mhz=1200.0), load=load)
+
+    assert service.get_frequency_info()["throttled"] == []
+    assert load.calls == 0
+    assert service.get_frequency_info(sample_load=True)["throttled"] == [0]
+    assert asyncio.run(service.aget_frequency_info(sample_load=True))["throttled"] == [
+        0
+    ]
+    assert load.calls == 2  # noqa: PLR2004
+
+
+def test_frequency_service_flags_slow_cores_of_a_capped_policy_without_load():
+    load = StubLoad([0.0, 0.0])
+    probe = StubProbe(current_mhz=1200.0, scaling_max_mhz=1500.0)
+    service = FrequencyService(probe=probe, load=load)
+
+    assert service.get_frequency_info()["throttled"] == [0]
+    assert load.calls == 0
+
+
+def test_frequency_service_skips_load_sample_when_nothing_is_slow():
+    load = StubLoad([100.0, 100.0])
+    service = FrequencyService(probe=StubProbe(current_mhz=2950.0), load=load)
+
+    assert service.get_frequency_info(sample_load=True)["throttled"] == []
+    assert load.calls == 0
+
+
+def test_slow_and_throttled_cpus():
+    core_mhz = {0: 1000.0, 1: 2500.0, 2: None, 3: 500.0}
+    core_max = {0: 3000.0, 1: 3000.0, 2: 3000.0, 3: None}
+    assert slow_cpus(core_mhz, core_max) == [0]
+    assert throttled_cpus([0, 1, 9], [90.0, 10.0]) == [0]
+    assert is_capped(1500.0, 3000.0)
+    assert not is_capped(3000.0, 3000.0)
+    assert not is_capped(None, 3000.0)
+
+
+def _write(path, value):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"{value}\n")
+
+
+def test_sysfs_probe_reads_policies(tmp_path):
+    for policy, cpus, cur in (("policy0", "0 1", 600000), ("policy10", "2", 2400000)):
+        base = tmp_path / policy
+        _write(base / "related_cpus", cpus)
+        _write(base / "cpuinfo_min_freq", 600000)
+        _write(base / "cpuinfo_max_freq", 2400000)
+        _write(base / "scaling_cur_freq", cur)
+        _write(base / "scaling_max_freq", 1800000)
+        _write(base / "scaling_driver", "intel_pstate")
+        _write(base / "scaling_governor", "powersave")
+        _write(base / "energy_performance_preference", "balance_power")
+    _write(tmp_path / "policy2" / "related_cpus", "3")
+
+    probe = SysfsFrequencyProbe(root=tmp_path)
+
+    assert probe.policies() == ["policy0", "policy2", "policy10"]
+    assert probe.limits("policy0") == PolicyLimitsDTO(
+        cpus=(0, 1), min_mhz=600.0, max_mhz=2400.0, driver="intel_pstate"
+    )
+    assert probe.state("policy10") == PolicyStateDTO(
+        current_mhz=2400.0,
+        scaling_max_mhz=1800.0,
+        governor="powersave",
+        energy_performance_preference="balance_power",
+    )
+    assert probe.state("policy2") == PolicyStateDTO()
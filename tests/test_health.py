@@ -1,3 +1,8 @@
+import asyncio
+
+import pytest
+
+from host_inspector import aget_health_info
 from host_inspector import get_health_info
 from host_inspector.health.application.dtos import HealthInputDTO
 from host_inspector.health.application.service import HealthService
@@ -7,7 +12,7 @@ def test_get_health_info():
     health_dict = get_health_info()
     assert isinstance(health_dict, dict)
 
-    expected_keys = {"cpu", "mem", "disk", "uptime", "local_datetime"}
+    expected_keys = {"cpu", "mem", "disk", "uptime", "local_datetime", "pressure"}
     missing_keys = [key for key in expected_keys if key not in health_dict]
     assert not missing_keys, f"Missing keys: {missing_keys}"
 
@@ -16,15 +21,19 @@ def test_get_health_info():
 
 
 class StubProbe:
-    def snapshot(self) -> HealthInputDTO:
+    def snapshot(self, sections=None) -> HealthInputDTO:
         return HealthInputDTO(
             cpu={"cpu": 1},
             mem={"mem": 1},
             disk={"disk": 1},
             uptime={"uptime": 1},
             local_datetime={"date": "2026-03-13"},
+            pressure={"load_average": {"1min": 0.5}},
         )
 
+    async def asnapshot(self, sections=None) -> HealthInputDTO:
+        return self.snapshot(sections)
+
 
 def test_health_service_output():
     service = HealthService(probe=StubProbe())
@@ -34,4 +43,31 @@ def test_health_service_output():
         "disk": {"disk": 1},
         "uptime": {"uptime": 1},
         "local_datetime": {"date": "2026-03-13"},
+        "pressure": {"load_average": {"1min": 0.5}},
+    }
+
+
+def test_health_service_async_output_matches_sync():
+    service = HealthService(probe=StubProbe())
+    assert asyncio.run(service.aget_health_info()) == service.get_health_info()
+
+
+def test_aget_health_info():
+    health_dict = asyncio.run(aget_health_info())
+    assert set(health_dict) == {
+        "cpu",
+        "mem",
+        "disk",
+        "uptime",
+        "local_datetime",
+        "pressure",
     }
+    for value in health_dict.values():
+        assert isinstance(value, dict)
+
+
+def test_health_service_sections():
+    service = HealthService(probe=StubProbe())
+    assert service.get_health_info(sections=["uptime"]) == {"uptime": {"uptime": 1}}
+    with pytest.raises(ValueError, match="swap"):
+        service.get_health_info(sections=["swap"])
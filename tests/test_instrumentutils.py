@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from host_inspector.memory import get_mem_info
+from host_inspector.utils.cacheutils import invalidate
+from host_inspector.utils.cacheutils import ttl_cache
+from host_inspector.utils.instrumentutils import HistogramRegistry
+from host_inspector.utils.instrumentutils import ProbeEvent
+from host_inspector.utils.instrumentutils import add_listener
+from host_inspector.utils.instrumentutils import disable_histograms
+from host_inspector.utils.instrumentutils import enable_histograms
+from host_inspector.utils.instrumentutils import instrument
+from host_inspector.utils.instrumentutils import remove_listener
+
+
+@ttl_cache("test_instrument")
+def _cached_value() -> int:
+    return 42
+
+
+class StubPort:
+    label = "stub"
+
+    def cached(self) -> int:
+        return _cached_value()
+
+    def plain(self) -> int:
+        return 1
+
+    def broken(self) -> int:
+        msg = "boom"
+        raise ValueError(msg)
+
+    async def acached(self) -> int:
+        return _cached_value()
+
+
+@pytest.fixture
+def events():
+    received: list[ProbeEvent] = []
+    add_listener(received.append)
+    invalidate("test_instrument")
+    yield received
+    remove_listener(received.append)
+    invalidate("test_instrument")
+
+
+def test_instrumented_port_reports_outcome_and_cache_hits(events):
+    port = instrument(StubPort(), "test.port")
+
+    assert port.cached() == 42  # noqa: PLR2004
+    assert port.cached() == 42  # noqa: PLR2004
+    assert port.plain() == 1
+    with pytest.raises(ValueError, match="boom"):
+        port.broken()
+    assert port.label == "stub"
+
+    assert [(e.name, e.outcome, e.cache_hit) for e in events] == [
+        ("test.port.cached", "ok", False),
+        ("test.port.cached", "ok", True),
+        ("test.port.plain", "ok", None),
+        ("test.port.broken", "error", None),
+    ]
+    assert events[-1].exception_type == "ValueError"
+    assert all(event.duration >= 0 for event in events)
+
+
+def test_instrumented_port_async_methods(events):
+    port = instrument(StubPort(), "test.port")
+
+    assert asyncio.run(port.acached()) == 42  # noqa: PLR2004
+    assert [(e.name, e.cache_hit) for e in events] == [("test.port.acached", False)]
+
+
+def test_histogram_registry_buckets_events():
+    registry = HistogramRegistry(buckets=(0.01, 0.1))
+    hit_below = 0.01
+    for duration, outcome in ((0.005, "ok"), (0.05, "ok"), (1.0, "error")):
+        cache_hit = duration < hit_below
+        registry(ProbeEvent("p", "m", duration, outcome, cache_hit=cache_hit))
+
+    histogram = registry.snapshot()["p.m"]
+    expected_count = 3
+    assert histogram.counts == [1, 1, 1]
+    assert histogram.count == expected_count
+    assert (histogram.errors, histogram.cache_hits) == (1, 1)
+    assert histogram.max == 1.0
+
+
+def test_factories_wrap_ports_for_histograms():
+    registry = enable_histograms()
+    registry.reset()
+    try:
+        get_mem_info()
+    finally:
+        disable_histograms()
+    assert registry.snapshot()["memory.probe.snapshot"].count == 1
@@ -1,8 +1,13 @@
+import pytest
+
 from host_inspector import get_mem_info
+from host_inspector.memory.application.dtos import MemoryDetailsDTO
 from host_inspector.memory.application.dtos import MemorySnapshotDTO
 from host_inspector.memory.application.service import MemoryService
 from host_inspector.memory.domain import mem_physical
 from host_inspector.memory.domain import mem_physical_str
+from host_inspector.memory.infrastructure.linux import ProcMeminfoProbe
+from host_inspector.utils.sysfsutils import parse_meminfo
 
 
 class StubProbe:
@@ -51,3 +56,80 @@ def test_memory_service_output():
     assert info["avail"] == expected_avail_gb
     assert info["percent"] == expected_percent
     assert info["percent_str"] == f"{expected_percent}%"
+
+
+MEMINFO = """MemTotal:        8000000 kB
+MemFree:         1000000 kB
+MemAvailable:    6000000 kB
+Buffers:           50000 kB
+Cached:          2000000 kB
+SwapTotal:       4000000 kB
+SwapFree:        3000000 kB
+Dirty:              1200 kB
+Writeback:            40 kB
+SReclaimable:     100000 kB
+SUnreclaim:        20000 kB
+HugePages_Total:      16
+HugePages_Free:        8
+Hugepagesize:       2048 kB
+"""
+
+
+class DetailProbe:
+    def __init__(self):
+        self.calls = []
+
+    def snapshot(self, *, details: bool = False) -> MemorySnapshotDTO:
+        self.calls.append(details)
+        gib = 1024 * 1024 * 1024
+        return MemorySnapshotDTO(
+            total=16 * gib,
+            used=8 * gib,
+            available=8 * gib,
+            percent=50.0,
+            details=MemoryDetailsDTO(
+                swap_total=4 * gib, swap_used=gib, swap_free=3 * gib
+            )
+            if details
+            else None,
+        )
+
+
+def test_memory_service_details_are_opt_in():
+    probe = DetailProbe()
+    service = MemoryService(probe=probe)
+
+    assert "swap" not in service.get_mem_info()
+    info = service.get_mem_info(fields=["percent", "swap"])
+    assert list(info) == ["percent", "swap"]
+    assert info["swap"]["percent"] == 25.0  # noqa: PLR2004
+    assert service.get_mem_info(fields=["used"]) == {"used": 8.6}
+    assert probe.calls == [False, True, False]
+    with pytest.raises(ValueError, match="zswap"):
+        service.get_mem_info(fields=["zswap"])
+
+
+def test_parse_meminfo_units():
+    meminfo = parse_meminfo(MEMINFO)
+    assert meminfo["MemTotal"] == 8000000 * 1024
+    assert meminfo["HugePages_Total"] == 16  # noqa: PLR2004
+
+
+def test_proc_meminfo_probe_single_read(mocker):
+    read = mocker.patch(
+        "host_inspector.memory.infrastructure.linux.read_meminfo",
+        return_value=parse_meminfo(MEMINFO),
+    )
+
+    snapshot = ProcMeminfoProbe().snapshot(details=True)
+
+    read.assert_called_once_with()
+    kib = 1024
+    assert snapshot.used == 2000000 * kib
+    assert snapshot.percent == 25.0  # noqa: PLR2004
+    assert snapshot.details.swap_used == 1000000 * kib
+    assert snapshot.details.cached == 2000000 * kib
+    assert snapshot.details.slab_unreclaimable == 20000 * kib
+    assert snapshot.details.writeback == 40 * kib
+    assert snapshot.details.hugepages_free == 8  # noqa: PLR2004
+    assert snapshot.details.hugepage_size == 2048 * kib
@@ -1,9 +1,19 @@
+import socket
+from types import SimpleNamespace
+
 from host_inspector import get_network_info
 from host_inspector.network.application.dtos import NetworkSnapshotDTO
 from host_inspector.network.application.service import NetworkService
 from host_inspector.network.domain import format_node_as_mac
 from host_inspector.network.domain import normalize_mac_address
 from host_inspector.network.domain import strip_ipv6_scope
+from host_inspector.network.infrastructure.probe import SystemNetworkProbe
+from host_inspector.network.infrastructure.probe import _primary_ip_address
+from host_inspector.network.infrastructure.routes import DefaultRoute
+from host_inspector.network.infrastructure.routes import RouteTable
+from host_inspector.network.infrastructure.routes import parse_ipv6_route
+from host_inspector.network.infrastructure.routes import parse_route
+from host_inspector.utils.cacheutils import invalidate
 
 
 class StubProbe:
@@ -47,3 +57,100 @@ def test_network_service_builds_output():
         "mac_address": "aa:bb:cc:dd:ee:ff",
         "interface": "en0",
     }
+
+
+ROUTE = """\
+Iface\tDestination\tGateway \tFlags\tRefCnt\tUse\tMetric\tMask\t\tMTU\tWindow\tIRTT
+wlan0\t00000000\t0101A8C0\t0003\t0\t0\t600\t00000000\t0\t0\t0
+eth0\t00000000\t0100000A\t0003\t0\t0\t100\t00000000\t0\t0\t0
+eth0\t0000000A\t00000000\t0001\t0\t0\t100\t00FFFFFF\t0\t0\t0
+"""
+
+IPV6_ROUTE = """\
+00000000000000000000000000000000 00 00000000000000000000000000000000 00 00000000000000000000000000000000 ffffffff 00000001 00000000 00200200       lo
+fd000000000000000000000000000000 40 00000000000000000000000000000000 00 00000000000000000000000000000000 00000100 00000001 00000000 00000001     eth0
+00000000000000000000000000000000 00 00000000000000000000000000000000 00 fd000000000000000000000000000001 00000400 00000001 00000000 00000003     eth0
+"""
+
+
+def test_parse_route_picks_lowest_metric_default():
+    route = parse_route(ROUTE)
+    assert route == DefaultRoute("eth0", "10.0.0.1", 100)
+    assert parse_route(ROUTE.splitlines()[0]) is None
+
+
+def test_parse_ipv6_route_skips_unreachable_default():
+    route = parse_ipv6_route(IPV6_ROUTE)
+    assert route.interface == "eth0"
+    assert route.gateway == "fd00::1"
+    assert route.family == socket.AF_INET6
+
+
+def test_route_table_falls_back_to_ipv6(tmp_path):
+    (tmp_path / "route").write_text(ROUTE.splitlines()[0] + "\\n")
+    (tmp_path / "ipv6_route").write_text(IPV6_ROUTE)
+    table = RouteTable(tmp_path / "route", tmp_path / "ipv6_route")
+    try:
+        assert table.default_route().interface == "eth0"
+        assert (
+            RouteTable(tmp_path / "missing", tmp_path / "gone").default_route() is None
+        )
+    finally:
+        table.close()
+
+
+def test_primary_ip_comes_from_the_route_interface(mocker):
+    interfaces = {"eth0": [SimpleNamespace(family=socket.AF_INET, address="10.0.0.5")]}
+    addrs = mocker.patch(
+        "host_inspector.network.infrastructure.probe.psutil.net_if_addrs",
+        side_effect=lambda: interfaces,
+    )
+    connect = mocker.patch("host_inspector.network.infrastructure.probe.socket.socket")
+    routes = SimpleNamespace(
+        default_route=lambda: DefaultRoute("eth0", "10.0.0.1", 100)
+    )
+    probe = SystemNetworkProbe(routes=routes)
+    invalidate("network")
+    try:
+        assert probe.snapshot().ip_address == "10.0.0.5"
+        assert probe.snapshot().ip_address == "10.0.0.5"
+        # One net_if_addrs per snapshot; the address lookup itself is cached.
+        assert addrs.call_count == 3  # noqa: PLR2004
+
+        # A new lease on the same route is picked up without waiting for a TTL.
+        interfaces["eth0"] = [
+            SimpleNamespace(family=socket.AF_INET, address="10.0.0.7")
+        ]
+        assert probe.snapshot().ip_address == "10.0.0.7"
+
+        routes.default_route = lambda: DefaultRoute("eth0", "10.0.0.254", 100)
+        assert probe.snapshot().ip_address == "10.0.0.7"
+        assert addrs.call_count == 7  # noqa: PLR2004
+        connect.assert_not_called()
+    finally:
+        invalidate("network")
+
+
+def test_primary_ip_without_default_route_is_offline_safe(mocker):
+    mocker.patch("host_inspector.network.infrastructure.probe.sys.platform", "linux")
+    mocker.patch(
+        "host_inspector.network.infrastructure.probe.psutil.net_if_stats",
+        return_value={
+            "lo": SimpleNamespace(isup=True),
+            "eth1": SimpleNamespace(isup=True),
+        },
+    )
+    mocker.patch(
+        "host_inspector.network.infrastructure.probe.psutil.net_if_addrs",
+        return_value={
+            "lo": [SimpleNamespace(family=socket.AF_INET, address="127.0.0.1")],
+            "eth1": [SimpleNamespace(family=socket.AF_INET, address="172.16.0.9")],
+        },
+    )
+    connect = mocker.patch("host_inspector.network.infrastructure.probe.socket.socket")
+    invalidate("network")
+    try:
+        assert _primary_ip_address(None, ()) == "172.16.0.9"
+        connect.assert_not_called()
+    finally:
+        invalidate("network")
@@ -0,0 +1,109 @@
+import asyncio
+import threading
+
+from host_inspector import get_pressure_info
+from host_inspector.pressure import aget_pressure_info
+from host_inspector.pressure.application.dtos import PressureLineDTO
+from host_inspector.pressure.application.dtos import PressureSnapshotDTO
+from host_inspector.pressure.application.dtos import ResourcePressureDTO
+from host_inspector.pressure.application.service import PressureService
+from host_inspector.pressure.domain import stall_rate
+from host_inspector.pressure.infrastructure.linux import ProcPressureProbe
+from host_inspector.pressure.infrastructure.linux import parse_pressure
+
+PSI_CPU = """some avg10=1.50 avg60=0.75 avg300=0.25 total=1000000
+full avg10=0.00 avg60=0.00 avg300=0.00 total=0
+"""
+
+
+def test_get_pressure_info():
+    info = get_pressure_info()
+    assert set(info["load_average"]) == {"1min", "5min", "15min"}
+    assert set(info["load_per_cpu"]) == {"1min", "5min", "15min"}
+
+
+def test_parse_pressure():
+    pressure = parse_pressure(PSI_CPU)
+    assert pressure.some == PressureLineDTO(
+        avg10=1.5, avg60=0.75, avg300=0.25, total=1_000_000
+    )
+    assert pressure.full.total == 0
+    assert parse_pressure("some avg10=1.0\n") == ResourcePressureDTO()
+
+
+def test_stall_rate():
+    assert stall_rate(0, 250_000, 1.0) == 25.0  # noqa: PLR2004
+    assert stall_rate(100, 50, 1.0) is None
+    assert stall_rate(0, 1, 0.0) is None
+
+
+class StubProbe:
+    def __init__(self, timestamps=(10.0, 12.0)):
+        self.totals = iter(range(1_000_000, 2_000_000, 100_000))
+        self.timestamps = iter(timestamps)
+
+    def snapshot(self) -> PressureSnapshotDTO:
+        line = PressureLineDTO(
+            avg10=1.0, avg60=2.0, avg300=3.0, total=next(self.totals)
+        )
+        return PressureSnapshotDTO(
+            load_average=(4.0, 2.0, 1.0),
+            logical_cpus=4,
+            timestamp=next(self.timestamps),
+            resources={"io": ResourcePressureDTO(some=line)},
+        )
+
+
+def test_pressure_service_turns_totals_into_rates():
+    service = PressureService(probe=StubProbe())
+
+    first = service.get_pressure_info()
+    second = service.get_pressure_info()
+
+    assert first["load_average"] == {"1min": 4.0, "5min": 2.0, "15min": 1.0}
+    assert first["load_per_cpu"] == {"1min": 1.0, "5min": 0.5, "15min": 0.25}
+    assert first["io"]["some"]["stall_rate"] is None
+    assert second["io"]["some"]["stall_rate"] == 5.0  # noqa: PLR2004
+    assert "full" not in second["io"]
+
+
+def test_pressure_rates_need_a_minimum_interval():
+    service = PressureService(probe=StubProbe(timestamps=(10.0, 10.01, 11.5, 11.6)))
+
+    rates = [service.get_pressure_info()["io"]["some"]["stall_rate"] for _ in range(4)]
+
+    # The second call is too close to the first; the third and fourth both
+    # measure against the newest snapshot at least a second old (10.01).
+    assert rates[:2] == [None, None]
+    assert rates[2] == round(100_000 / 1.49 / 10_000, 2)
+    assert rates[3] == round(200_000 / 1.59 / 10_000, 2)
+
+
+def test_aget_pressure_info_reads_procfs_off_the_event_loop(mocker):
+    threads = []
+    mocker.patch(
+        "host_inspector.pressure.get_pressure_info",
+        side_effect=lambda: threads.append(threading.current_thread()) or {},
+    )
+
+    assert asyncio.run(aget_pressure_info()) == {}
+    assert threads
+    assert threads[0] is not threading.main_thread()
+
+
+def test_proc_probe_rereads_through_open_handles(tmp_path):
+    (tmp_path / "cpu").write_text(PSI_CPU)
+    loadavg = tmp_path / "loadavg"
+    loadavg.write_text("0.50 0.25 0.10 1/100 1234\n")
+    probe = ProcPressureProbe(root=tmp_path, loadavg_path=loadavg)
+    try:
+        first = probe.snapshot()
+        assert first.load_average == (0.5, 0.25, 0.1)
+        assert set(first.resources) == {"cpu"}
+
+        # Rewrite in place (same inode), the way procfs content changes.
+        with (tmp_path / "cpu").open("r+") as handle:
+            handle.write(PSI_CPU.replace("total=1000000", "total=2000000"))
+        assert probe.snapshot().resources["cpu"].some.total == 2_000_000  # noqa: PLR2004
+    finally:
+        probe.close()
@@ -0,0 +1,136 @@
+from collections import namedtuple
+from types import SimpleNamespace
+
+import pytest
+
+from host_inspector.processes import get_top_processes
+from host_inspector.processes.application.service import ProcessTable
+from host_inspector.processes.infrastructure.probe import PsutilProcessProbe
+
+CPUTimes = namedtuple("CPUTimes", ["user", "system"])  # noqa: PYI024
+MemInfo = namedtuple("MemInfo", ["rss"])  # noqa: PYI024
+IOCounters = namedtuple("IOCounters", ["read_bytes", "write_bytes"])  # noqa: PYI024
+
+
+class FakeProcesses:
+    def __init__(self):
+        self.now = 0.0
+        self.procs: dict[int, dict] = {}
+        self.calls = []
+
+    def clock(self) -> float:
+        return self.now
+
+    def set(self, pid, *, cpu=0.0, rss=0, io=0, created=1.0):
+        self.procs[pid] = {
+            "name": f"proc{pid}",
+            "username": "root",
+            "create_time": created,
+            "cpu_times": CPUTimes(user=cpu, system=0.0),
+            "memory_info": MemInfo(rss=rss),
+            "io_counters": IOCounters(read_bytes=io, write_bytes=0),
+        }
+
+    def process_iter(self, attrs, ad_value):
+        self.calls.append((tuple(attrs), ad_value))
+        return [SimpleNamespace(pid=pid, info=info) for pid, info in self.procs.items()]
+
+
+def _table(fake: FakeProcesses) -> ProcessTable:
+    probe = PsutilProcessProbe(process_iter=fake.process_iter)
+    return ProcessTable(probe=probe, clock=fake.clock)
+
+
+def test_top_by_cpu_uses_deltas_against_previous_pass():
+    fake = FakeProcesses()
+    table = _table(fake)
+    fake.set(1, cpu=100.0)
+    fake.set(2, cpu=5.0)
+    fake.set(3, cpu=50.0)
+    table.sample()
+
+    fake.now = 2.0
+    fake.set(1, cpu=100.5)  # 0.5 s over 2 s
+    fake.set(2, cpu=7.0)  # 2 s over 2 s
+    fake.set(3, cpu=51.0)  # 1 s over 2 s
+    top = table.top(n=2, by="cpu")
+
+    assert [p["pid"] for p in top] == [2, 3]
+    assert top[0]["cpu_percent"] == 100.0  # noqa: PLR2004
+    assert top[1]["cpu_percent"] == 50.0  # noqa: PLR2004
+    assert len(fake.calls) == 2  # noqa: PLR2004
+    assert {"cpu_times", "memory_info", "io_counters"} <= set(fake.calls[0][0])
+
+
+def test_top_by_rss_and_io():
+    fake = FakeProcesses()
+    table = _table(fake)
+    for pid, rss in ((1, 10), (2, 30), (3, 20)):
+        fake.set(pid, rss=rss, io=1000)
+    table.sample()
+
+    fake.now = 1.0
+    fake.set(3, rss=20, io=3000)
+    assert [p["pid"] for p in table.top(n=2, by="rss")] == [2, 3]
+    # rss needs no baseline pass
+    assert len(fake.calls) == 2  # noqa: PLR2004
+
+    # The rss ranking did not become the baseline: io is measured since 0.
+    fake.now = 2.0
+    fake.set(3, rss=20, io=5000)
+    top = table.top(n=1, by="io")
+    assert top[0]["pid"] == 3  # noqa: PLR2004
+    assert top[0]["io_bps"] == 2000.0  # noqa: PLR2004
+
+
+def test_reused_pid_has_no_baseline():
+    fake = FakeProcesses()
+    table = _table(fake)
+    fake.set(1, cpu=10.0, created=1.0)
+    table.sample()
+
+    fake.now = 1.0
+    fake.set(1, cpu=50.0, created=5.0)
+    assert table.sample().row(0)["cpu_percent"] == 0.0
+
+
+def test_first_cpu_ranking_takes_a_baseline(mocker):
+    fake = FakeProcesses()
+    sleep = mocker.patch("host_inspector.processes.application.service.time.sleep")
+    fake.set(1, cpu=1.0)
+    _table(fake).top(by="cpu", interval=0.25)
+
+    sleep.assert_called_once_with(0.25)
+    assert len(fake.calls) == 2  # noqa: PLR2004
+
+
+def test_ranking_soon_after_the_last_waits_out_the_interval(mocker):
+    fake = FakeProcesses()
+    table = _table(fake)
+    fake.set(1, cpu=1.0)
+    table.sample()
+
+    def advance(seconds):
+        fake.now += seconds
+
+    sleep = mocker.patch(
+        "host_inspector.processes.application.service.time.sleep", side_effect=advance
+    )
+    fake.now = 0.1
+    fake.set(1, cpu=1.25)
+    top = table.top(by="cpu", interval=0.5)
+
+    sleep.assert_called_once()
+    assert sleep.call_args.args[0] == pytest.approx(0.4)
+    assert top[0]["cpu_percent"] == 50.0  # noqa: PLR2004
+
+
+def test_unknown_sort_key():
+    with pytest.raises(ValueError, match="Unknown sort key"):
+        _table(FakeProcesses()).top(by="threads")
+
+
+def test_get_top_processes_shape():
+    top = get_top_processes(n=3, by="rss")
+    assert 0 < len(top) <= 3  # noqa: PLR2004
+    assert set(top[0]) == {"pid", "name", "username", "cpu_percent", "rss", "io_bps"}
@@ -0,0 +1,51 @@
+import pytest
+
+from host_inspector import collect
+
+
+def test_collect_sections_and_fields(mocker):
+    mocker.patch("host_inspector.memory.get_mem_info", return_value={"total": 1})
+    gpu = mocker.patch("host_inspector.device.infrastructure.probe.get_gpu_info")
+
+    info = collect(sections=["mem"], fields=["cpu.count", "device.os"])
+
+    assert set(info) == {"mem", "cpu", "device"}
+    assert info["mem"] == {"total": 1}
+    assert set(info["cpu"]) == {"count"}
+    assert set(info["device"]) == {"os"}
+    gpu.assert_not_called()
+
+
+def test_collect_filters_sections_without_projection(mocker):
+    mocker.patch(
+        "host_inspector.uptime.get_uptime_info",
+        return_value={"uptime": "5 minutes", "seconds": 300},
+    )
+    assert collect(fields=["uptime.seconds"]) == {"uptime": {"seconds": 300}}
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({}, "at least one"),
+        ({"sections": ["nope"]}, "Unknown section"),
+        ({"fields": ["cpu"]}, "<section>.<key>"),
+        ({"fields": ["cpu.cores"]}, "Unknown CPU field"),
+    ],
+)
+def test_collect_rejects_bad_requests(kwargs, match):
+    with pytest.raises(ValueError, match=match):
+        collect(**kwargs)
+
+
+def test_collect_takes_a_single_name_as_a_string(mocker):
+    mocker.patch("host_inspector.memory.get_mem_info", return_value={"total": 1})
+    mocker.patch(
+        "host_inspector.uptime.get_uptime_info",
+        return_value={"uptime": "5 minutes", "seconds": 300},
+    )
+
+    assert collect(sections="mem", fields="uptime.seconds") == {
+        "mem": {"total": 1},
+        "uptime": {"seconds": 300},
+    }
@@ -0,0 +1,104 @@
+import importlib
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import host_inspector
+
+API_DIR = Path(__file__).resolve().parents[1] / "api"
+
+# `import host_inspector` must stay cheap: it may not pull in any subsystem
+# (or psutil with them) until one of them is used.
+IMPORTED_MODULES = """
+import sys
+import host_inspector
+loaded = sorted(m for m in sys.modules if m.startswith("host_inspector."))
+print(",".join(loaded), "psutil" in sys.modules)
+"""
+
+# The eager package took ~170 ms and ~14 MiB; the lazy one ~30 ms, ~3 MiB
+# and ~40 new modules. The ceilings leave room for slow CI runners: the
+# module count does not depend on load, and time and RSS are the best of a
+# few fresh interpreters.
+IMPORT_MODULE_BUDGET = 80
+IMPORT_RSS_BUDGET_KIB = 8 * 1024
+IMPORT_TIME_BUDGET_US = 250_000
+IMPORT_RUNS = 3
+
+IMPORT_COST = """
+import resource, sys
+before = set(sys.modules)
+rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+import host_inspector
+rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+scale = 1024 if sys.platform == "darwin" else 1  # ru_maxrss is bytes on macOS
+print(len(set(sys.modules) - before), (rss_after - rss_before) // scale)
+"""
+
+
+def _run_fresh(script: str, *options: str) -> subprocess.CompletedProcess:
+    return subprocess.run(  # noqa: S603
+        [sys.executable, *options, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(Path(host_inspector.__file__).parents[1])},
+    )
+
+
+def _import_time_us() -> int:
+    """Return the cumulative ``-X importtime`` figure for ``host_inspector``."""
+    stderr = _run_fresh("import host_inspector", "-X", "importtime").stderr
+    for line in stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == "host_inspector":
+            return int(cumulative)
+    raise AssertionError(stderr)
+
+
+@pytest.mark.parametrize("contract", ["public_api.json", "public_api.contract.json"])
+def test_public_api_matches_contract(contract):
+    modules = json.loads((API_DIR / contract).read_text())["modules"]
+    for module_name, names in modules.items():
+        module = importlib.import_module(module_name)
+        for name in names:
+            assert name in module.__all__, f"{module_name}.{name} not exported"
+            assert callable(getattr(module, name))
+    assert sorted(host_inspector.__all__) == sorted(modules["host_inspector"])
+
+
+def test_public_api_is_listed_by_dir():
+    assert set(host_inspector.__all__) <= set(dir(host_inspector))
+    with pytest.raises(AttributeError):
+        host_inspector.get_nothing_info  # noqa: B018
+
+
+def test_import_is_lazy():
+    loaded, psutil_loaded = _run_fresh(IMPORTED_MODULES).stdout.rstrip().split(" ")
+
+    assert loaded == ""
+    assert psutil_loaded == "False"
+
+
+def test_subpackages_are_attributes_after_plain_import():
+    script = "import host_inspector\nprint(host_inspector.memory.__name__)"
+
+    assert _run_fresh(script).stdout.strip() == "host_inspector.memory"
+    assert host_inspector.cpu.get_cpu_info is host_inspector.get_cpu_info
+    assert "disk" in dir(host_inspector)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="resource is POSIX-only")
+def test_import_stays_within_budget():
+    costs = [_run_fresh(IMPORT_COST).stdout.split() for _ in range(IMPORT_RUNS)]
+    modules = min(int(count) for count, _ in costs)
+    rss_kib = min(int(rss) for _, rss in costs)
+    import_us = min(_import_time_us() for _ in range(IMPORT_RUNS))
+
+    assert modules <= IMPORT_MODULE_BUDGET
+    assert rss_kib <= IMPORT_RSS_BUDGET_KIB
+    assert import_us <= IMPORT_TIME_BUDGET_US
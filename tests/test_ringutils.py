@@ -0,0 +1,48 @@
+import pytest
+
+from host_inspector.utils.ringutils import RingBuffer
+from host_inspector.utils.ringutils import percentile
+
+
+def test_ring_buffer_overwrites_oldest():
+    ring = RingBuffer(3)
+    for second in range(5):
+        ring.append(float(second), second * 10.0)
+
+    assert len(ring) == 3  # noqa: PLR2004
+    assert ring.since(0.0) == [20.0, 30.0, 40.0]
+    assert ring.since(3.0) == [30.0, 40.0]
+
+
+def test_ring_buffer_append_returns_evicted_sample():
+    ring = RingBuffer(2)
+    assert ring.append(1.0, 10.0) is None
+    assert ring.append(2.0, 20.0) is None
+    assert ring.append(3.0, 30.0) == (1.0, 10.0)
+    assert ring.items() == [(2.0, 20.0), (3.0, 30.0)]
+
+
+def test_ring_buffer_window_stats():
+    ring = RingBuffer(100)
+    for value in range(1, 101):
+        ring.append(float(value), float(value))
+
+    stats = ring.stats(start=1.0)
+    assert stats.to_dict() == {
+        "count": 100,
+        "min": 1.0,
+        "mean": 50.5,
+        "max": 100.0,
+        "p95": 95.0,
+    }
+    assert ring.stats(start=1000.0) is None
+
+
+def test_ring_buffer_rejects_empty_capacity():
+    with pytest.raises(ValueError, match="capacity"):
+        RingBuffer(0)
+
+
+def test_percentile_nearest_rank():
+    assert percentile([1.0], 95) == 1.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.0  # noqa: PLR2004
@@ -0,0 +1,123 @@
+import threading
+import time
+from collections import namedtuple
+
+from host_inspector.sampling.application.dtos import MetricCountersDTO
+from host_inspector.sampling.application.service import MetricSampler
+from host_inspector.sampling.infrastructure import build_metric_sampler
+
+CPUTimes = namedtuple("CPUTimes", ["user", "system", "idle"])  # noqa: PYI024
+
+
+class FakeHost:
+    def __init__(self):
+        self.now = 0.0
+        self.tick = 0
+
+    def clock(self) -> float:
+        return self.now
+
+    def snapshot(self) -> MetricCountersDTO:
+        self.tick += 1
+        return MetricCountersDTO(
+            cpu_times=CPUTimes(user=self.tick * 1.0, system=0.0, idle=self.tick * 3.0),
+            memory_percent=40.0 + self.tick,
+            disk_read_bytes=self.tick * 1000,
+            net_sent_bytes=self.tick * 10,
+        )
+
+
+def _sampler(host: FakeHost, **kwargs) -> MetricSampler:
+    return MetricSampler(probe=host, clock=host.clock, **kwargs)
+
+
+def test_metric_sampler_windowed_stats_and_rates():
+    host = FakeHost()
+    sampler = _sampler(host, interval=1.0, retention=10.0)
+    for _ in range(5):
+        sampler.sample()
+        host.now += 1.0
+
+    stats = sampler.stats(window=60.0)
+    assert stats["mem_percent"]["count"] == 5  # noqa: PLR2004
+    assert stats["mem_percent"]["max"] == 45.0  # noqa: PLR2004
+    assert stats["cpu_percent"]["mean"] == 25.0  # noqa: PLR2004
+    assert stats["disk_read_bps"]["p95"] == 1000.0  # noqa: PLR2004
+    assert stats["net_sent_bps"]["min"] == 10.0  # noqa: PLR2004
+    assert stats["disk_write_bps"]["max"] == 0.0
+
+
+def test_metric_sampler_memory_is_bounded():
+    host = FakeHost()
+    sampler = _sampler(host, interval=1.0, retention=3.0)
+    for _ in range(1000):
+        sampler.sample()
+        host.now += 1.0
+
+    assert sampler.stats(window=1e9)["mem_percent"]["count"] == 3  # noqa: PLR2004
+    assert sampler.stats(window=1.5)["mem_percent"]["count"] == 1
+
+
+def test_metric_sampler_background_thread():
+    sampler = build_metric_sampler()
+    sampler.start(interval=0.01, retention=1.0)
+    try:
+        deadline = time.monotonic() + 2.0
+        while sampler.stats()["cpu_percent"] is None and time.monotonic() < deadline:
+            time.sleep(0.005)
+        assert sampler.running
+    finally:
+        sampler.stop()
+    assert not sampler.running
+    assert sampler.stats()["cpu_percent"] is not None
+
+
+def _wait_for(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+def test_metric_sampler_restart_does_not_rate_across_the_gap():
+    host = FakeHost()
+    sampler = _sampler(host, interval=60.0)
+    sampler.sample()
+    host.now += 100.0
+    host.tick += 1000
+
+    sampler.start()
+    try:
+        _wait_for(lambda: sampler.stats(window=1e9)["mem_percent"]["count"] == 2)  # noqa: PLR2004
+    finally:
+        sampler.stop()
+
+    assert sampler.stats(window=1e9)["disk_read_bps"] is None
+
+
+def test_metric_sampler_stop_that_times_out_allows_restart():
+    host = FakeHost()
+    release = threading.Event()
+    snapshot = host.snapshot
+
+    def slow_snapshot() -> MetricCountersDTO:
+        if host.tick == 0:
+            release.wait(2.0)
+        return snapshot()
+
+    host.snapshot = slow_snapshot
+    sampler = _sampler(host, interval=0.01)
+    sampler.start()
+    stuck = sampler._thread  # noqa: SLF001
+    sampler.stop(timeout=0.05)
+    assert stuck.is_alive()
+
+    sampler.start()
+    try:
+        assert sampler.running
+        release.set()
+        stuck.join(1.0)
+        # The old thread saw its own stop event, not the new thread's.
+        assert not stuck.is_alive()
+        assert sampler.running
+    finally:
+        sampler.stop()
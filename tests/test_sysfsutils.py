@@ -0,0 +1,89 @@
+from host_inspector.utils import sysfsutils
+from host_inspector.utils.sysfsutils import OpenProcFiles
+from host_inspector.utils.sysfsutils import parse_cpuinfo
+from host_inspector.utils.sysfsutils import parse_os_release
+from host_inspector.utils.sysfsutils import read_devicetree
+
+OS_RELEASE = """PRETTY_NAME="Debian GNU/Linux 12 (bookworm)"
+NAME="Debian GNU/Linux"
+VERSION_ID="12"
+# comment
+VERSION_CODENAME=bookworm
+ID=debian
+"""
+
+X86_CPUINFO = """processor\t: 0
+vendor_id\t: GenuineIntel
+model name\t: Intel(R) Core(TM) i7-8700 CPU @ 3.20GHz
+
+processor\t: 1
+vendor_id\t: GenuineIntel
+model name\t: Intel(R) Core(TM) i7-8700 CPU @ 3.20GHz
+"""
+
+PI_CPUINFO = """processor\t: 0
+BogoMIPS\t: 108.00
+CPU implementer\t: 0x41
+CPU part\t: 0xd08
+
+processor\t: 1
+BogoMIPS\t: 108.00
+CPU implementer\t: 0x41
+CPU part\t: 0xd08
+
+Hardware\t: BCM2835
+Revision\t: c03114
+Serial\t\t: 100000002d3a5b1c
+Model\t\t: Raspberry Pi 4 Model B Rev 1.4
+"""
+
+
+def test_parse_os_release():
+    release = parse_os_release(OS_RELEASE)
+    assert release["NAME"] == "Debian GNU/Linux"
+    assert release["PRETTY_NAME"] == "Debian GNU/Linux 12 (bookworm)"
+    assert release["VERSION_ID"] == "12"
+    assert release["VERSION_CODENAME"] == "bookworm"
+    assert "# comment" not in release
+
+
+def test_parse_cpuinfo_x86():
+    info = parse_cpuinfo(X86_CPUINFO)
+    expected_processors = 2
+    assert len(info.processors) == expected_processors
+    assert info.model_name == "Intel(R) Core(TM) i7-8700 CPU @ 3.20GHz"
+    assert info.serial is None
+
+
+def test_parse_cpuinfo_raspberry_pi():
+    info = parse_cpuinfo(PI_CPUINFO)
+    expected_processors = 2
+    assert len(info.processors) == expected_processors
+    assert info.model_name == "Cortex-A72"
+    assert info.serial == "100000002d3a5b1c"
+    assert info.system["Model"] == "Raspberry Pi 4 Model B Rev 1.4"
+
+
+def test_read_devicetree_splits_nul_strings(tmp_path, monkeypatch):
+    (tmp_path / "gpu").mkdir()
+    (tmp_path / "model").write_bytes(b"Raspberry Pi 4 Model B Rev 1.4\x00")
+    (tmp_path / "gpu" / "compatible").write_bytes(b"brcm,bcm2711-vc5\x00brcm,v3d\x00")
+    monkeypatch.setattr(sysfsutils, "DEVICETREE_ROOTS", (tmp_path,))
+
+    assert read_devicetree("model") == ["Raspberry Pi 4 Model B Rev 1.4"]
+    assert read_devicetree("gpu/compatible") == ["brcm,bcm2711-vc5", "brcm,v3d"]
+    assert read_devicetree("missing") is None
+
+
+def test_open_proc_files_rereads_in_place_and_skips_missing(tmp_path):
+    path = tmp_path / "route"
+    path.write_text("x" * 5000)
+    files = OpenProcFiles()
+    try:
+        assert files.read(path) == "x" * 5000
+        with path.open("r+") as handle:
+            handle.write("y")
+        assert files.read(path) == "y" + "x" * 4999
+        assert files.read(tmp_path / "missing") is None
+    finally:
+        files.close()